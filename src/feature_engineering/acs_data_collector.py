@@ -8,16 +8,31 @@ Author: Multi-State Dispensary Model - Phase 2
 Date: October 2025
 """
 
+import asyncio
 import os
+import warnings
 import requests
 import pandas as pd
-import json
-import time
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+try:
+    from ..instrumentation import profiler
+    from .census_cache import CensusCache, CACHE_FILENAME
+    from .checkpoint_log import CheckpointLog, checkpoint_log_path, write_csv_atomic
+    from .census_http import CensusSession, RateLimitedClient, Transport, run_sync
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from instrumentation import profiler
+    from census_cache import CensusCache, CACHE_FILENAME
+    from checkpoint_log import CheckpointLog, checkpoint_log_path, write_csv_atomic
+    from census_http import CensusSession, RateLimitedClient, Transport, run_sync
+
 # Load environment variables
 load_dotenv()
 
@@ -39,6 +54,7 @@ class ACSDataCollector:
     Features:
     - Secure API key management (environment variables)
     - Batch processing with rate limiting
+    - Bulk mode: one request per county instead of one per tract
     - Caching to minimize API calls
     - Comprehensive error handling
     - Missing value detection and flagging
@@ -60,12 +76,34 @@ class ACSDataCollector:
     # Census missing value codes
     MISSING_VALUE_CODES = [-666666666, -888888888, -999999999]
 
-    def __init__(self, cache_dir: str = "data/census/cache"):
+    # ACS release year; cached results from other releases are refetched
+    ACS_YEAR = 2023
+
+    STATE_FIPS = {'FL': '12', 'PA': '42'}
+
+    # Cache key listing the tract GEOIDs of a fully fetched county
+    COUNTY_KEY = 'county:{state_fips}{county_fips}'
+
+    def __init__(
+        self,
+        cache_dir: str = "data/census/cache",
+        max_cache_entries: Optional[int] = None,
+        transport: Optional[Transport] = None,
+        requests_per_second: float = 5.0,
+        session: Optional[CensusSession] = None
+    ):
         """
         Initialize ACS Data Collector.
 
         Args:
             cache_dir: Directory for caching ACS results
+            max_cache_entries: Size cap for cached results (None = unbounded)
+            transport: Request function (url, params, timeout) -> TransportResponse
+                for a private session (default: the shared session)
+            requests_per_second: Maximum ACS request rate across all callers
+            session: Connection pool, concurrency limit and retry budget to
+                share (default: the process-wide census_http.shared_session(),
+                also used by CensusTractIdentifier)
 
         Raises:
             ValueError: If CENSUS_API_KEY environment variable not set
@@ -78,40 +116,24 @@ class ACSDataCollector:
                 "Set it with: export CENSUS_API_KEY=your_key_here"
             )
 
-        self.base_url = "https://api.census.gov/data/2023/acs/acs5"
-        self.session = requests.Session()  # Connection pooling
+        self.base_url = f"https://api.census.gov/data/{self.ACS_YEAR}/acs/acs5"
+        self.client = RateLimitedClient(transport, requests_per_second=requests_per_second, session=session)
 
-        # Set up caching
+        # Set up caching (shared SQLite cache keyed by ACS release and variable set;
+        # migrates the old JSON cache once)
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "acs_cache.json"
-        self.cache = self._load_cache()
+        self.cache_file = self.cache_dir / CACHE_FILENAME
+        self.cache = CensusCache(
+            self.cache_file, 'acs',
+            vintage=f"acs5-{self.ACS_YEAR}:{','.join(self.ACS_VARIABLES)}",
+            max_entries=max_cache_entries
+        )
+        self.cache.import_json(self.cache_dir / "acs_cache.json")
 
         logger.info(f"ACSDataCollector initialized with cache at {self.cache_file}")
         logger.info(f"API key configured (ends with ...{self.api_key[-4:]})")
 
-    def _load_cache(self) -> Dict:
-        """Load cached ACS results from disk."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    cache = json.load(f)
-                logger.info(f"Loaded {len(cache)} cached ACS results")
-                return cache
-            except Exception as e:
-                logger.warning(f"Failed to load cache: {e}")
-                return {}
-        return {}
-
-    def _save_cache(self) -> None:
-        """Save cache to disk."""
-        try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
-            logger.debug(f"Saved cache with {len(self.cache)} entries")
-        except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
-
     def _clean_value(self, value: any) -> Optional[float]:
         """
         Clean ACS value, converting missing codes to None.
@@ -166,13 +188,43 @@ class ACSDataCollector:
                 'data_complete': bool
             }
         """
-        # Create GEOID for caching
-        geoid = f"{state_fips}{county_fips}{tract_fips}"
+        # Cache hits never touch the event loop
+        cached = self._cached_tract(f"{state_fips}{county_fips}{tract_fips}")
+        if cached is not None:
+            return cached
+        return run_sync(self._fetch_tract(state_fips, county_fips, tract_fips, max_retries))
 
-        # Check cache
-        if geoid in self.cache:
+    async def aget_tract_demographics(
+        self,
+        state_fips: str,
+        county_fips: str,
+        tract_fips: str,
+        max_retries: int = 3
+    ) -> Dict:
+        """
+        Coroutine version of get_tract_demographics().
+
+        Many calls can be awaited concurrently; they share the client's rate
+        limit and the session's concurrency limit and retry budget.
+        """
+        cached = self._cached_tract(f"{state_fips}{county_fips}{tract_fips}")
+        if cached is not None:
+            return cached
+        return await self._fetch_tract(state_fips, county_fips, tract_fips, max_retries)
+
+    def _cached_tract(self, geoid: str) -> Optional[Dict]:
+        """Cached result for a tract, if any."""
+        cached = self.cache.get(geoid)
+        if cached is not None:
             logger.debug(f"Cache hit for GEOID {geoid}")
-            return self.cache[geoid]
+            profiler.count('acs_cache.hit')
+            return cached
+        profiler.count('acs_cache.miss')
+        return None
+
+    async def _fetch_tract(self, state_fips: str, county_fips: str, tract_fips: str, max_retries: int) -> Dict:
+        """Request one tract from the API and cache the result."""
+        geoid = f"{state_fips}{county_fips}{tract_fips}"
 
         # Prepare API request
         variables = ','.join(self.ACS_VARIABLES.keys())
@@ -183,61 +235,247 @@ class ACSDataCollector:
             'key': self.api_key
         }
 
-        # Retry logic with exponential backoff
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Fetching ACS data for GEOID {geoid} (attempt {attempt + 1}/{max_retries})")
+        try:
+            logger.debug(f"Fetching ACS data for GEOID {geoid}")
 
-                response = self.session.get(
-                    self.base_url,
-                    params=params,
-                    timeout=10
-                )
-                response.raise_for_status()
+            # Rate limiting and retries (timeouts, 429, 5xx) happen in the client
+            with profiler.timer('acs_request'):
+                response = await self.client.aget(self.base_url, params, max_retries=max_retries)
 
-                data = response.json()
+            if response.status in (204, 404):
+                # Tract doesn't exist in ACS data
+                logger.warning(f"Tract {geoid} not found in ACS data")
+                result = self._create_empty_result(geoid, "Tract not found in ACS")
+                self.cache[geoid] = result
+                return result
+            if response.status == 429:
+                return self._create_empty_result(geoid, "Rate limit exceeded")
+            if response.status != 200:
+                logger.error(f"HTTP error {response.status} for {geoid}")
+                return self._create_empty_result(geoid, f"HTTP {response.status}")
 
-                # Parse response
-                result = self._parse_acs_response(data, geoid)
+            # Parse response
+            result = self._parse_acs_response(response.payload, geoid)
 
-                # Cache successful results
-                if result['success']:
-                    self.cache[geoid] = result
-                    self._save_cache()
+            # Cache successful results
+            if result['success']:
+                self.cache[geoid] = result
 
-                return result
+            return result
 
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    # Tract doesn't exist in ACS data
-                    logger.warning(f"Tract {geoid} not found in ACS data")
-                    result = self._create_empty_result(geoid, "Tract not found in ACS")
-                    self.cache[geoid] = result
-                    self._save_cache()
-                    return result
-                elif e.response.status_code == 429:
-                    # Rate limited
-                    logger.warning(f"Rate limited on attempt {attempt + 1}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** (attempt + 1))  # Exponential backoff
-                    else:
-                        return self._create_empty_result(geoid, "Rate limit exceeded")
-                else:
-                    logger.error(f"HTTP error {e.response.status_code} for {geoid}")
-                    return self._create_empty_result(geoid, f"HTTP {e.response.status_code}")
+        except requests.exceptions.Timeout:
+            return self._create_empty_result(geoid, "API timeout")
 
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout on attempt {attempt + 1} for {geoid}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    return self._create_empty_result(geoid, "API timeout")
+        except Exception as e:
+            logger.error(f"Error fetching ACS data for {geoid}: {e}")
+            return self._create_empty_result(geoid, str(e))
+
+    def get_county_demographics(
+        self,
+        state_fips: str,
+        county_fips: str,
+        max_retries: int = 3
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        Fetch demographic variables for every tract in a county in one request.
+
+        Every tract in the response is cached, along with the county's list
+        of tracts, so repeated calls and later get_tract_demographics()
+        calls for the county make no requests.
+
+        Args:
+            state_fips: 2-digit state FIPS code
+            county_fips: 3-digit county FIPS code
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            dict: GEOID -> result (same format as get_tract_demographics()),
+                or None if the request failed
+        """
+        cached = self._cached_county(state_fips, county_fips)
+        if cached is not None:
+            return cached
+        return run_sync(self._fetch_county(state_fips, county_fips, max_retries))
+
+    async def aget_county_demographics(
+        self,
+        state_fips: str,
+        county_fips: str,
+        max_retries: int = 3
+    ) -> Optional[Dict[str, Dict]]:
+        """Coroutine version of get_county_demographics()."""
+        cached = self._cached_county(state_fips, county_fips)
+        if cached is not None:
+            return cached
+        return await self._fetch_county(state_fips, county_fips, max_retries)
+
+    def _cached_county(self, state_fips: str, county_fips: str) -> Optional[Dict[str, Dict]]:
+        """Cached results for every tract of a fully fetched county, if all are still cached."""
+        geoids = self.cache.get(self.COUNTY_KEY.format(state_fips=state_fips, county_fips=county_fips))
+        if geoids is not None:
+            results = {geoid: self.cache.get(geoid) for geoid in geoids}
+            if all(result is not None for result in results.values()):
+                profiler.count('acs_cache.county_hit')
+                return results
+        profiler.count('acs_cache.county_miss')
+        return None
+
+    async def _fetch_county(self, state_fips: str, county_fips: str, max_retries: int) -> Optional[Dict[str, Dict]]:
+        """Request every tract of a county and cache the results."""
+        county_key = self.COUNTY_KEY.format(state_fips=state_fips, county_fips=county_fips)
+        params = {
+            'get': ','.join(self.ACS_VARIABLES.keys()),
+            'for': 'tract:*',
+            'in': f'state:{state_fips} county:{county_fips}',
+            'key': self.api_key
+        }
+
+        try:
+            with profiler.timer('acs_county_request'):
+                response = await self.client.aget(self.base_url, params, max_retries=max_retries, bulk=True)
+        except requests.exceptions.Timeout:
+            logger.error(f"Timeout fetching ACS data for county {state_fips}{county_fips}")
+            return None
+        except Exception as e:
+            logger.error(f"Error fetching ACS data for county {state_fips}{county_fips}: {e}")
+            return None
+
+        if response.status not in (200, 204):
+            logger.error(f"HTTP error {response.status} for county {state_fips}{county_fips}")
+            return None
+
+        # 204 No Content: the county has no tracts with ACS data
+        results = self._parse_county_response(response.payload) if response.status == 200 else {}
+        self.cache.set_many(list(results.items()) + [(county_key, sorted(results))])
+        logger.debug(f"Cached ACS data for {len(results)} tracts in county {state_fips}{county_fips}")
+        return results
+
+    def _parse_county_response(self, data: List) -> Dict[str, Dict]:
+        """
+        Parse a for=tract:* ACS response (header row, then one row per tract).
+
+        Args:
+            data: JSON response from API (list of lists)
+
+        Returns:
+            dict: GEOID -> parsed result
+        """
+        if not data or len(data) < 2:
+            return {}
+
+        headers = data[0]
+        state_idx, county_idx, tract_idx = (headers.index(c) for c in ('state', 'county', 'tract'))
+
+        results = {}
+        for values in data[1:]:
+            geoid = f"{values[state_idx]}{values[county_idx]}{values[tract_idx]}"
+            results[geoid] = self._parse_acs_row(headers, values, geoid, warn=False)
+
+        incomplete = sum(not result['data_complete'] for result in results.values())
+        if incomplete:
+            logger.info(f"{incomplete}/{len(results)} tracts have incomplete ACS data")
+        return results
+
+    def warm_state(self, state: str, max_workers: int = 4) -> int:
+        """
+        Pre-populate the cache with every tract in a state, one request per county.
+
+        Counties already fetched (by an earlier warm_state() or bulk batch)
+        are served from the cache.
+
+        Args:
+            state: State code ('FL', 'PA') or 2-digit FIPS code
+            max_workers: Counties fetched concurrently (the client's rate limit
+                still applies)
+
+        Returns:
+            int: Number of tracts now cached for the state
+        """
+        return run_sync(self.awarm_state(state, max_workers))
+
+    async def awarm_state(self, state: str, max_workers: int = 4) -> int:
+        """Coroutine version of warm_state()."""
+        state_fips = self.STATE_FIPS.get(state.upper().strip(), state)
+
+        params = {'get': 'NAME', 'for': 'county:*', 'in': f'state:{state_fips}', 'key': self.api_key}
+        try:
+            response = await self.client.aget(self.base_url, params, bulk=True)
+            if response.status != 200:
+                logger.error(f"HTTP error {response.status} listing counties for state {state_fips}")
+                return 0
+
+            headers = response.payload[0]
+            county_idx = headers.index('county')
+            counties = sorted(row[county_idx] for row in response.payload[1:])
+        except requests.exceptions.Timeout:
+            logger.error(f"Timeout listing counties for state {state_fips}")
+            return 0
+        except Exception as e:
+            logger.error(f"Error listing counties for state {state_fips}: {e}")
+            return 0
+        logger.info(f"Warming ACS cache for {len(counties)} counties in state {state_fips}")
 
-            except Exception as e:
-                logger.error(f"Error fetching ACS data for {geoid}: {e}")
-                return self._create_empty_result(geoid, str(e))
+        results = await self._gather_counties([(state_fips, county) for county in counties], max_workers)
 
-        return self._create_empty_result(geoid, "Max retries exceeded")
+        failed = sum(result is None for result in results)
+        total = sum(len(result) for result in results if result is not None)
+        logger.info(f"ACS cache warm for state {state_fips}: {total} tracts"
+                    + (f" ({failed} counties failed)" if failed else ""))
+        return total
+
+    async def _gather_counties(self, counties: List[tuple], max_workers: int) -> List[Optional[Dict[str, Dict]]]:
+        """aget_county_demographics() for each (state, county), max_workers at a time, in order."""
+        limit = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(county):
+            async with limit:
+                return await self.aget_county_demographics(*county)
+
+        tasks = [asyncio.ensure_future(fetch(county)) for county in counties]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            # On cancellation or error, stop the rest instead of leaving them running
+            for task in tasks:
+                task.cancel()
+
+    async def _prefetch_counties(self, geoids: List[str], max_workers: int = 4) -> int:
+        """
+        Bulk-fetch the counties of uncached tracts so the per-tract loop hits the cache.
+
+        Requested tracts missing from their county's response are cached as
+        not found, like a per-tract 404.
+
+        Args:
+            geoids: 11-digit tract GEOIDs
+            max_workers: Counties fetched concurrently
+
+        Returns:
+            int: County requests made
+        """
+        by_county: Dict[tuple, List[str]] = {}
+        for geoid in geoids:
+            if geoid not in self.cache:
+                by_county.setdefault((geoid[:2], geoid[2:5]), []).append(geoid)
+
+        if not by_county:
+            return 0
+        logger.info(f"Bulk fetching {len(by_county)} counties for "
+                    f"{sum(len(g) for g in by_county.values())} uncached tracts")
+
+        counties = sorted(by_county)
+        results = await self._gather_counties(counties, max_workers)
+
+        not_found = []
+        for county, county_results in zip(counties, results):
+            if county_results is None:
+                continue  # falls back to per-tract requests
+            not_found.extend(
+                (geoid, self._create_empty_result(geoid, "Tract not found in ACS"))
+                for geoid in by_county[county] if geoid not in county_results
+            )
+        self.cache.set_many(not_found)
+        return len(counties)
 
     def _parse_acs_response(self, data: List, geoid: str) -> Dict:
         """
@@ -255,9 +493,26 @@ class ACSDataCollector:
                 return self._create_empty_result(geoid, "Empty response")
 
             # First row is headers, second row is data
-            headers = data[0]
-            values = data[1]
+            return self._parse_acs_row(data[0], data[1], geoid)
+
+        except Exception as e:
+            logger.error(f"Error parsing ACS response for {geoid}: {e}")
+            return self._create_empty_result(geoid, f"Parse error: {str(e)}")
 
+    def _parse_acs_row(self, headers: List, values: List, geoid: str, warn: bool = True) -> Dict:
+        """
+        Parse one data row of an ACS response.
+
+        Args:
+            headers: Header row (variable codes and geography columns)
+            values: Data row
+            geoid: Census tract GEOID
+            warn: Log a warning when variables are missing
+
+        Returns:
+            Parsed result dictionary
+        """
+        try:
             # Create result dict
             result = {
                 'geoid': geoid,
@@ -283,7 +538,7 @@ class ACSDataCollector:
             # Flag if data is incomplete
             result['data_complete'] = (null_count == 0)
 
-            if null_count > 0:
+            if null_count > 0 and warn:
                 logger.warning(f"GEOID {geoid}: {null_count}/{len(self.ACS_VARIABLES)} variables missing")
 
             return result
@@ -307,28 +562,23 @@ class ACSDataCollector:
 
         return result
 
-    def batch_collect_demographics(
+    async def abatch_collect_demographics(
         self,
         tracts_df: pd.DataFrame,
         state_col: str = 'census_state_fips',
         county_col: str = 'census_county_fips',
         tract_col: str = 'census_tract_fips',
         checkpoint_file: str = "data/census/intermediate/demographics_collected.csv",
-        rate_limit_delay: float = 0.5
+        bulk: bool = True,
+        max_workers: int = 8
     ) -> pd.DataFrame:
         """
-        Collect demographics for all tracts in dataframe.
-
-        Args:
-            tracts_df: DataFrame with census tract identifiers
-            state_col: Column name for state FIPS
-            county_col: Column name for county FIPS
-            tract_col: Column name for tract FIPS
-            checkpoint_file: File for saving intermediate results
-            rate_limit_delay: Delay between API requests (seconds)
+        Coroutine version of batch_collect_demographics() (same arguments and result).
 
-        Returns:
-            DataFrame with added ACS demographic columns
+        Up to max_workers per-tract requests are in flight at once; the
+        client's token bucket (requests_per_second) keeps the overall rate
+        within the API's limits. Cancelling the task cancels every outstanding
+        request and keeps the checkpoint log for the next run.
         """
         logger.info(f"Starting batch ACS data collection")
 
@@ -345,87 +595,100 @@ class ACSDataCollector:
         # Initialize demographics dict
         demographics_dict = {}
 
-        # Process unique tracts
+        # Tracts collected by an interrupted earlier run
+        log = CheckpointLog(checkpoint_log_path(checkpoint_file))
+        if len(log):
+            logger.info(f"Resuming from checkpoint log with {len(log)} tracts already collected")
+
+        # Bulk mode: one request per county fills the cache for the requests below
+        if bulk:
+            geoids = (
+                unique_tracts[state_col].astype(str) + unique_tracts[county_col].astype(str)
+                + unique_tracts[tract_col].astype(str)
+            )
+            await self._prefetch_counties([
+                geoid for geoid in geoids
+                if len(geoid) == 11 and geoid.isdigit() and geoid not in log
+            ])
+
+        # Tracts still to collect
         success_count = 0
         error_count = 0
         cached_count = 0
+        pending = []
 
-        for idx, row in unique_tracts.iterrows():
-            state_fips = row[state_col]
-            county_fips = row[county_col]
-            tract_fips = row[tract_col]
-
+        for state_fips, county_fips, tract_fips in unique_tracts.itertuples(index=False):
             geoid = f"{state_fips}{county_fips}{tract_fips}"
 
+            logged = log.get(geoid)
+            if logged is not None:
+                demographics_dict[geoid] = logged
+                success_count += 1
+                continue
+
             # Check if already in cache (to report cache hits)
             if geoid in self.cache:
                 cached_count += 1
 
-            # Fetch demographics
-            demographics = self.get_tract_demographics(
-                state_fips, county_fips, tract_fips
-            )
+            pending.append((state_fips, county_fips, tract_fips, geoid))
 
-            demographics_dict[geoid] = demographics
+        limit = asyncio.Semaphore(max(1, max_workers))
 
-            if demographics['success']:
-                success_count += 1
-            else:
-                error_count += 1
-                logger.warning(f"Failed to fetch demographics for {geoid}: {demographics['error']}")
+        async def collect(item):
+            state_fips, county_fips, tract_fips, _ = item
+            async with limit:
+                return item, await self.aget_tract_demographics(state_fips, county_fips, tract_fips)
 
-            # Progress logging
-            if (idx + 1) % 10 == 0:
-                logger.info(f"Processed {idx + 1}/{len(unique_tracts)} unique tracts "
-                           f"({success_count} success, {error_count} errors, {cached_count} cached)")
+        tasks = [asyncio.ensure_future(collect(item)) for item in pending]
+        try:
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                (_, _, _, geoid), demographics = await next_result
+                demographics_dict[geoid] = demographics
 
-            # Rate limiting (unless cached)
-            if geoid not in self.cache:
-                time.sleep(rate_limit_delay)
+                if demographics['success']:
+                    log.append(geoid, demographics)
+                    success_count += 1
+                else:
+                    error_count += 1
+                    logger.warning(f"Failed to fetch demographics for {geoid}: {demographics['error']}")
+
+                # Progress logging
+                if done % 10 == 0:
+                    logger.info(f"Processed {done}/{len(pending)} uncollected tracts "
+                               f"({success_count} success, {error_count} errors, {cached_count} cached)")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            log.close()
 
         # Join demographics back to original dataframe
         logger.info("Merging demographics into dispensary dataset")
 
-        # Create GEOID column for merging
-        result_df['_temp_geoid'] = (
+        # GEOID of every row
+        geoids = (
             result_df[state_col].astype(str) +
             result_df[county_col].astype(str) +
             result_df[tract_col].astype(str)
         )
 
-        # Add demographic columns
-        for var_name in self.ACS_VARIABLES.values():
-            result_df[var_name] = None
-
-        result_df['census_data_complete'] = False
-        result_df['census_api_error'] = False
-
-        # Map demographics
-        for idx, row in result_df.iterrows():
-            geoid = row['_temp_geoid']
-
-            if pd.isna(geoid) or geoid == 'nannannan':
-                result_df.at[idx, 'census_api_error'] = True
-                continue
-
-            if geoid in demographics_dict:
-                demo = demographics_dict[geoid]
-
-                # Set variables
-                for var_name in self.ACS_VARIABLES.values():
-                    result_df.at[idx, var_name] = demo.get(var_name)
-
-                result_df.at[idx, 'census_data_complete'] = demo.get('data_complete', False)
-                result_df.at[idx, 'census_api_error'] = not demo.get('success', False)
+        # One row per collected tract, joined onto the rows in a single reindex
+        acs_columns = list(self.ACS_VARIABLES.values())
+        demographics = pd.DataFrame.from_dict(demographics_dict, orient='index').reindex(
+            columns=acs_columns + ['data_complete', 'success']
+        )
+        demographics[acs_columns] = demographics[acs_columns].apply(pd.to_numeric, errors='coerce')
+        matched = demographics.reindex(geoids.to_numpy())
 
-        # Remove temporary column
-        result_df = result_df.drop(columns=['_temp_geoid'])
+        result_df[acs_columns] = matched[acs_columns].to_numpy(dtype='float64')
+        result_df['census_data_complete'] = matched['data_complete'].eq(True).to_numpy()
+        # Rows without a collected tract, or whose record is not a success, are errors
+        result_df['census_api_error'] = ~matched['success'].eq(True).to_numpy()
 
-        # Save checkpoint
+        # Compact: the full table replaces the log
         logger.info(f"Saving checkpoint to {checkpoint_file}")
-        checkpoint_path = Path(checkpoint_file)
-        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-        result_df.to_csv(checkpoint_file, index=False)
+        write_csv_atomic(result_df, checkpoint_file)
+        log.discard()
 
         # Summary
         complete_count = result_df['census_data_complete'].sum()
@@ -438,6 +701,51 @@ class ACSDataCollector:
 
         return result_df
 
+    def batch_collect_demographics(
+        self,
+        tracts_df: pd.DataFrame,
+        state_col: str = 'census_state_fips',
+        county_col: str = 'census_county_fips',
+        tract_col: str = 'census_tract_fips',
+        checkpoint_file: str = "data/census/intermediate/demographics_collected.csv",
+        rate_limit_delay: Optional[float] = None,
+        bulk: bool = True,
+        max_workers: int = 8
+    ) -> pd.DataFrame:
+        """
+        Collect demographics for all tracts in dataframe.
+
+        Synchronous wrapper around abatch_collect_demographics(): per-tract
+        requests run concurrently (max_workers at a time) under the shared
+        rate limit.
+
+        Args:
+            tracts_df: DataFrame with census tract identifiers
+            state_col: Column name for state FIPS
+            county_col: Column name for county FIPS
+            tract_col: Column name for tract FIPS
+            checkpoint_file: Output CSV (its .log.jsonl records each collected
+                tract, so an interrupted run resumes where it stopped)
+            rate_limit_delay: Deprecated and ignored; the client's token bucket
+                (requests_per_second) sets the request rate
+            bulk: Fetch each county of uncached tracts in one request first
+                (tracts whose county request fails fall back to per-tract requests)
+            max_workers: Concurrent per-tract requests (1 = serial)
+
+        Returns:
+            DataFrame with added ACS demographic columns
+        """
+        if rate_limit_delay is not None:
+            warnings.warn(
+                "rate_limit_delay is deprecated and ignored; set requests_per_second on the collector instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        return run_sync(self.abatch_collect_demographics(
+            tracts_df, state_col=state_col, county_col=county_col, tract_col=tract_col,
+            checkpoint_file=checkpoint_file, bulk=bulk, max_workers=max_workers
+        ))
+
 
 # Module test
 if __name__ == "__main__":
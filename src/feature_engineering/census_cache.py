@@ -0,0 +1,306 @@
+"""
+Census API Result Cache
+
+SQLite-backed key/value cache shared by CensusTractIdentifier (geocoding)
+and ACSDataCollector (demographics), replacing their whole-file JSON caches.
+
+- One database file (data/census/cache/census_cache.sqlite) holds both
+  clients' entries, separated by namespace
+- WAL journal mode: readers never block the writer, and several processes
+  can use the same file; each write is its own small transaction, so a
+  crash loses at most the entry being written
+- Entries carry created/accessed timestamps and the data vintage they were
+  fetched under; entries older than the TTL or from another vintage are
+  treated as misses and dropped
+- Optional size cap per namespace with least-recently-used eviction
+- import_json() migrates an existing geocoding_cache.json / acs_cache.json
+  once, then renames it to *.json.migrated
+
+The cache is dict-like (get, [], in, len) so callers read it the same way
+they read the JSON dicts.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = 'census_cache.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    vintage TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, accessed_at);
+"""
+
+
+class CensusCache:
+    """
+    Persistent cache for one API's results.
+
+    Safe to share between threads (one SQLite connection per thread) and
+    between processes (SQLite file locking, WAL mode).
+
+    Attributes:
+        path (Path): SQLite database file
+        namespace (str): Entry namespace (e.g. 'geocode', 'acs')
+        vintage (str): Data vintage stamped on new entries; entries from
+            other vintages are misses
+        ttl (float, optional): Entry lifetime in seconds (None = no expiry)
+        max_entries (int, optional): Size cap for this namespace
+    """
+
+    # Seconds between accessed_at updates for the same entry (keeps hot reads from writing)
+    TOUCH_INTERVAL = 60.0
+
+    # Writes between size-cap checks (the cap may be exceeded by this many entries)
+    EVICT_EVERY = 64
+
+    def __init__(
+        self,
+        path: Path,
+        namespace: str,
+        vintage: str = '',
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            path: SQLite database file
+            namespace: Entry namespace
+            vintage: Data vintage for new entries and lookups
+            ttl: Entry lifetime in seconds
+            max_entries: Keep at most this many entries (least recently used go first)
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.vintage = vintage
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (reopened after a fork)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            # Autocommit; multi-row writes open explicit transactions
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    def _is_fresh(self, vintage: str, created_at: float, now: float) -> bool:
+        return vintage == self.vintage and (self.ttl is None or now - created_at <= self.ttl)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Cached value for a key.
+
+        Args:
+            key: Entry key
+            default: Returned on a miss
+
+        Returns:
+            The stored value, or default if absent, expired or from another vintage
+        """
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT value, vintage, created_at, accessed_at FROM entries WHERE namespace = ? AND key = ?',
+            (self.namespace, key)
+        ).fetchone()
+
+        if row is None:
+            return default
+
+        value, vintage, created_at, accessed_at = row
+        now = time.time()
+        if not self._is_fresh(vintage, created_at, now):
+            conn.execute('DELETE FROM entries WHERE namespace = ? AND key = ?', (self.namespace, key))
+            return default
+
+        if now - accessed_at >= self.TOUCH_INTERVAL:
+            conn.execute(
+                'UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?',
+                (now, self.namespace, key)
+            )
+        return json.loads(value)
+
+    def values(self) -> Iterator[Any]:
+        """Every fresh value in this namespace (unordered)."""
+        rows = self._connection().execute(
+            'SELECT value, vintage, created_at FROM entries WHERE namespace = ?', (self.namespace,)
+        ).fetchall()
+        now = time.time()
+        for value, vintage, created_at in rows:
+            if self._is_fresh(vintage, created_at, now):
+                yield json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[str, Any]], created_at: Optional[float] = None) -> int:
+        """
+        Store several values in one transaction.
+
+        Args:
+            items: (key, value) pairs
+            created_at: Timestamp to record (default: now)
+
+        Returns:
+            int: Number of entries written
+        """
+        now = time.time()
+        created_at = now if created_at is None else created_at
+        rows = [
+            (self.namespace, key, json.dumps(value), self.vintage, created_at, now)
+            for key, value in items
+        ]
+        if not rows:
+            return 0
+
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)', rows)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+        with self._writes_lock:
+            self._writes += len(rows)
+            check_cap = self._writes >= self.EVICT_EVERY or len(rows) > 1
+            if check_cap:
+                self._writes = 0
+        if check_cap:
+            self.evict()
+        return len(rows)
+
+    def evict(self) -> int:
+        """
+        Drop stale entries, then least recently used ones beyond max_entries.
+
+        Returns:
+            int: Entries removed
+        """
+        removed = self.purge_stale()
+        if self.max_entries is None:
+            return removed
+
+        conn = self._connection()
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            conn.execute(
+                'DELETE FROM entries WHERE namespace = ? AND key IN ('
+                'SELECT key FROM entries WHERE namespace = ? ORDER BY accessed_at LIMIT ?)',
+                (self.namespace, self.namespace, excess)
+            )
+            removed += excess
+            logger.debug(f"Evicted {excess} least recently used '{self.namespace}' cache entries")
+        return removed
+
+    def purge_stale(self) -> int:
+        """Delete entries that are expired or from another vintage."""
+        conn = self._connection()
+        if self.ttl is None:
+            cursor = conn.execute(
+                'DELETE FROM entries WHERE namespace = ? AND vintage != ?',
+                (self.namespace, self.vintage)
+            )
+        else:
+            cursor = conn.execute(
+                'DELETE FROM entries WHERE namespace = ? AND (vintage != ? OR created_at < ?)',
+                (self.namespace, self.vintage, time.time() - self.ttl)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete every entry in this namespace."""
+        self._connection().execute('DELETE FROM entries WHERE namespace = ?', (self.namespace,))
+
+    def import_json(self, json_path: Path) -> int:
+        """
+        One-time migration of a legacy JSON cache file.
+
+        Entries are stamped with the file's modification time (so the TTL
+        still applies) and the current vintage. The file is then renamed to
+        *.json.migrated so later runs skip it.
+
+        Args:
+            json_path: Path of the old {key: value} JSON cache
+
+        Returns:
+            int: Entries imported (0 if there was nothing to migrate)
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return 0
+
+        try:
+            with open(json_path, 'r') as f:
+                entries = json.load(f)
+            count = self.set_many(entries.items(), created_at=json_path.stat().st_mtime)
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not migrate {json_path}: {e}")
+            return 0
+
+        try:
+            json_path.replace(json_path.with_name(json_path.name + '.migrated'))
+        except FileNotFoundError:
+            pass  # another process migrated it concurrently
+
+        logger.info(f"Migrated {count} entries from {json_path} to {self.path}")
+        return count
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            'SELECT COUNT(*) FROM entries WHERE namespace = ?', (self.namespace,)
+        ).fetchone()[0]
+
+
+_MISSING = object()
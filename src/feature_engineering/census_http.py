@@ -0,0 +1,461 @@
+"""
+Census HTTP Client
+
+Rate-limited, retrying GET client for the Census APIs, usable from asyncio
+code and (through the same machinery) from plain synchronous calls and
+threads.
+
+- CensusSession: what every client shares. It holds one pooled transport
+  (keep-alive connections), one concurrency limit (a bounded executor
+  running the blocking transport calls) and one retry budget. By default
+  the geocoder and the ACS collector use the same process-wide session
+- RateLimitedClient: per-API state. A token bucket caps the request rate
+  (the Census APIs ask for roughly 5 requests/second per client). 429 and
+  5xx responses pause every caller (Retry-After when the server sends one,
+  exponential backoff otherwise) and halve the request rate, at most once
+  per round of in-flight requests; each success then restores a step of
+  the configured rate. Timeouts are retried with exponential backoff.
+  Retries are also limited by the session's retry budget
+- aget() is the only entry point; cancelling the awaiting task abandons
+  the request (a transport call already running finishes in the background,
+  within the session's request timeout, and its result is dropped). Bulk
+  requests (a whole county's tracts) get a longer timeout than single-record
+  lookups.
+  Synchronous callers use run_sync(client.aget(...))
+- The transport is pluggable: any callable (url, params, timeout) ->
+  TransportResponse. The default wraps a pooled requests.Session; tests
+  and benchmarks can point it at a local stand-in server or replace it
+  outright
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Statuses that mean "slow down and try again"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransportResponse(NamedTuple):
+    """
+    Outcome of one HTTP request.
+
+    Attributes:
+        status (int): HTTP status code
+        payload: Decoded JSON body for 2xx responses with a body, None otherwise
+        retry_after (float, optional): Seconds from a Retry-After header
+    """
+    status: int
+    payload: Any = None
+    retry_after: Optional[float] = None
+
+
+Transport = Callable[[str, Dict, float], TransportResponse]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds (HTTP-date values are ignored)."""
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RequestsTransport:
+    """
+    Default transport: GET through a requests.Session.
+
+    The session's connection pool is sized for the number of threads that
+    will share it, so concurrent requests reuse keep-alive connections
+    instead of opening (and discarding) extra ones.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None, pool_size: int = 16):
+        """
+        Args:
+            session: Session to use (default: a new one)
+            pool_size: Keep-alive connections per host
+        """
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def __call__(self, url: str, params: Dict, timeout: float) -> TransportResponse:
+        response = self.session.get(url, params=params, timeout=timeout)
+        # 204 No Content (and any other empty 2xx) has no JSON to decode
+        payload = response.json() if 200 <= response.status_code < 300 and response.content else None
+        return TransportResponse(
+            response.status_code, payload, _parse_retry_after(response.headers.get('Retry-After'))
+        )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to `burst` tokens, refilled at `rate` tokens per second;
+    acquire() takes one, sleeping until one is available. pause() stops
+    refilling for every caller until a deadline.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        """
+        Args:
+            rate: Tokens per second
+            burst: Bucket capacity (requests allowed back to back)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take one token if one is available now.
+
+        Returns:
+            float: 0.0 if a token was taken, else seconds until one may be
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self._paused_until and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return max(self._paused_until - now, (1.0 - self._tokens) / self.rate)
+
+    def acquire(self) -> float:
+        """
+        Take one token, blocking until one is available.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds`, and restart from an empty bucket."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate (tokens already earned are kept)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+
+class RetryBudget:
+    """
+    Retry allowance shared by every request in a session.
+
+    Each first attempt deposits `ratio` retries, up to `reserve`; each retry
+    spends one. When a service is down, retries therefore stay around
+    `ratio` of the traffic instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 50.0):
+        """
+        Args:
+            ratio: Retries earned per request
+            reserve: Starting (and maximum) balance
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self.balance = reserve
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Deposit for a new request."""
+        with self._lock:
+            self.balance = min(self.reserve, self.balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry if the budget allows it."""
+        with self._lock:
+            if self.balance < 1.0:
+                return False
+            self.balance -= 1.0
+            return True
+
+
+class CensusSession:
+    """
+    Connection pool, concurrency limit and retry budget shared by census clients.
+
+    Attributes:
+        transport (callable): (url, params, timeout) -> TransportResponse
+        max_concurrency (int): Requests in flight at once, across all clients
+        retry_budget (RetryBudget): Retry allowance across all clients
+        request_timeout (float): Upper bound on each transport call's timeout (seconds)
+        bulk_timeout (float): Upper bound for bulk requests (seconds)
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        max_concurrency: int = 8,
+        retry_budget: Optional[RetryBudget] = None,
+        request_timeout: float = 10.0,
+        bulk_timeout: float = 30.0
+    ):
+        """
+        Args:
+            transport: Request function (default: RequestsTransport sized to max_concurrency)
+            max_concurrency: Requests in flight at once
+            retry_budget: Shared retry allowance (default: RetryBudget())
+            request_timeout: Upper bound on each request's timeout (seconds). A
+                cancelled request keeps its slot until the transport returns,
+                so this bounds how long abandoned work holds the concurrency limit
+            bulk_timeout: Upper bound on a bulk request's timeout (seconds); large
+                responses such as every tract in a county take longer to serve
+        """
+        self.transport = transport or RequestsTransport(pool_size=max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.retry_budget = retry_budget or RetryBudget()
+        self.request_timeout = request_timeout
+        self.bulk_timeout = bulk_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='census-http')
+
+    async def send(
+        self,
+        url: str,
+        params: Dict,
+        timeout: Optional[float] = None,
+        bulk: bool = False
+    ) -> TransportResponse:
+        """Send one request from a coroutine (waits for a free slot)."""
+        cap = self.bulk_timeout if bulk else self.request_timeout
+        timeout = cap if timeout is None else min(timeout, cap)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.transport, url, params, timeout)
+
+    def close(self) -> None:
+        """Stop accepting requests; queued ones are cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_shared_session: Optional[CensusSession] = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_session() -> CensusSession:
+    """The process-wide session used by clients created without one (closed at exit)."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = CensusSession()
+            atexit.register(_shared_session.close)
+        return _shared_session
+
+
+def run_sync(coroutine: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run(), or a helper thread when called while an event loop
+    is already running in this thread (e.g. from a notebook).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+class RateLimitedClient:
+    """
+    GET client for one API with a token bucket and adaptive backoff.
+
+    One instance is meant to be shared by every caller talking to the same
+    API, so the rate limit and any server-requested pause apply to all of
+    them together. Requests go through the client's CensusSession.
+
+    Attributes:
+        session (CensusSession): Shared pool, concurrency limit and retry budget
+        requests_per_second (float): Configured (maximum) request rate
+        current_rate (float): Rate in effect after adaptive backoff
+        throttled (int): 429/5xx responses seen
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        requests_per_second: float = 5.0,
+        burst: float = 1.0,
+        backoff_base: float = 1.0,
+        max_backoff: float = 60.0,
+        min_rate: float = 0.5,
+        session: Optional[CensusSession] = None
+    ):
+        """
+        Args:
+            transport: Request function for a private session (default: use
+                `session`, or the process-wide shared_session())
+            requests_per_second: Maximum request rate for this API
+            burst: Requests allowed back to back before the rate applies
+            backoff_base: First backoff delay (seconds), doubled per attempt
+            max_backoff: Upper bound on any single backoff delay (seconds)
+            min_rate: Floor for the adaptively reduced rate
+            session: Session to send requests through
+
+        Raises:
+            ValueError: If both transport and session are given
+        """
+        if transport is not None and session is not None:
+            raise ValueError("Pass either a transport or a session, not both")
+        if session is None:
+            session = CensusSession(transport) if transport is not None else shared_session()
+
+        self.session = session
+        self.requests_per_second = float(requests_per_second)
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.min_rate = min(min_rate, self.requests_per_second)
+        self.current_rate = self.requests_per_second
+        self.throttled = 0
+        self.bucket = TokenBucket(self.requests_per_second, burst)
+        self._decreased_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def transport(self) -> Transport:
+        return self.session.transport
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return min(self.max_backoff, self.backoff_base * 2 ** attempt)
+
+    def _throttle(self, delay: float, sent_at: float) -> None:
+        """
+        Multiplicative decrease: halve the rate and pause all callers.
+
+        Requests sent before the last decrease were already in flight when
+        the server pushed back, so their 429/5xx pause but do not halve again.
+        """
+        with self._lock:
+            self.throttled += 1
+            if sent_at >= self._decreased_at:
+                self.current_rate = max(self.min_rate, self.current_rate / 2)
+                self.bucket.set_rate(self.current_rate)
+                self._decreased_at = time.monotonic()
+        self.bucket.pause(delay)
+
+    def _recover(self) -> None:
+        """Additive increase back toward the configured rate."""
+        if self.current_rate >= self.requests_per_second:
+            return
+        with self._lock:
+            self.current_rate = min(self.requests_per_second, self.current_rate + self.requests_per_second / 10)
+            self.bucket.set_rate(self.current_rate)
+
+    def _is_final(self, response: TransportResponse, url: str, attempt: int, max_retries: int, sent_at: float) -> bool:
+        """Adapt the rate to a response; True unless it asks us to retry."""
+        if response.status not in RETRY_STATUSES:
+            self._recover()
+            return True
+
+        delay = response.retry_after
+        if delay is None:
+            delay = self._backoff_delay(attempt)
+        delay = min(delay, self.max_backoff)
+        self._throttle(delay, sent_at)
+        logger.warning(
+            f"HTTP {response.status} on attempt {attempt + 1}/{max_retries} for {url}; "
+            f"backing off {delay:.2f}s at {self.current_rate:.2f} req/s"
+        )
+        return False
+
+    def _may_retry(self, attempt: int, max_retries: int) -> bool:
+        if attempt == max_retries - 1:
+            return False
+        if not self.session.retry_budget.try_spend():
+            logger.warning("Census retry budget exhausted; not retrying")
+            return False
+        return True
+
+    async def aget(
+        self,
+        url: str,
+        params: Dict,
+        timeout: Optional[float] = None,
+        max_retries: int = 3,
+        bulk: bool = False
+    ) -> TransportResponse:
+        """
+        Rate-limited GET with retries.
+
+        Waiting for the rate limit, a free connection slot or a backoff never
+        blocks the event loop.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            timeout: Per-request timeout (seconds; default and upper bound:
+                the session's request_timeout, or bulk_timeout for bulk requests)
+            max_retries: Attempts before giving up
+            bulk: Whether this is a bulk request (a large response that may
+                take longer than a single-record lookup)
+
+        Returns:
+            TransportResponse: The first non-retryable response, or the last
+                429/5xx response once attempts (or the retry budget) run out
+
+        Raises:
+            requests.exceptions.Timeout: If the last attempt timed out
+            asyncio.CancelledError: If the awaiting task is cancelled
+            Exception: Whatever else the transport raises (not retried)
+        """
+        self.session.retry_budget.record_request()
+        response = None
+
+        for attempt in range(max_retries):
+            while (wait := self.bucket.try_acquire()) > 0:
+                await asyncio.sleep(wait)
+            sent_at = time.monotonic()
+
+            try:
+                response = await self.session.send(url, params, timeout, bulk)
+            except requests.exceptions.Timeout:
+                logger.warning(f"Timeout on attempt {attempt + 1}/{max_retries} for {url}")
+                if not self._may_retry(attempt, max_retries):
+                    raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+
+            if self._is_final(response, url, attempt, max_retries, sent_at) or not self._may_retry(attempt, max_retries):
+                break
+
+        return response
@@ -8,15 +8,34 @@ Author: Multi-State Dispensary Model - Phase 2
 Date: October 2025
 """
 
+import asyncio
 import requests
 import pandas as pd
-import json
 import os
-import time
+import threading
 import logging
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+try:
+    from ..instrumentation import profiler
+    from .census_http import CensusSession, RateLimitedClient, Transport, run_sync
+    from .census_cache import CensusCache, CACHE_FILENAME
+    from .offline_tract_resolver import OfflineTractResolver
+    from .spatial_geocode_cache import SpatialGeocodeCache
+    from .checkpoint_log import CheckpointLog, checkpoint_log_path, write_csv_atomic
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from instrumentation import profiler
+    from census_http import CensusSession, RateLimitedClient, Transport, run_sync
+    from census_cache import CensusCache, CACHE_FILENAME
+    from offline_tract_resolver import OfflineTractResolver
+    from spatial_geocode_cache import SpatialGeocodeCache
+    from checkpoint_log import CheckpointLog, checkpoint_log_path, write_csv_atomic
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,53 +52,70 @@ class CensusTractIdentifier:
     dispensary coordinates to census tract identifiers.
 
     Features:
-    - Batch processing with progress tracking
-    - Automatic retry with exponential backoff
-    - Caching to avoid redundant API calls
+    - Concurrent batch processing with progress tracking
+    - Shared token-bucket rate limit with adaptive backoff on 429/5xx
+    - Caching to avoid redundant API calls (by coordinates, and by the
+      polygons of tracts already resolved)
     - Comprehensive error handling
     - Checkpoint saving for crash recovery
     """
 
-    def __init__(self, cache_dir: str = "data/census/cache"):
+    # Geocoder benchmark/vintage the cached results were fetched under
+    CACHE_VINTAGE = 'Public_AR_Current/Current_Current'
+
+    def __init__(
+        self,
+        cache_dir: str = "data/census/cache",
+        transport: Optional[Transport] = None,
+        requests_per_second: float = 5.0,
+        cache_ttl_days: Optional[float] = 365,
+        max_cache_entries: Optional[int] = None,
+        tract_polygons: Optional[OfflineTractResolver] = None,
+        session: Optional[CensusSession] = None
+    ):
         """
         Initialize Census Tract Identifier.
 
         Args:
             cache_dir: Directory for caching geocoding results
+            transport: Request function (url, params, timeout) -> TransportResponse
+                for a private session (default: the shared session)
+            requests_per_second: Maximum geocoding request rate across all callers
+            cache_ttl_days: Re-geocode cached coordinates older than this
+                (the "Current" benchmark/vintage moves with each TIGER release)
+            max_cache_entries: Size cap for cached results (None = unbounded)
+            tract_polygons: Source of tract polygons for the spatial cache
+                (default: locally persisted TIGER polygons in cache_dir, never
+                downloaded; the spatial cache is off if shapely is missing)
+            session: Connection pool, concurrency limit and retry budget to
+                share (default: the process-wide census_http.shared_session(),
+                also used by ACSDataCollector)
         """
         self.geocoding_url = "https://geocoding.geo.census.gov/geocoder/geographies/coordinates"
-        self.session = requests.Session()  # Connection pooling
+        self.client = RateLimitedClient(transport, requests_per_second=requests_per_second, session=session)
 
-        # Set up caching
+        # Set up caching (shared SQLite cache; migrates the old JSON cache once)
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "geocoding_cache.json"
-        self.cache = self._load_cache()
+        self.cache_file = self.cache_dir / CACHE_FILENAME
+        self.cache = CensusCache(
+            self.cache_file, 'geocode', vintage=self.CACHE_VINTAGE,
+            ttl=cache_ttl_days * 86400 if cache_ttl_days is not None else None,
+            max_entries=max_cache_entries
+        )
+        self.cache.import_json(self.cache_dir / "geocoding_cache.json")
+
+        # Spatial layer: points inside an already-resolved tract's polygon skip the API
+        self.spatial_cache = None
+        if SpatialGeocodeCache.available():
+            if tract_polygons is None:
+                tract_polygons = OfflineTractResolver(cache_dir=str(self.cache_dir), allow_download=False)
+            self.spatial_cache = SpatialGeocodeCache(tract_polygons.polygon)
+        self._spatial_seeded = False
+        self._spatial_lock = threading.Lock()
 
         logger.info(f"CensusTractIdentifier initialized with cache at {self.cache_file}")
 
-    def _load_cache(self) -> Dict:
-        """Load cached geocoding results from disk."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    cache = json.load(f)
-                logger.info(f"Loaded {len(cache)} cached geocoding results")
-                return cache
-            except Exception as e:
-                logger.warning(f"Failed to load cache: {e}")
-                return {}
-        return {}
-
-    def _save_cache(self) -> None:
-        """Save cache to disk."""
-        try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
-            logger.debug(f"Saved cache with {len(self.cache)} entries")
-        except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
-
     def _make_cache_key(self, latitude: float, longitude: float) -> str:
         """
         Create cache key from coordinates.
@@ -94,6 +130,110 @@ class CensusTractIdentifier:
         # Round to 6 decimal places (~0.1m precision) for cache matching
         return f"{latitude:.6f},{longitude:.6f}"
 
+    @staticmethod
+    def _failure_result(error: str) -> Dict:
+        """Result dict for a coordinate that could not be geocoded."""
+        return {
+            'state_fips': None,
+            'county_fips': None,
+            'tract_fips': None,
+            'geoid': None,
+            'tract_name': None,
+            'success': False,
+            'error': error
+        }
+
+    def _spatial_lookup(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """Tract result from the spatial cache (seeded from the persistent cache on first use)."""
+        if self.spatial_cache is None:
+            return None
+
+        if not self._spatial_seeded:
+            with self._spatial_lock:
+                if not self._spatial_seeded:
+                    added = self.spatial_cache.add_many(self.cache.values())
+                    if added:
+                        logger.info(f"Spatial geocoding cache seeded with {added} tract polygons")
+                    self._spatial_seeded = True
+
+        return self.spatial_cache.lookup(latitude, longitude)
+
+    def _cached_tract(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """Result from the coordinate cache or the spatial cache, if either has one."""
+        cache_key = self._make_cache_key(latitude, longitude)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for {cache_key}")
+            profiler.count('geocode_cache.hit')
+            return cached
+
+        spatial = self._spatial_lookup(latitude, longitude)
+        if spatial is not None:
+            logger.debug(f"Spatial cache hit for {cache_key} (tract {spatial['geoid']})")
+            profiler.count('geocode_cache.spatial_hit')
+            return spatial
+
+        profiler.count('geocode_cache.miss')
+        return None
+
+    async def _fetch_tract(self, latitude: float, longitude: float, max_retries: int) -> Dict:
+        """Geocode through the API and cache a successful result."""
+        # Prepare API parameters
+        params = {
+            'x': longitude,
+            'y': latitude,
+            'benchmark': '4',  # Public_AR_Current
+            'vintage': '4',    # Current_Current
+            'format': 'json'
+        }
+
+        try:
+            logger.debug(f"Geocoding {latitude}, {longitude}")
+
+            # Rate limiting and retries (timeouts, 429, 5xx) happen in the client
+            with profiler.timer('geocode_request'):
+                response = await self.client.aget(self.geocoding_url, params, max_retries=max_retries)
+
+            if response.status != 200:
+                logger.error(f"HTTP error {response.status} geocoding {latitude}, {longitude}")
+                return self._failure_result(f"HTTP {response.status}")
+
+            # Parse response
+            result = self._parse_geocoding_response(response.payload, latitude, longitude)
+
+            # Cache successful results
+            if result['success']:
+                self.cache[self._make_cache_key(latitude, longitude)] = result
+                if self.spatial_cache is not None:
+                    self.spatial_cache.add(result, latitude, longitude)
+
+            return result
+
+        except requests.exceptions.Timeout:
+            return self._failure_result('API timeout after retries')
+
+        except Exception as e:
+            logger.error(f"Error geocoding {latitude}, {longitude}: {e}")
+            return self._failure_result(str(e))
+
+    async def aget_tract_from_coordinates(
+        self,
+        latitude: float,
+        longitude: float,
+        max_retries: int = 3
+    ) -> Dict:
+        """
+        Coroutine version of get_tract_from_coordinates().
+
+        Many calls can be awaited concurrently (e.g. with asyncio.gather);
+        they share the client's rate limit and the session's concurrency
+        limit. Cancelling the awaiting task abandons the lookup.
+        """
+        cached = self._cached_tract(latitude, longitude)
+        if cached is not None:
+            return cached
+        return await self._fetch_tract(latitude, longitude, max_retries)
+
     def get_tract_from_coordinates(
         self,
         latitude: float,
@@ -103,10 +243,13 @@ class CensusTractIdentifier:
         """
         Get census tract FIPS code from coordinates.
 
+        Safe to call from several threads at once; requests share the
+        client's rate limit.
+
         Args:
             latitude: Latitude in decimal degrees (WGS84)
             longitude: Longitude in decimal degrees (WGS84)
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts (timeouts, 429 and 5xx)
 
         Returns:
             dict: {
@@ -119,71 +262,11 @@ class CensusTractIdentifier:
                 'error': Optional[str]
             }
         """
-        # Check cache first
-        cache_key = self._make_cache_key(latitude, longitude)
-        if cache_key in self.cache:
-            logger.debug(f"Cache hit for {cache_key}")
-            return self.cache[cache_key]
-
-        # Prepare API parameters
-        params = {
-            'x': longitude,
-            'y': latitude,
-            'benchmark': '4',  # Public_AR_Current
-            'vintage': '4',    # Current_Current
-            'format': 'json'
-        }
-
-        # Retry logic with exponential backoff
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Geocoding {latitude}, {longitude} (attempt {attempt + 1}/{max_retries})")
-
-                response = self.session.get(
-                    self.geocoding_url,
-                    params=params,
-                    timeout=10
-                )
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Parse response
-                result = self._parse_geocoding_response(data, latitude, longitude)
-
-                # Cache successful results
-                if result['success']:
-                    self.cache[cache_key] = result
-                    self._save_cache()
-
-                return result
-
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout on attempt {attempt + 1} for {latitude}, {longitude}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
-                else:
-                    return {
-                        'state_fips': None,
-                        'county_fips': None,
-                        'tract_fips': None,
-                        'geoid': None,
-                        'tract_name': None,
-                        'success': False,
-                        'error': 'API timeout after retries'
-                    }
-
-            except Exception as e:
-                logger.error(f"Error geocoding {latitude}, {longitude}: {e}")
-                return {
-                    'state_fips': None,
-                    'county_fips': None,
-                    'tract_fips': None,
-                    'geoid': None,
-                    'tract_name': None,
-                    'success': False,
-                    'error': str(e)
-                }
+        # Cache hits never touch the event loop
+        cached = self._cached_tract(latitude, longitude)
+        if cached is not None:
+            return cached
+        return run_sync(self._fetch_tract(latitude, longitude, max_retries))
 
     def _parse_geocoding_response(
         self,
@@ -210,15 +293,7 @@ class CensusTractIdentifier:
 
             if not census_tracts:
                 logger.warning(f"No census tract found for {latitude}, {longitude}")
-                return {
-                    'state_fips': None,
-                    'county_fips': None,
-                    'tract_fips': None,
-                    'geoid': None,
-                    'tract_name': None,
-                    'success': False,
-                    'error': 'No census tract found'
-                }
+                return self._failure_result('No census tract found')
 
             # Extract first tract (should only be one)
             tract = census_tracts[0]
@@ -235,42 +310,39 @@ class CensusTractIdentifier:
 
         except Exception as e:
             logger.error(f"Error parsing geocoding response: {e}")
-            return {
-                'state_fips': None,
-                'county_fips': None,
-                'tract_fips': None,
-                'geoid': None,
-                'tract_name': None,
-                'success': False,
-                'error': f'Parse error: {str(e)}'
-            }
-
-    def batch_identify_tracts(
+            return self._failure_result(f'Parse error: {str(e)}')
+
+    @staticmethod
+    def _row_key(idx, latitude: float, longitude: float) -> str:
+        """Checkpoint identity of an input row: its index label and coordinates."""
+        return f"{idx}|{latitude:.6f},{longitude:.6f}"
+
+    @staticmethod
+    def _apply_tract(result_df: pd.DataFrame, idx, tract_info: Dict) -> None:
+        """Write a successful result into the tract columns of one row."""
+        result_df.at[idx, 'census_state_fips'] = tract_info['state_fips']
+        result_df.at[idx, 'census_county_fips'] = tract_info['county_fips']
+        result_df.at[idx, 'census_tract_fips'] = tract_info['tract_fips']
+        result_df.at[idx, 'census_geoid'] = tract_info['geoid']
+        result_df.at[idx, 'census_tract_name'] = tract_info['tract_name']
+        result_df.at[idx, 'census_tract_error'] = False
+
+    async def abatch_identify_tracts(
         self,
         df: pd.DataFrame,
         lat_col: str = 'latitude',
         lon_col: str = 'longitude',
         checkpoint_file: str = "data/census/intermediate/tracts_identified.csv",
-        checkpoint_interval: int = 50
+        checkpoint_interval: int = 50,
+        max_workers: int = 8
     ) -> pd.DataFrame:
         """
-        Add census tract identifiers to dispensary dataframe.
+        Coroutine version of batch_identify_tracts() (same arguments and result).
 
-        Args:
-            df: DataFrame with dispensary coordinates
-            lat_col: Name of latitude column
-            lon_col: Name of longitude column
-            checkpoint_file: File for saving intermediate results
-            checkpoint_interval: Save checkpoint every N records
-
-        Returns:
-            DataFrame with added census tract columns:
-            - census_state_fips
-            - census_county_fips
-            - census_tract_fips
-            - census_geoid
-            - census_tract_name
-            - census_tract_error (bool flag)
+        Up to max_workers lookups are in flight at once so network latency
+        overlaps; the client's token bucket (requests_per_second) keeps the
+        overall rate within the API's limits. Cancelling the task cancels
+        every outstanding lookup and keeps the checkpoint log for the next run.
         """
         logger.info(f"Starting batch census tract identification for {len(df)} dispensaries")
 
@@ -285,37 +357,17 @@ class CensusTractIdentifier:
         result_df['census_tract_name'] = None
         result_df['census_tract_error'] = False
 
-        # Check for existing checkpoint
-        checkpoint_path = Path(checkpoint_file)
-        start_idx = 0
-
-        if checkpoint_path.exists():
-            logger.info(f"Found checkpoint file: {checkpoint_file}")
-            try:
-                checkpoint_df = pd.read_csv(checkpoint_file)
-                # Count successful identifications in checkpoint
-                completed = checkpoint_df['census_geoid'].notna().sum()
-                logger.info(f"Resuming from checkpoint with {completed} tracts already identified")
-                result_df = checkpoint_df
-                start_idx = len(checkpoint_df)
-            except Exception as e:
-                logger.warning(f"Could not load checkpoint: {e}. Starting from beginning.")
-
-        # Process each row
+        # Results of an interrupted earlier run
+        log = CheckpointLog(checkpoint_log_path(checkpoint_file))
+        if len(log):
+            logger.info(f"Resuming from checkpoint log with {len(log)} tracts already identified")
+
+        # Rows still to geocode, in order
         success_count = 0
         error_count = 0
+        pending = []
 
-        for idx, row in result_df.iterrows():
-            # Skip already processed rows
-            if idx < start_idx:
-                if pd.notna(row['census_geoid']):
-                    success_count += 1
-                continue
-
-            # Get coordinates
-            lat = row[lat_col]
-            lon = row[lon_col]
-
+        for idx, lat, lon in zip(result_df.index, result_df[lat_col], result_df[lon_col]):
             # Skip if coordinates are missing
             if pd.isna(lat) or pd.isna(lon):
                 result_df.at[idx, 'census_tract_error'] = True
@@ -323,41 +375,60 @@ class CensusTractIdentifier:
                 logger.warning(f"Missing coordinates for row {idx}")
                 continue
 
-            # Geocode
-            tract_info = self.get_tract_from_coordinates(lat, lon)
-
-            # Update DataFrame
-            if tract_info['success']:
-                result_df.at[idx, 'census_state_fips'] = tract_info['state_fips']
-                result_df.at[idx, 'census_county_fips'] = tract_info['county_fips']
-                result_df.at[idx, 'census_tract_fips'] = tract_info['tract_fips']
-                result_df.at[idx, 'census_geoid'] = tract_info['geoid']
-                result_df.at[idx, 'census_tract_name'] = tract_info['tract_name']
-                result_df.at[idx, 'census_tract_error'] = False
+            key = self._row_key(idx, lat, lon)
+            logged = log.get(key)
+            if logged is not None:
+                self._apply_tract(result_df, idx, logged)
                 success_count += 1
-            else:
-                result_df.at[idx, 'census_tract_error'] = True
-                error_count += 1
-                logger.warning(f"Failed to geocode row {idx}: {tract_info['error']}")
+                continue
 
-            # Progress logging
-            if (idx + 1) % 10 == 0:
-                logger.info(f"Processed {idx + 1}/{len(df)} dispensaries "
-                           f"({success_count} success, {error_count} errors)")
+            pending.append((idx, lat, lon, key))
 
-            # Checkpoint saving
-            if (idx + 1) % checkpoint_interval == 0:
-                logger.info(f"Saving checkpoint at row {idx + 1}")
-                checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-                result_df.to_csv(checkpoint_file, index=False)
+        limit = asyncio.Semaphore(max(1, max_workers))
 
-            # Rate limiting (be respectful to Census API)
-            time.sleep(0.2)  # 5 requests per second max
+        async def geocode(item):
+            _, lat, lon, _ = item
+            async with limit:
+                return item, await self.aget_tract_from_coordinates(lat, lon)
 
-        # Final save
-        logger.info("Saving final results")
-        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-        result_df.to_csv(checkpoint_file, index=False)
+        # Results are applied as they arrive; each row's own index keeps the order
+        tasks = [asyncio.ensure_future(geocode(item)) for item in pending]
+        try:
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                (idx, _, _, key), tract_info = await next_result
+
+                # Update DataFrame and log (failures are retried on the next run)
+                if tract_info['success']:
+                    self._apply_tract(result_df, idx, tract_info)
+                    log.append(key, tract_info)
+                    success_count += 1
+                else:
+                    result_df.at[idx, 'census_tract_error'] = True
+                    error_count += 1
+                    logger.warning(f"Failed to geocode row {idx}: {tract_info['error']}")
+
+                # Progress logging
+                if done % 10 == 0:
+                    logger.info(f"Processed {done}/{len(pending)} dispensaries "
+                               f"({success_count} success, {error_count} errors)")
+
+                # Make the log durable periodically
+                if done % checkpoint_interval == 0:
+                    log.flush()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            log.close()
+
+        if self.client.throttled:
+            logger.info(f"Server throttled {self.client.throttled} requests "
+                        f"(rate ended at {self.client.current_rate:.2f} req/s)")
+
+        # Compact: the full table replaces the log
+        logger.info(f"Saving final results to {checkpoint_file}")
+        write_csv_atomic(result_df, checkpoint_file)
+        log.discard()
 
         # Summary
         logger.info(f"Census tract identification complete:")
@@ -368,6 +439,49 @@ class CensusTractIdentifier:
         return result_df
 
 
+    def batch_identify_tracts(
+        self,
+        df: pd.DataFrame,
+        lat_col: str = 'latitude',
+        lon_col: str = 'longitude',
+        checkpoint_file: str = "data/census/intermediate/tracts_identified.csv",
+        checkpoint_interval: int = 50,
+        max_workers: int = 8
+    ) -> pd.DataFrame:
+        """
+        Add census tract identifiers to dispensary dataframe.
+
+        Synchronous wrapper around abatch_identify_tracts(): lookups run
+        concurrently (max_workers at a time) under the shared rate limit and
+        results are written back in row order.
+
+        Progress goes to an append-only log next to checkpoint_file
+        (tracts_identified.log.jsonl), one line per identified row. A rerun
+        after a crash skips every row already in the log. On completion the
+        full table is written to checkpoint_file and the log is removed.
+
+        Args:
+            df: DataFrame with dispensary coordinates
+            lat_col: Name of latitude column
+            lon_col: Name of longitude column
+            checkpoint_file: Output CSV (its .log.jsonl holds in-progress results)
+            checkpoint_interval: fsync the log every N records
+            max_workers: Concurrent lookups (1 = serial)
+
+        Returns:
+            DataFrame with added census tract columns:
+            - census_state_fips
+            - census_county_fips
+            - census_tract_fips
+            - census_geoid
+            - census_tract_name
+            - census_tract_error (bool flag)
+        """
+        return run_sync(self.abatch_identify_tracts(
+            df, lat_col, lon_col, checkpoint_file, checkpoint_interval, max_workers
+        ))
+
+
 # Module test
 if __name__ == "__main__":
     # Test with sample coordinates
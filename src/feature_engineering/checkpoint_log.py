@@ -0,0 +1,137 @@
+"""
+Append-Only Checkpoint Log
+
+Crash-safe progress record for the census batch jobs (tract identification,
+ACS collection), replacing periodic rewrites of the whole result CSV.
+
+Each completed unit of work is appended as one JSON line
+{"key": ..., "record": {...}}, so checkpointing costs O(1) per row instead of
+O(rows so far). On restart the log is read once into a dict and completed
+keys are skipped. A line torn by a crash mid-write is dropped (and trimmed
+from the file); later lines for the same key replace earlier ones.
+
+When the job finishes, the caller builds its final table from the records,
+writes it with write_csv_atomic(), and discard()s the log.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import json
+import os
+import logging
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, ItemsView
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointLog:
+    """
+    JSON-lines log of completed work keyed by row identity.
+
+    Attributes:
+        path (Path): Log file
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a log, loading whatever an earlier (possibly crashed) run recorded.
+
+        Args:
+            path: Log file (created on first append)
+        """
+        self.path = Path(path)
+        self._records: Dict[str, Any] = {}
+        self._file = None
+        self._read()
+
+    def _read(self) -> None:
+        if not self.path.exists():
+            return
+
+        good_end = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # torn final line from an interrupted write
+                try:
+                    entry = json.loads(line)
+                    self._records[entry['key']] = entry['record']
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable line in checkpoint log {self.path}")
+                good_end += len(line)
+
+        if good_end < self.path.stat().st_size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(good_end)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Record logged for a key."""
+        return self._records.get(key, default)
+
+    def items(self) -> ItemsView[str, Any]:
+        """(key, record) pairs, latest record per key."""
+        return self._records.items()
+
+    def append(self, key: str, record: Any) -> None:
+        """
+        Record a completed unit of work.
+
+        The line reaches the OS immediately; call flush() to make it durable
+        against power loss as well.
+
+        Args:
+            key: Row identity
+            record: JSON-serializable result
+        """
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps({'key': key, 'record': record}) + '\n')
+        self._file.flush()
+        self._records[key] = record
+
+    def flush(self) -> None:
+        """fsync appended lines to disk."""
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Flush and close the file (records stay readable)."""
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Close and delete the log once its results have been compacted."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> 'CheckpointLog':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def checkpoint_log_path(output_file: str) -> Path:
+    """Log file kept next to a batch job's output CSV (foo.csv -> foo.log.jsonl)."""
+    return Path(output_file).with_suffix('.log.jsonl')
+
+
+def write_csv_atomic(frame: pd.DataFrame, path: str, index: bool = False) -> None:
+    """Write a CSV via a temporary file so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    frame.to_csv(tmp_path, index=index)
+    tmp_path.replace(path)
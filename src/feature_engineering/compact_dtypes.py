@@ -0,0 +1,105 @@
+"""
+Compact Column Layout
+
+Downcasts the loader's census and dispensary tables to the smallest dtypes
+that hold their values:
+- GEOID columns become int64 keys (TractTable lookups accept either form)
+- int64 columns that fit become int32 (FIPS codes, counts)
+- float columns become float32 (exact for integers below 2**24, about seven
+  significant digits otherwise), except coordinates, which stay float64 for
+  the distance kernels
+- Boolean flags become bool, or category when some values are missing
+- Low-cardinality string columns (e.g. state) become category
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Iterable
+
+try:
+    from .gazetteer_index import geoid_keys
+except ImportError:
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent))
+    from gazetteer_index import geoid_keys
+
+# Columns kept at full precision
+COORDINATE_COLUMNS = ('latitude', 'longitude')
+
+# Columns holding 11-digit tract GEOIDs
+GEOID_COLUMNS = ('census_geoid',)
+
+# String columns with at most this share of distinct values become categorical
+CATEGORY_MAX_UNIQUE_RATIO = 0.05
+
+_INT32 = np.iinfo(np.int32)
+
+
+def _fits_int32(values: np.ndarray) -> bool:
+    return len(values) == 0 or (values.min() >= _INT32.min and values.max() <= _INT32.max)
+
+
+def compact_column(series: pd.Series) -> pd.Series:
+    """
+    Smallest safe dtype for one non-coordinate, non-GEOID column.
+
+    Args:
+        series (Series): Column values
+
+    Returns:
+        Series: Downcast column (the input itself if nothing applies)
+    """
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(dtype):
+        values = series.to_numpy()
+        return series.astype(np.int32) if _fits_int32(values) else series
+
+    if pd.api.types.is_float_dtype(dtype):
+        return series.astype(np.float32)
+
+    if dtype == object:
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred == 'boolean':
+            return series.astype(bool) if series.notna().all() else series.astype('category')
+        if inferred == 'string' and series.nunique() <= max(1, CATEGORY_MAX_UNIQUE_RATIO * len(series)):
+            return series.astype('category')
+
+    return series
+
+
+def compact_frame(frame: pd.DataFrame, keep: Iterable[str] = COORDINATE_COLUMNS) -> pd.DataFrame:
+    """
+    Downcast every column of a table.
+
+    Args:
+        frame (DataFrame): Loaded table
+        keep (iterable): Columns to leave untouched
+
+    Returns:
+        DataFrame: New frame with compact dtypes (same index and column order)
+    """
+    keep = set(keep)
+    columns = {}
+
+    for name, series in frame.items():
+        if name in keep:
+            columns[name] = series
+        elif name in GEOID_COLUMNS:
+            columns[name] = pd.Series(geoid_keys(series), index=frame.index, name=name)
+        else:
+            columns[name] = compact_column(series)
+
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def memory_bytes(frame: pd.DataFrame) -> int:
+    """Resident size of a frame including its index and object payloads."""
+    return int(frame.memory_usage(index=True, deep=True).sum())
@@ -2,7 +2,7 @@
 Competitive Feature Engineering Module
 
 Calculates competitive metrics for dispensaries including:
-- Multi-radius competitor counts (1, 3, 5, 10, 20 miles)
+- Multi-radius competitor counts (configurable radii, default 1, 3, 5, 10, 20 miles)
 - Distance-weighted competition scores
 - Market saturation metrics (dispensaries per capita)
 - Demographic interaction features
@@ -17,6 +17,15 @@ from typing import Dict, List, Tuple
 import logging
 from geopy.distance import geodesic
 
+try:
+    from .site_context import cumulative_within_blocks, validate_radii
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent))
+    from site_context import cumulative_within_blocks, validate_radii
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,18 +34,27 @@ class CompetitiveFeatureEngineer:
     Engineer competitive features for dispensary prediction model.
 
     Features created:
-    1. Multi-radius competitor counts (1, 3, 5, 10, 20 miles)
+    1. Multi-radius competitor counts (default 1, 3, 5, 10, 20 miles)
     2. Distance-weighted competition scores
     3. Market saturation (competitors per 100k population)
     4. Demographic interactions (affluent market size, educated urban markets, etc.)
     """
 
-    # Competition analysis radii (miles)
+    # Default competition analysis radii (miles)
     RADII = [1, 3, 5, 10, 20]
 
-    def __init__(self):
-        """Initialize the CompetitiveFeatureEngineer."""
-        logger.info("CompetitiveFeatureEngineer initialized")
+    def __init__(self, radii: List[float] = None):
+        """
+        Initialize the CompetitiveFeatureEngineer.
+
+        Args:
+            radii: Competition analysis radii in miles (e.g. a dense 1..30 ladder).
+                Default: RADII.
+        """
+        if radii is not None:
+            self.RADII = validate_radii(radii)
+
+        logger.info(f"CompetitiveFeatureEngineer initialized (radii: {self.RADII})")
 
     def calculate_distance_matrix(self, df: pd.DataFrame) -> np.ndarray:
         """
@@ -87,12 +105,15 @@ class CompetitiveFeatureEngineer:
 
         logger.info("Calculating multi-radius competitor counts")
 
-        for radius in self.RADII:
+        # Count dispensaries strictly within each radius of each row in one pass
+        # over the matrix (cost is independent of the number of radii)
+        within = cumulative_within_blocks(distances, self.RADII, inclusive=False)
+
+        for i, radius in enumerate(self.RADII):
             col_name = f'competitors_{radius}mi'
 
-            # Count competitors within radius (excluding self)
             # Each row counts dispensaries within radius of that dispensary
-            counts = (distances < radius).sum(axis=1) - 1  # -1 to exclude self
+            counts = within[:, i] - 1  # -1 to exclude self
 
             df[col_name] = counts
 
@@ -6,7 +6,7 @@ This eliminates the need for users to manually input population, competition, an
 demographic data - the system calculates everything automatically.
 
 Key Features:
-- Population calculation at 1, 3, 5, 10, 20 mile radii
+- Population calculation at configurable radii (default 1, 3, 5, 10, 20 miles)
 - Competitor counts at same radii
 - Distance-weighted competition score
 - Census tract matching and demographic extraction
@@ -17,27 +17,40 @@ Author: Multi-State Dispensary Model - Phase 2 CLI Automation
 Date: October 2025
 """
 
+import asyncio
+import threading
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple, Optional
-from geopy.distance import geodesic
+from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
 try:
+    from ..instrumentation import profiler
     from .data_loader import MultiStateDataLoader
     from .census_tract_identifier import CensusTractIdentifier
     from .acs_data_collector import ACSDataCollector
+    from .site_context import SiteDistanceContext, aggregate_distance_blocks, column_rows, validate_radii
+    from .distance_kernel import pairwise_site_distances_miles
+    from .gazetteer_index import get_gazetteer_index
+    from .offline_tract_resolver import OfflineTractResolver
     from .exceptions import DataNotFoundError, InvalidStateError, InvalidCoordinatesError
 except ImportError:
     # Allow running as standalone script
     import sys
-    from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent))
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from instrumentation import profiler
     from data_loader import MultiStateDataLoader
     from census_tract_identifier import CensusTractIdentifier
     from acs_data_collector import ACSDataCollector
+    from site_context import SiteDistanceContext, aggregate_distance_blocks, column_rows, validate_radii
+    from distance_kernel import pairwise_site_distances_miles
+    from gazetteer_index import get_gazetteer_index
+    from offline_tract_resolver import OfflineTractResolver
     from exceptions import DataNotFoundError, InvalidStateError, InvalidCoordinatesError
 
 
@@ -63,37 +76,84 @@ class CoordinateFeatureCalculator:
     - Users must know when data is missing
     """
 
-    # Analysis radii in miles
+    # Default analysis radii in miles (override per model artifact via __init__)
     RADII = [1, 3, 5, 10, 20]
 
+    # Dispensaries closer than this are treated as the site itself
+    SELF_EXCLUSION_MILES = 0.1
+
+    # Demographic fields returned by match_census_tract()
+    DEMOGRAPHIC_FEATURES = [
+        'census_geoid', 'median_age', 'median_household_income', 'per_capita_income',
+        'population_density', 'tract_area_sqm', 'total_population', 'total_pop_25_plus',
+        'bachelors_degree', 'masters_degree', 'professional_degree', 'doctorate_degree'
+    ]
+
+    # How far (miles) a site can be nudged before its cached context is rebuilt
+    WHAT_IF_SEARCH_PADDING_MILES = 1.0
+
+    # Site contexts kept for recalculate_moved_site()
+    WHAT_IF_CACHE_SIZE = 32
+
+    # Approximate working-set bytes per (site, target) pair in batch distance blocks
+    BATCH_BYTES_PER_PAIR = 40
+
     # State median square footages (for when user doesn't provide)
     STATE_MEDIAN_SQ_FT = {
         'FL': 3500,  # Median FL dispensary size from training data
         'PA': 4000   # Median PA dispensary size from training data
     }
 
-    def __init__(self, data_loader: MultiStateDataLoader = None):
+    def __init__(
+        self,
+        data_loader: MultiStateDataLoader = None,
+        radii: Optional[List[float]] = None,
+        tract_resolver: Optional[OfflineTractResolver] = None,
+        remote_tract_fallback: bool = True,
+        cache_dir: str = "data/census/cache"
+    ):
         """
         Initialize coordinate feature calculator.
 
         Args:
             data_loader (MultiStateDataLoader, optional): Pre-loaded data loader.
                 If None, creates new instance (loads 7,624 census tracts + 741 dispensaries).
+            radii (list, optional): Analysis radii in miles (e.g. a model artifact's
+                'radii' entry, or a dense ladder such as 1..30). Default: RADII.
+            tract_resolver (OfflineTractResolver, optional): Offline point-in-polygon
+                tract lookup. Default: a resolver over locally persisted TIGER polygons
+                (if shapely is installed).
+            remote_tract_fallback (bool): Use the Census Geocoding API when offline
+                resolution fails or is unavailable (default: True)
+            cache_dir (str): Directory for geocoding/ACS caches and persisted
+                tract polygons
+
+        Raises:
+            ValueError: If radii is empty or contains non-positive values
         """
         print("🔄 Initializing Coordinate Feature Calculator...")
 
+        if radii is not None:
+            self.RADII = validate_radii(radii)
+
         # Load data if not provided
         if data_loader is None:
             self.data_loader = MultiStateDataLoader()
         else:
             self.data_loader = data_loader
 
+        # Offline tract identification first, Census Geocoding API as fallback
+        if tract_resolver is None and OfflineTractResolver.available():
+            tract_resolver = OfflineTractResolver(cache_dir=cache_dir)
+        self.tract_resolver = tract_resolver
+        self.remote_tract_fallback = remote_tract_fallback
+
         # Initialize Census API wrapper
-        self.census_identifier = CensusTractIdentifier()
+        self.census_identifier = CensusTractIdentifier(cache_dir=cache_dir)
 
         # Initialize ACS data collector for missing tracts
         try:
-            self.acs_collector = ACSDataCollector()
+            self.acs_collector = ACSDataCollector(cache_dir=cache_dir)
         except ValueError:
             # Census API key not available - will fail gracefully when needed
             self.acs_collector = None
@@ -101,6 +161,10 @@ class CoordinateFeatureCalculator:
         # Cache for dynamically fetched tracts
         self.fetched_tracts_cache = {}
 
+        # Padded site contexts kept for recalculate_moved_site(), most recent last
+        self._what_if_contexts = OrderedDict()
+        self._what_if_lock = threading.Lock()
+
         print("✅ Feature calculator ready\n")
 
     def validate_coordinates(self, state: str, latitude: float, longitude: float) -> None:
@@ -143,22 +207,76 @@ class CoordinateFeatureCalculator:
                 f"Verify coordinates are in {state}."
             )
 
+    def build_site_context(
+        self,
+        state: str,
+        latitude: float,
+        longitude: float,
+        weighted_radius: float = 20,
+        search_padding: float = 0.0
+    ) -> SiteDistanceContext:
+        """
+        Compute distances from a site to every tract and dispensary once.
+
+        The returned context is shared by the population, competitor,
+        normalized-competition and weighted-competition calculations so that
+        one site costs exactly one distance pass per dataset. The loader's
+        spatial indexes limit that pass to rows within the largest radius.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            latitude (float): Latitude in decimal degrees
+            longitude (float): Longitude in decimal degrees
+            weighted_radius (float): Radius for the weighted competition score
+            search_padding (float): Extra candidate miles beyond the largest radius,
+                so the context can later be moved() that far
+
+        Returns:
+            SiteDistanceContext: Per-site distance context
+
+        Raises:
+            InvalidStateError: If state is not FL or PA
+            InvalidCoordinatesError: If coordinates are invalid
+        """
+        # Validate inputs
+        state = state.upper().strip()
+        self.validate_coordinates(state, latitude, longitude)
+
+        # Get dispensary and census data for state, plus their spatial indexes
+        dispensaries_df, census_df, dispensary_index, tract_index = self.data_loader.get_state_view(state)
+
+        with profiler.timer('distance_computation'):
+            return SiteDistanceContext.build(
+                state, latitude, longitude,
+                dispensaries_df, census_df,
+                radii=self.RADII,
+                self_exclusion_miles=self.SELF_EXCLUSION_MILES,
+                weighted_radius=weighted_radius,
+                tract_index=tract_index,
+                dispensary_index=dispensary_index,
+                search_padding=search_padding
+            )
+
     def calculate_population_multi_radius(
         self,
         state: str,
         latitude: float,
-        longitude: float
+        longitude: float,
+        context: Optional[SiteDistanceContext] = None
     ) -> Dict[str, int]:
         """
-        Calculate total population within 1, 3, 5, 10, and 20 mile radii.
+        Calculate total population within each analysis radius (default 1, 3, 5, 10, 20 mi).
 
         Sums population from all census tracts whose centroids fall within
-        each radius. Uses geodesic (Haversine) distance for accuracy.
+        each radius. Uses vectorized great-circle distances, refined to exact
+        geodesic distances for tracts near a radius boundary.
 
         Args:
             state (str): State code ('FL' or 'PA')
             latitude (float): Latitude in decimal degrees
             longitude (float): Longitude in decimal degrees
+            context (SiteDistanceContext, optional): Precomputed site context.
+                If None, one is built for this call.
 
         Returns:
             dict: {
@@ -173,43 +291,20 @@ class CoordinateFeatureCalculator:
             InvalidStateError: If state is not FL or PA
             InvalidCoordinatesError: If coordinates are invalid
         """
-        # Validate inputs
-        state = state.upper().strip()
-        self.validate_coordinates(state, latitude, longitude)
-
-        # Get census data for state
-        _, census_df = self.data_loader.get_state_data(state)
-
-        # Calculate distance from target coordinates to each census tract
-        target_coords = (latitude, longitude)
-
-        # Calculate distances to all tracts
-        distances = []
-        for _, tract in census_df.iterrows():
-            tract_coords = (tract['latitude'], tract['longitude'])
-            distance_miles = geodesic(target_coords, tract_coords).miles
-            distances.append(distance_miles)
-
-        census_df = census_df.copy()
-        census_df['distance_miles'] = distances
+        if context is None:
+            context = self.build_site_context(state, latitude, longitude)
 
-        # Calculate population within each radius
-        populations = {}
-        for radius in self.RADII:
-            tracts_within_radius = census_df[census_df['distance_miles'] <= radius]
-            total_pop = tracts_within_radius['total_population'].sum()
-            populations[f'pop_{radius}mi'] = int(total_pop)
-
-        return populations
+        return context.populations()
 
     def calculate_competitors_multi_radius(
         self,
         state: str,
         latitude: float,
-        longitude: float
+        longitude: float,
+        context: Optional[SiteDistanceContext] = None
     ) -> Dict[str, int]:
         """
-        Count competitor dispensaries within 1, 3, 5, 10, and 20 mile radii.
+        Count competitor dispensaries within each analysis radius (default 1, 3, 5, 10, 20 mi).
 
         Counts verified dispensary locations within each radius.
         Excludes self (any dispensary within 0.1 miles is considered same location).
@@ -218,6 +313,8 @@ class CoordinateFeatureCalculator:
             state (str): State code ('FL' or 'PA')
             latitude (float): Latitude in decimal degrees
             longitude (float): Longitude in decimal degrees
+            context (SiteDistanceContext, optional): Precomputed site context.
+                If None, one is built for this call.
 
         Returns:
             dict: {
@@ -237,58 +334,18 @@ class CoordinateFeatureCalculator:
             InvalidStateError: If state is not FL or PA
             InvalidCoordinatesError: If coordinates are invalid
         """
-        # Validate inputs
-        state = state.upper().strip()
-        self.validate_coordinates(state, latitude, longitude)
-
-        # Get dispensary and census data for state
-        dispensaries_df, _ = self.data_loader.get_state_data(state)
-
-        # Calculate distance from target coordinates to each dispensary
-        target_coords = (latitude, longitude)
-
-        distances = []
-        for _, disp in dispensaries_df.iterrows():
-            disp_coords = (disp['latitude'], disp['longitude'])
-            distance_miles = geodesic(target_coords, disp_coords).miles
-            distances.append(distance_miles)
-
-        dispensaries_df = dispensaries_df.copy()
-        dispensaries_df['distance_miles'] = distances
+        if context is None:
+            context = self.build_site_context(state, latitude, longitude)
 
-        # Exclude self (within 0.1 miles)
-        dispensaries_df = dispensaries_df[dispensaries_df['distance_miles'] > 0.1]
-
-        # Count competitors within each radius
-        competitors = {}
-
-        # First get populations for normalization
-        populations = self.calculate_population_multi_radius(state, latitude, longitude)
-
-        for radius in self.RADII:
-            # Count competitors
-            count = len(dispensaries_df[dispensaries_df['distance_miles'] <= radius])
-            competitors[f'competitors_{radius}mi'] = count
-
-            # Calculate competitors per 100k population
-            pop_key = f'pop_{radius}mi'
-            population = populations[pop_key]
-
-            if population > 0:
-                per_100k = (count / population) * 100000
-            else:
-                per_100k = 0.0
-
-            competitors[f'competitors_per_100k_{radius}mi'] = per_100k
-
-        return competitors
+        return context.competitors()
 
     def calculate_competition_weighted(
         self,
         state: str,
         latitude: float,
         longitude: float,
-        radius: float = 20
+        radius: float = 20,
+        context: Optional[SiteDistanceContext] = None
     ) -> float:
         """
         Calculate distance-weighted competition score.
@@ -303,6 +360,9 @@ class CoordinateFeatureCalculator:
             latitude (float): Latitude in decimal degrees
             longitude (float): Longitude in decimal degrees
             radius (float): Analysis radius in miles (default: 20)
+            context (SiteDistanceContext, optional): Precomputed site context.
+                If None (or built for a smaller weighted radius), one is built
+                for this call.
 
         Returns:
             float: Distance-weighted competition score
@@ -311,38 +371,10 @@ class CoordinateFeatureCalculator:
             InvalidStateError: If state is not FL or PA
             InvalidCoordinatesError: If coordinates are invalid
         """
-        # Validate inputs
-        state = state.upper().strip()
-        self.validate_coordinates(state, latitude, longitude)
-
-        # Get dispensary data for state
-        dispensaries_df, _ = self.data_loader.get_state_data(state)
+        if context is None or context.weighted_radius < radius:
+            context = self.build_site_context(state, latitude, longitude, weighted_radius=radius)
 
-        # Calculate distance from target coordinates to each dispensary
-        target_coords = (latitude, longitude)
-
-        distances = []
-        for _, disp in dispensaries_df.iterrows():
-            disp_coords = (disp['latitude'], disp['longitude'])
-            distance_miles = geodesic(target_coords, disp_coords).miles
-            distances.append(distance_miles)
-
-        dispensaries_df = dispensaries_df.copy()
-        dispensaries_df['distance_miles'] = distances
-
-        # Exclude self and filter to radius
-        dispensaries_df = dispensaries_df[
-            (dispensaries_df['distance_miles'] > 0.1) &
-            (dispensaries_df['distance_miles'] <= radius)
-        ]
-
-        # Calculate weighted score
-        if len(dispensaries_df) == 0:
-            return 0.0
-
-        weighted_score = sum(1 / (d + 0.01) for d in dispensaries_df['distance_miles'])
-
-        return weighted_score
+        return context.competition_weighted(radius)
 
     def _safe_float(self, value: any, default: float = 0.0) -> float:
         """
@@ -443,17 +475,17 @@ class CoordinateFeatureCalculator:
         # Cache for future use (e.g., population calculations)
         self.fetched_tracts_cache[geoid] = tract
 
-        # Add to state census data for subsequent operations
-        if state.upper() == 'FL':
-            self.data_loader.fl_census = pd.concat([self.data_loader.fl_census, tract.to_frame().T], ignore_index=True)
-        elif state.upper() == 'PA':
-            self.data_loader.pa_census = pd.concat([self.data_loader.pa_census, tract.to_frame().T], ignore_index=True)
+        # Add to state census data for subsequent operations (buffered, merged in bulk)
+        self.data_loader.append_tract(state, tract)
 
         return tract
 
     def _get_tract_centroid(self, geoid: str, state: str) -> Optional[Dict]:
         """
-        Get tract centroid coordinates from Census Gazetteer file.
+        Get tract centroid coordinates from the shared Census Gazetteer index.
+
+        The index is parsed once per process (see gazetteer_index), so this is
+        a binary search rather than a file read.
 
         Args:
             geoid (str): 11-digit census tract GEOID
@@ -462,62 +494,70 @@ class CoordinateFeatureCalculator:
         Returns:
             dict: {'latitude': float, 'longitude': float, 'area_sqm': float} or None
         """
-        # Map state to FIPS
-        state_fips_map = {'FL': '12', 'PA': '42'}
-        state_fips = state_fips_map.get(state.upper())
-
-        if state_fips is None:
+        try:
+            index = get_gazetteer_index(self.data_loader.project_root, state)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"      ⚠️  Error reading Gazetteer: {e}")
             return None
 
-        # Load Gazetteer file
-        gazetteer_file = self.data_loader.project_root / "data" / "census" / "gazeteer" / f"2020_Gaz_tracts_{state_fips}.txt"
-
-        if not gazetteer_file.exists():
+        if index is None:
             return None
 
-        try:
-            # Read Gazetteer file
-            gaz_df = pd.read_csv(gazetteer_file, sep='\t', dtype={'GEOID': str})
+        # ALAND (area_sqm) is in square meters
+        return index.lookup(geoid)
 
-            # Strip whitespace from column names (Gazetteer files have trailing spaces)
-            gaz_df.columns = gaz_df.columns.str.strip()
+    def identify_tract(self, state: str, latitude: float, longitude: float) -> Dict:
+        """
+        Identify the census tract containing a point.
 
-            # Find tract
-            tract_row = gaz_df[gaz_df['GEOID'] == geoid]
+        Tries the offline resolver first (no network); falls back to the
+        Census Geocoding API if offline resolution fails and
+        remote_tract_fallback is enabled.
 
-            if len(tract_row) == 0:
-                return None
+        Args:
+            state (str): State code ('FL' or 'PA')
+            latitude (float): Latitude in decimal degrees
+            longitude (float): Longitude in decimal degrees
 
-            tract = tract_row.iloc[0]
+        Returns:
+            dict: Tract result in CensusTractIdentifier.get_tract_from_coordinates() format
+        """
+        tract_info = None
 
-            # Extract centroid and area
-            # ALAND is in square meters
-            return {
-                'latitude': float(tract['INTPTLAT']),
-                'longitude': float(tract['INTPTLONG']),
-                'area_sqm': float(tract['ALAND']) if 'ALAND' in tract else 0
-            }
+        if self.tract_resolver is not None:
+            with profiler.timer('tract_lookup.offline'):
+                tract_info = self.tract_resolver.resolve(latitude, longitude, state)
+            if tract_info['success'] or not self.remote_tract_fallback:
+                profiler.count('tract_lookup.offline_hit' if tract_info['success'] else 'tract_lookup.failed')
+                return tract_info
 
-        except Exception as e:
-            print(f"      ⚠️  Error reading Gazetteer: {e}")
-            return None
+        if self.remote_tract_fallback:
+            with profiler.timer('tract_lookup.remote'):
+                return self.census_identifier.get_tract_from_coordinates(latitude, longitude)
+
+        return tract_info or OfflineTractResolver.failure_result(
+            'No offline tract resolver configured and remote fallback disabled'
+        )
 
     def match_census_tract(
         self,
         state: str,
         latitude: float,
-        longitude: float
+        longitude: float,
+        verbose: bool = True
     ) -> Dict[str, any]:
         """
         Find census tract for coordinates and extract demographic features.
 
-        Uses Census Geocoding API to identify the exact census tract containing
-        the coordinates, then looks up demographics from loaded census data.
+        Identifies the census tract containing the coordinates (offline
+        point-in-polygon first, Census Geocoding API as fallback), then looks
+        up demographics from loaded census data.
 
         Args:
             state (str): State code ('FL' or 'PA')
             latitude (float): Latitude in decimal degrees
             longitude (float): Longitude in decimal degrees
+            verbose (bool): Print progress messages (default: True)
 
         Returns:
             dict: {
@@ -540,9 +580,9 @@ class CoordinateFeatureCalculator:
         state = state.upper().strip()
         self.validate_coordinates(state, latitude, longitude)
 
-        # Call Census Geocoding API
-        print(f"  📍 Looking up census tract for ({latitude:.4f}, {longitude:.4f})...")
-        tract_info = self.census_identifier.get_tract_from_coordinates(latitude, longitude)
+        if verbose:
+            print(f"  📍 Looking up census tract for ({latitude:.4f}, {longitude:.4f})...")
+        tract_info = self.identify_tract(state, latitude, longitude)
 
         if not tract_info['success']:
             raise DataNotFoundError(
@@ -557,16 +597,17 @@ class CoordinateFeatureCalculator:
             )
 
         geoid = tract_info['geoid']
-        print(f"    ✓ Found census tract: {geoid}")
+        if verbose:
+            print(f"    ✓ Found census tract: {geoid}")
 
-        # Look up demographics in loaded census data
-        _, census_df = self.data_loader.get_state_data(state)
+        # Look up demographics in loaded census data (GEOID hash index)
+        tract = self.data_loader.find_tract(state, geoid)
+        profiler.count('tract_table.miss' if tract is None else 'tract_table.hit')
 
-        tract_data = census_df[census_df['census_geoid'] == geoid]
-
-        if len(tract_data) == 0:
+        if tract is None:
             # Tract not in database - fetch on-the-fly
-            print(f"    ⚠️  Tract {geoid} not in database, fetching from Census API...")
+            if verbose:
+                print(f"    ⚠️  Tract {geoid} not in database, fetching from Census API...")
 
             if self.acs_collector is None:
                 raise DataNotFoundError(
@@ -586,9 +627,8 @@ class CoordinateFeatureCalculator:
                 )
 
             tract = tract_fetched
-            print(f"    ✓ Demographics fetched from Census API")
-        else:
-            tract = tract_data.iloc[0]
+            if verbose:
+                print(f"    ✓ Demographics fetched from Census API")
 
         # Extract demographic features
         # Return raw census features as expected by feature_validator
@@ -609,16 +649,184 @@ class CoordinateFeatureCalculator:
             'doctorate_degree': self._safe_int(tract['doctorate_degree'], 0)
         }
 
-        print(f"    ✓ Demographics extracted")
+        if verbose:
+            print(f"    ✓ Demographics extracted")
 
         return demographics
 
+    def _tract_count(self, state: str) -> int:
+        """Number of census tracts held for a state, including buffered appends."""
+        return len(self.data_loader.get_tract_table(state))
+
+    def _tract_stamp(self, state: str) -> Tuple[int, int]:
+        """Identity and size of a state's tract table (changes when tracts are added or the state is reloaded)."""
+        table = self.data_loader.get_tract_table(state)
+        return table.uid, len(table)
+
+    def _remember_context(self, context: SiteDistanceContext, stamp: Tuple[int, int]) -> None:
+        """Keep a site's padded distance context for recalculate_moved_site()."""
+        with self._what_if_lock:
+            key = (context.state, float(context.latitude), float(context.longitude))
+            self._what_if_contexts[key] = (context, stamp)
+            self._what_if_contexts.move_to_end(key)
+            while len(self._what_if_contexts) > self.WHAT_IF_CACHE_SIZE:
+                self._what_if_contexts.popitem(last=False)
+
+    def _recall_context(self, state: str, latitude: float, longitude: float) -> Optional[SiteDistanceContext]:
+        """Cached context for a site, if it is still valid for the state's tract table."""
+        with self._what_if_lock:
+            entry = self._what_if_contexts.get((state, float(latitude), float(longitude)))
+
+        if entry is None or entry[1] != self._tract_stamp(state):
+            return None
+        return entry[0]
+
+    def _distance_features_from_context(self, context: SiteDistanceContext) -> Dict[str, any]:
+        """Population and competition features of one site context."""
+        with profiler.timer('radius_aggregation'):
+            return {
+                'populations': context.populations(),
+                'competitors': context.competitors(),
+                'competition_weighted': context.competition_weighted(20)
+            }
+
+    def _calculate_distance_features(self, state: str, latitude: float, longitude: float) -> Dict[str, any]:
+        """
+        CPU-bound stage of calculate_all_features(): population and competition
+        features from one site context.
+
+        The context is built with WHAT_IF_SEARCH_PADDING_MILES of extra
+        candidates and remembered, so the site can later be nudged with
+        recalculate_moved_site() without a full recomputation.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            latitude (float): Latitude in decimal degrees
+            longitude (float): Longitude in decimal degrees
+
+        Returns:
+            dict: {'populations': dict, 'competitors': dict, 'competition_weighted': float}
+        """
+        stamp = self._tract_stamp(state)
+        context = self.build_site_context(
+            state, latitude, longitude, search_padding=self.WHAT_IF_SEARCH_PADDING_MILES
+        )
+        self._remember_context(context, stamp)
+        return self._distance_features_from_context(context)
+
+    def _gather_site_data(
+        self,
+        state: str,
+        latitude: float,
+        longitude: float,
+        concurrent: bool = True,
+        verbose: bool = True
+    ) -> Tuple[Dict[str, any], Dict[str, any]]:
+        """
+        Run the network stage (tract identification + demographics) and the
+        distance stage, overlapping them on a worker thread if concurrent.
+
+        The distance stage only depends on the network stage when the site's
+        tract was missing and had to be fetched into the database; in that
+        case the distance features are recomputed so results are identical
+        to the sequential order.
+
+        Args:
+            state (str): State code ('FL' or 'PA'), already validated
+            latitude (float): Latitude in decimal degrees
+            longitude (float): Longitude in decimal degrees
+            concurrent (bool): Overlap the two stages (default: True)
+            verbose (bool): Print tract lookup progress (default: True)
+
+        Returns:
+            Tuple[dict, dict]: (demographics, distance features)
+        """
+        tract_count = self._tract_count(state)
+
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                network = pool.submit(self.match_census_tract, state, latitude, longitude, verbose)
+                distances = self._calculate_distance_features(state, latitude, longitude)
+                demographics = network.result()
+        else:
+            # Match census tract first (this may fetch missing tract and add it to database)
+            demographics = self.match_census_tract(state, latitude, longitude, verbose)
+            return demographics, self._calculate_distance_features(state, latitude, longitude)
+
+        if self._tract_count(state) != tract_count:
+            # A missing tract was fetched - include it in the population features
+            distances = self._calculate_distance_features(state, latitude, longitude)
+
+        return demographics, distances
+
+    def _validate_site(self, state: str, latitude: float, longitude: float) -> str:
+        """
+        Normalize and validate a site's state code and coordinates.
+
+        Returns:
+            str: Normalized state code
+
+        Raises:
+            InvalidStateError: If state not supported
+            InvalidCoordinatesError: If coordinates invalid
+        """
+        state = state.upper().strip()
+        if state not in ['FL', 'PA']:
+            raise InvalidStateError(
+                f"State '{state}' is not supported. "
+                f"Model only supports FL (Florida) and PA (Pennsylvania)."
+            )
+
+        self.validate_coordinates(state, latitude, longitude)
+        return state
+
+    def _assemble_features(
+        self,
+        state: str,
+        latitude: float,
+        longitude: float,
+        sq_ft: float,
+        demographics: Dict[str, any],
+        distances: Dict[str, any]
+    ) -> Dict[str, any]:
+        """Combine site inputs and both stages into the base feature dict."""
+        populations = distances['populations']
+        competitors = distances['competitors']
+
+        all_features = {
+            # Core identifiers
+            'state': state,
+            'latitude': latitude,
+            'longitude': longitude,
+            'sq_ft': sq_ft,
+        }
+
+        # Population features (one per radius)
+        all_features.update({f'pop_{r}mi': populations[f'pop_{r}mi'] for r in self.RADII})
+
+        # Competition count features (one per radius)
+        all_features.update({f'competitors_{r}mi': competitors[f'competitors_{r}mi'] for r in self.RADII})
+
+        # Normalized competition features - NOT required by feature_validator
+        all_features.update({
+            f'competitors_per_100k_{r}mi': competitors[f'competitors_per_100k_{r}mi'] for r in self.RADII
+        })
+
+        # Weighted competition feature (1)
+        all_features['competition_weighted_20mi'] = distances['competition_weighted']
+
+        # Demographic features (11) - as required by feature_validator
+        all_features.update({name: demographics[name] for name in self.DEMOGRAPHIC_FEATURES})
+
+        return all_features
+
     def calculate_all_features(
         self,
         state: str,
         latitude: float,
         longitude: float,
-        sq_ft: Optional[float] = None
+        sq_ft: Optional[float] = None,
+        concurrent: bool = True
     ) -> Dict[str, any]:
         """
         Calculate all 23 base features from coordinates.
@@ -626,12 +834,18 @@ class CoordinateFeatureCalculator:
         This is the master method that generates everything needed for
         model prediction from just 3-4 user inputs.
 
+        The census tract lookup (geocoding and ACS I/O) runs on a worker
+        thread while the distance-based population and competition features
+        are calculated, so network latency is mostly hidden for uncached sites.
+
         Args:
             state (str): State code ('FL' or 'PA')
             latitude (float): Latitude in decimal degrees
             longitude (float): Longitude in decimal degrees
             sq_ft (float, optional): Store square footage.
                 If not provided, uses state median.
+            concurrent (bool): Overlap the network and distance stages
+                (default: True). If False, they run one after another.
 
         Returns:
             dict: All 23 base features ready for feature_validator:
@@ -651,42 +865,29 @@ class CoordinateFeatureCalculator:
         print(f"{'='*70}")
         print(f"Coordinates: ({latitude:.6f}, {longitude:.6f})")
 
-        # Validate state
-        state = state.upper().strip()
-        if state not in ['FL', 'PA']:
-            raise InvalidStateError(
-                f"State '{state}' is not supported. "
-                f"Model only supports FL (Florida) and PA (Pennsylvania)."
-            )
-
-        # Validate coordinates
-        self.validate_coordinates(state, latitude, longitude)
+        state = self._validate_site(state, latitude, longitude)
         print(f"✓ Coordinates validated")
 
-        # Match census tract first (this may fetch missing tract and add it to database)
-        # This ensures the tract is available for population calculations
-        print(f"\n🗺️  Identifying census tract...")
-        demographics = self.match_census_tract(state, latitude, longitude)
+        print(f"\n🗺️  Identifying census tract and calculating distance features...")
+        with profiler.timer('feature_calculation'):
+            demographics, distances = self._gather_site_data(state, latitude, longitude, concurrent=concurrent)
 
-        # Calculate population features (now with the fetched tract available)
+        # Population features
         print(f"\n📊 Calculating population features...")
-        populations = self.calculate_population_multi_radius(state, latitude, longitude)
         for radius in self.RADII:
-            pop = populations[f'pop_{radius}mi']
+            pop = distances['populations'][f'pop_{radius}mi']
             print(f"  • {radius}mi radius: {pop:,} people")
 
-        # Calculate competition features
+        # Competition features
         print(f"\n🏢 Calculating competition features...")
-        competitors = self.calculate_competitors_multi_radius(state, latitude, longitude)
         for radius in self.RADII:
-            count = competitors[f'competitors_{radius}mi']
-            per_100k = competitors[f'competitors_per_100k_{radius}mi']
+            count = distances['competitors'][f'competitors_{radius}mi']
+            per_100k = distances['competitors'][f'competitors_per_100k_{radius}mi']
             print(f"  • {radius}mi radius: {count} competitors ({per_100k:.2f} per 100k)")
 
-        # Calculate weighted competition
+        # Weighted competition
         print(f"\n⚖️  Calculating distance-weighted competition...")
-        competition_weighted = self.calculate_competition_weighted(state, latitude, longitude, radius=20)
-        print(f"  • Weighted score (20mi): {competition_weighted:.4f}")
+        print(f"  • Weighted score (20mi): {distances['competition_weighted']:.4f}")
 
         # Print demographics summary
         print(f"\n📍 Census tract demographics...")
@@ -704,65 +905,403 @@ class CoordinateFeatureCalculator:
         else:
             print(f"\n📐 Using provided square footage: {sq_ft:,} sq ft")
 
-        # Combine all features
-        all_features = {
-            # Core identifiers
-            'state': state,
-            'latitude': latitude,
-            'longitude': longitude,
-            'sq_ft': sq_ft,
-
-            # Population features (5)
-            'pop_1mi': populations['pop_1mi'],
-            'pop_3mi': populations['pop_3mi'],
-            'pop_5mi': populations['pop_5mi'],
-            'pop_10mi': populations['pop_10mi'],
-            'pop_20mi': populations['pop_20mi'],
-
-            # Competition count features (5)
-            'competitors_1mi': competitors['competitors_1mi'],
-            'competitors_3mi': competitors['competitors_3mi'],
-            'competitors_5mi': competitors['competitors_5mi'],
-            'competitors_10mi': competitors['competitors_10mi'],
-            'competitors_20mi': competitors['competitors_20mi'],
-
-            # Normalized competition features (5) - NOT required by feature_validator
-            'competitors_per_100k_1mi': competitors['competitors_per_100k_1mi'],
-            'competitors_per_100k_3mi': competitors['competitors_per_100k_3mi'],
-            'competitors_per_100k_5mi': competitors['competitors_per_100k_5mi'],
-            'competitors_per_100k_10mi': competitors['competitors_per_100k_10mi'],
-            'competitors_per_100k_20mi': competitors['competitors_per_100k_20mi'],
-
-            # Weighted competition feature (1)
-            'competition_weighted_20mi': competition_weighted,
-
-            # Demographic features (11) - as required by feature_validator
-            'census_geoid': demographics['census_geoid'],
-            'median_age': demographics['median_age'],
-            'median_household_income': demographics['median_household_income'],
-            'per_capita_income': demographics['per_capita_income'],
-            'population_density': demographics['population_density'],
-            'tract_area_sqm': demographics['tract_area_sqm'],
-            'total_population': demographics['total_population'],
-            'total_pop_25_plus': demographics['total_pop_25_plus'],
-            'bachelors_degree': demographics['bachelors_degree'],
-            'masters_degree': demographics['masters_degree'],
-            'professional_degree': demographics['professional_degree'],
-            'doctorate_degree': demographics['doctorate_degree']
-        }
+        all_features = self._assemble_features(state, latitude, longitude, sq_ft, demographics, distances)
 
         print(f"\n{'='*70}")
         print(f"✅ Feature Calculation Complete")
         print(f"{'='*70}")
+        n_radii = len(self.RADII)
         print(f"Total features generated: {len(all_features)}")
-        print(f"  • Population features: 5")
-        print(f"  • Competition features: 11 (5 counts + 5 normalized + 1 weighted)")
-        print(f"  • Demographic features: 7")
+        print(f"  • Population features: {n_radii}")
+        print(f"  • Competition features: {2 * n_radii + 1} ({n_radii} counts + {n_radii} normalized + 1 weighted)")
+        print(f"  • Demographic features: {len(self.DEMOGRAPHIC_FEATURES)}")
         print(f"  • Store size: 1")
-        print(f"\nReady for feature_validator transformation (23 → 44 features)")
+        print(f"\nReady for feature_validator transformation")
 
         return all_features
 
+    async def calculate_all_features_async(
+        self,
+        state: str,
+        latitude: float,
+        longitude: float,
+        sq_ft: Optional[float] = None
+    ) -> Dict[str, any]:
+        """
+        Calculate all 23 base features without blocking an event loop.
+
+        Same result as calculate_all_features(), but quiet (no progress
+        output). The network stage and the distance stage each run in a
+        worker thread (asyncio.to_thread) and are awaited together, so a
+        service can serve other requests while both are in flight.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            latitude (float): Latitude in decimal degrees
+            longitude (float): Longitude in decimal degrees
+            sq_ft (float, optional): Store square footage.
+                If not provided, uses state median.
+
+        Returns:
+            dict: All base features (see calculate_all_features())
+
+        Raises:
+            DataNotFoundError: If required data unavailable
+            InvalidStateError: If state not supported
+            InvalidCoordinatesError: If coordinates invalid
+        """
+        state = self._validate_site(state, latitude, longitude)
+        tract_count = self._tract_count(state)
+
+        demographics, distances = await asyncio.gather(
+            asyncio.to_thread(self.match_census_tract, state, latitude, longitude, False),
+            asyncio.to_thread(self._calculate_distance_features, state, latitude, longitude)
+        )
+
+        if self._tract_count(state) != tract_count:
+            # A missing tract was fetched - include it in the population features
+            distances = await asyncio.to_thread(self._calculate_distance_features, state, latitude, longitude)
+
+        if sq_ft is None:
+            sq_ft = self.STATE_MEDIAN_SQ_FT[state]
+
+        return self._assemble_features(state, latitude, longitude, sq_ft, demographics, distances)
+
+
+    def recalculate_moved_site(
+        self,
+        previous: Dict[str, any],
+        latitude: float,
+        longitude: float,
+        sq_ft: Optional[float] = None
+    ) -> Dict[str, any]:
+        """
+        What-if: recalculate a site's features after nudging it to a new position.
+
+        Instead of a full calculate_all_features() call:
+        - The previous site's distance context (remembered when it was
+          calculated) is moved incrementally: only tracts in an annulus around
+          each radius boundary, as wide as the move, are recomputed. The
+          context is rebuilt once the accumulated movement exceeds
+          WHAT_IF_SEARCH_PADDING_MILES.
+        - The previous tract match (and demographics) is reused while the
+          new position is still inside the same tract polygon (needs the
+          offline tract resolver); otherwise the tract is identified again.
+
+        Results are the same as calculate_all_features() at the new position.
+        The returned features can themselves be passed as previous.
+
+        Args:
+            previous (dict): Features returned by calculate_all_features() or
+                recalculate_moved_site()
+            latitude (float): New latitude in decimal degrees
+            longitude (float): New longitude in decimal degrees
+            sq_ft (float, optional): Store square footage. Default: previous sq_ft.
+
+        Returns:
+            dict: All base features at the new position
+
+        Raises:
+            DataNotFoundError: If required data unavailable
+            InvalidStateError: If state not supported
+            InvalidCoordinatesError: If coordinates invalid
+        """
+        state = self._validate_site(previous['state'], latitude, longitude)
+
+        # Reuse the tract match while the site stays inside the same tract
+        inside = None
+        if self.tract_resolver is not None and previous.get('census_geoid'):
+            inside = self.tract_resolver.contains(previous['census_geoid'], latitude, longitude, state)
+
+        if inside:
+            profiler.count('what_if.tract_reused')
+            demographics = {name: previous[name] for name in self.DEMOGRAPHIC_FEATURES}
+        else:
+            demographics = self.match_census_tract(state, latitude, longitude, verbose=False)
+
+        # Checked after the tract match, which may have fetched a new tract
+        stamp = self._tract_stamp(state)
+        context = self._recall_context(state, previous['latitude'], previous['longitude'])
+        if context is not None:
+            dispensaries_df, census_df = self.data_loader.get_state_data(state)
+            with profiler.timer('what_if.incremental_update'):
+                context = context.moved(latitude, longitude, dispensaries_df, census_df)
+
+        if context is None:
+            profiler.count('what_if.context_rebuilt')
+            context = self.build_site_context(
+                state, latitude, longitude, search_padding=self.WHAT_IF_SEARCH_PADDING_MILES
+            )
+        self._remember_context(context, stamp)
+
+        if sq_ft is None:
+            sq_ft = previous.get('sq_ft', self.STATE_MEDIAN_SQ_FT[state])
+
+        return self._assemble_features(
+            state, latitude, longitude, sq_ft, demographics,
+            self._distance_features_from_context(context)
+        )
+
+    def _batch_chunk_size(self, n_targets: int, memory_budget_mb: float) -> int:
+        """
+        Number of sites per distance block that fits in the memory budget.
+
+        Args:
+            n_targets (int): Tracts plus dispensaries each site is measured against
+            memory_budget_mb (float): Working-set budget in megabytes
+
+        Returns:
+            int: Sites per block (at least 1)
+        """
+        budget_bytes = memory_budget_mb * 1024 * 1024
+        return max(1, int(budget_bytes // (self.BATCH_BYTES_PER_PAIR * max(n_targets, 1))))
+
+    def calculate_distance_features_block(
+        self,
+        state: str,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        memory_budget_mb: float = 256,
+        refine: bool = True,
+        weighted_radius: float = 20,
+        tract_positions: Optional[np.ndarray] = None,
+        dispensary_positions: Optional[np.ndarray] = None,
+        radii: Optional[List[float]] = None,
+        state_frames: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Population and competition features for many already-validated sites.
+
+        Distances are computed as site x tract and site x dispensary blocks,
+        with the number of sites per block sized to the memory budget.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            latitudes (ndarray): Site latitudes in decimal degrees
+            longitudes (ndarray): Site longitudes in decimal degrees
+            memory_budget_mb (float): Working-set budget for distance blocks
+            refine (bool): Refine distances near radius boundaries to exact geodesic
+            weighted_radius (float): Radius for the weighted competition score
+            tract_positions (ndarray, optional): Restrict to these census rows
+                (e.g. from a spatial index query). Default: all tracts.
+            dispensary_positions (ndarray, optional): Restrict to these dispensary rows.
+                Default: all dispensaries.
+            radii (list, optional): Radius ladder for this call. Default: self.RADII.
+            state_frames (tuple, optional): (dispensaries_df, census_df) the positions
+                refer to, e.g. from data_loader.get_state_view(). Default: the
+                loader's current state data.
+
+        Returns:
+            dict: Feature name -> array (one value per site) for every pop_*,
+                competitors_*, competitors_per_100k_* feature and
+                competition_weighted_{weighted_radius}mi
+        """
+        state = state.upper().strip()
+        radii = self.RADII if radii is None else validate_radii(radii)
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        if state_frames is None:
+            state_frames = self.data_loader.get_state_data(state)
+        dispensaries_df, census_df = state_frames
+        if tract_positions is None:
+            tract_positions = np.arange(len(census_df))
+        if dispensary_positions is None:
+            dispensary_positions = np.arange(len(dispensaries_df))
+
+        tract_lats = column_rows(census_df, 'latitude', tract_positions)
+        tract_lons = column_rows(census_df, 'longitude', tract_positions)
+        tract_pops = column_rows(census_df, 'total_population', tract_positions)
+        disp_lats = column_rows(dispensaries_df, 'latitude', dispensary_positions)
+        disp_lons = column_rows(dispensaries_df, 'longitude', dispensary_positions)
+
+        chunk_size = self._batch_chunk_size(len(tract_lats) + len(disp_lats), memory_budget_mb)
+        features = {}
+
+        for start in range(0, len(latitudes), chunk_size):
+            block_lats = latitudes[start:start + chunk_size]
+            block_lons = longitudes[start:start + chunk_size]
+
+            with profiler.timer('distance_computation.block'):
+                tract_distances = pairwise_site_distances_miles(
+                    block_lats, block_lons, tract_lats, tract_lons,
+                    radii=radii, refine=refine
+                )
+                dispensary_distances = pairwise_site_distances_miles(
+                    block_lats, block_lons, disp_lats, disp_lons,
+                    radii=radii + [self.SELF_EXCLUSION_MILES], refine=refine,
+                    refine_within=weighted_radius
+                )
+
+            with profiler.timer('radius_aggregation.block'):
+                block = aggregate_distance_blocks(
+                    tract_distances, tract_pops, dispensary_distances,
+                    radii, self.SELF_EXCLUSION_MILES, weighted_radius
+                )
+
+            for name, values in block.items():
+                if name not in features:
+                    features[name] = np.empty(len(latitudes), dtype=values.dtype)
+                features[name][start:start + chunk_size] = values
+
+        return features
+
+    def _valid_site_mask(self, states: np.ndarray, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+        """
+        Vectorized validate_coordinates(): which sites have a supported state
+        and coordinates inside its bounds (NaN coordinates are invalid).
+
+        Args:
+            states (ndarray): Upper-cased state codes
+            latitudes (ndarray): Latitudes in decimal degrees
+            longitudes (ndarray): Longitudes in decimal degrees
+
+        Returns:
+            ndarray: Boolean mask, True for valid sites
+        """
+        valid = np.zeros(len(states), dtype=bool)
+        for state, bounds in self.data_loader.STATE_BOUNDS.items():
+            valid |= (
+                (states == state) &
+                (latitudes >= bounds['lat_min']) & (latitudes <= bounds['lat_max']) &
+                (longitudes >= bounds['lon_min']) & (longitudes <= bounds['lon_max'])
+            )
+        return valid
+
+    def calculate_features_batch(
+        self,
+        sites_df: pd.DataFrame,
+        memory_budget_mb: float = 256,
+        include_demographics: bool = True,
+        refine: bool = True
+    ) -> pd.DataFrame:
+        """
+        Calculate all 23 base features for many candidate sites.
+
+        Distances are computed as site x tract and site x dispensary blocks,
+        with the number of sites per block sized to the memory budget. Errors
+        are reported per row in an 'error' column instead of being raised.
+
+        Args:
+            sites_df (DataFrame): One row per site with 'state', 'latitude' and
+                'longitude' columns, plus optional 'sq_ft' (state median if missing)
+            memory_budget_mb (float): Working-set budget for distance blocks (default: 256)
+            include_demographics (bool): Look up each site's census tract and
+                demographics (default: True). If False, only distance features
+                are calculated and no network calls are made.
+            refine (bool): Refine distances near radius boundaries to exact
+                geodesic distances (default: True)
+
+        Returns:
+            DataFrame: Same index as sites_df, with state, latitude, longitude,
+                sq_ft, all population/competition features, demographic
+                features (if requested) and an 'error' column (None on success)
+
+        Raises:
+            ValueError: If required columns are missing
+        """
+        required_cols = ['state', 'latitude', 'longitude']
+        missing_cols = [col for col in required_cols if col not in sites_df.columns]
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+
+        n_sites = len(sites_df)
+        states = sites_df['state'].astype(str).str.upper().str.strip().to_numpy()
+        latitudes = pd.to_numeric(sites_df['latitude'], errors='coerce').to_numpy(dtype=np.float64)
+        longitudes = pd.to_numeric(sites_df['longitude'], errors='coerce').to_numpy(dtype=np.float64)
+
+        if 'sq_ft' in sites_df.columns:
+            sq_ft = pd.to_numeric(sites_df['sq_ft'], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            sq_ft = np.full(n_sites, np.nan)
+
+        errors = np.full(n_sites, None, dtype=object)
+
+        print(f"🔄 Calculating features for {n_sites:,} sites...")
+
+        # Validate state and coordinates for all rows at once
+        invalid = ~self._valid_site_mask(states, latitudes, longitudes)
+
+        # Only failing rows go through the scalar checks, for their messages
+        for i in np.flatnonzero(invalid):
+            try:
+                self.data_loader.get_state_bounds(states[i])
+                self.validate_coordinates(states[i], latitudes[i], longitudes[i])
+            except (InvalidStateError, InvalidCoordinatesError) as e:
+                errors[i] = str(e)
+
+        for state, median_sq_ft in self.STATE_MEDIAN_SQ_FT.items():
+            sq_ft[~invalid & (states == state) & np.isnan(sq_ft)] = median_sq_ft
+
+        # Match census tracts first (may fetch missing tracts into the database)
+        demographics = {}
+        if include_demographics:
+            for i in np.flatnonzero(~invalid):
+                try:
+                    demographics[i] = self.match_census_tract(
+                        states[i], latitudes[i], longitudes[i], verbose=False
+                    )
+                except DataNotFoundError as e:
+                    errors[i] = str(e)
+                except Exception as e:
+                    # Network failures, malformed API data etc. fail this row only
+                    errors[i] = f"{type(e).__name__}: {e}"
+
+        # Distance features, one memory-bounded block of sites at a time
+        weighted_radius = 20
+        distance_features = {}
+        valid_rows = pd.isna(errors)
+
+        for state in np.unique(states[valid_rows]):
+            rows = np.flatnonzero(valid_rows & (states == state))
+            block = self.calculate_distance_features_block(
+                state, latitudes[rows], longitudes[rows],
+                memory_budget_mb=memory_budget_mb,
+                refine=refine,
+                weighted_radius=weighted_radius
+            )
+
+            for name, values in block.items():
+                if name not in distance_features:
+                    distance_features[name] = np.full(n_sites, np.nan)
+                distance_features[name][rows] = values
+
+        # Assemble output in the same column order as calculate_all_features()
+        result = pd.DataFrame({
+            'state': states,
+            'latitude': latitudes,
+            'longitude': longitudes,
+            'sq_ft': sq_ft
+        }, index=sites_df.index)
+
+        count_features = (
+            [f'pop_{r}mi' for r in self.RADII] +
+            [f'competitors_{r}mi' for r in self.RADII]
+        )
+        rate_features = (
+            [f'competitors_per_100k_{r}mi' for r in self.RADII] +
+            [f'competition_weighted_{weighted_radius}mi']
+        )
+        for name in count_features + rate_features:
+            values = distance_features.get(name, np.full(n_sites, np.nan))
+            if name in count_features:
+                # Nullable integers keep failed rows as <NA> instead of float NaN
+                result[name] = pd.array(np.where(np.isnan(values), None, values), dtype='Int64')
+            else:
+                result[name] = values
+
+        if include_demographics:
+            demo_df = pd.DataFrame.from_dict(demographics, orient='index', columns=self.DEMOGRAPHIC_FEATURES)
+            demo_df = demo_df.reindex(range(n_sites))
+            for name in self.DEMOGRAPHIC_FEATURES:
+                result[name] = demo_df[name].to_numpy()
+
+        result['error'] = errors
+
+        failed = int((~pd.isna(errors)).sum())
+        print(f"✅ Batch feature calculation complete: {n_sites - failed:,} succeeded, {failed:,} with errors")
+
+        return result
 
 # Module test
 if __name__ == "__main__":
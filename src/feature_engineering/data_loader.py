@@ -7,21 +7,37 @@ Provides clean, validated data sources for coordinate-based feature calculation.
 Key Principle: Load real data only - NO synthetic data, NO estimates.
 """
 
+import threading
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+# Per-thread switch for loading messages (background reloads run quietly)
+_OUTPUT = threading.local()
+
 try:
     from .exceptions import InvalidStateError
+    from .spatial_index import SphericalIndex
+    from .gazetteer_index import get_gazetteer_index, gazetteer_path, clear_gazetteer_indexes
+    from .tract_table import TractTable
+    from .loader_snapshot import source_digest, save_snapshot, load_snapshot
+    from .shared_data import SharedDataPlane, attach_tables
+    from .compact_dtypes import compact_frame, memory_bytes
 except ImportError:
     # Allow running as standalone script
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent))
     from exceptions import InvalidStateError
+    from spatial_index import SphericalIndex
+    from gazetteer_index import get_gazetteer_index, gazetteer_path, clear_gazetteer_indexes
+    from tract_table import TractTable
+    from loader_snapshot import source_digest, save_snapshot, load_snapshot
+    from shared_data import SharedDataPlane, attach_tables
+    from compact_dtypes import compact_frame, memory_bytes
 
 
 class MultiStateDataLoader:
@@ -29,14 +45,20 @@ class MultiStateDataLoader:
     Load and manage census and competition data for FL and PA.
 
     This class loads data once during initialization and provides
-    state-specific data access for feature calculation.
+    state-specific data access for feature calculation. In lazy mode, each
+    state's tables are loaded on first use and training_data on first access.
+    With watching enabled, changed source files are reloaded in the
+    background and the affected states are swapped in atomically.
 
     Attributes:
         fl_dispensaries (DataFrame): Florida dispensary locations
         pa_dispensaries (DataFrame): Pennsylvania dispensary locations
-        fl_census (DataFrame): Florida census tracts with demographics
-        pa_census (DataFrame): Pennsylvania census tracts with demographics
+        fl_census (DataFrame): Florida census tracts with demographics (view of its TractTable;
+            census_geoid as int64 keys, see compact_dtypes)
+        pa_census (DataFrame): Pennsylvania census tracts with demographics (view of its TractTable)
         training_data (DataFrame): Full training dataset
+        tract_indexes (Dict[str, SphericalIndex]): Per-state spatial index of tract centroids
+        dispensary_indexes (Dict[str, SphericalIndex]): Per-state spatial index of dispensaries
     """
 
     # State boundaries for validation (approximate)
@@ -53,34 +75,525 @@ class MultiStateDataLoader:
 
     SUPPORTED_STATES = ['FL', 'PA']
 
-    def __init__(self):
-        """Initialize data loader and load all required datasets."""
-        self.fl_dispensaries = None
-        self.pa_dispensaries = None
-        self.fl_census = None
-        self.pa_census = None
-        self.training_data = None
+    STATE_NAMES = {'FL': 'Florida', 'PA': 'Pennsylvania'}
+
+    # Minimum census tracts per state, and the expected count for error messages
+    TRACT_COVERAGE = {'FL': (1000, 5000), 'PA': (500, 2600)}
+
+    # Tables persisted in the startup snapshot
+    SNAPSHOT_TABLES = ['training_data', 'fl_dispensaries', 'pa_dispensaries', 'fl_census', 'pa_census']
+
+    # Tables published to worker processes by publish_shared()
+    SHARED_TABLES = ['fl_dispensaries', 'pa_dispensaries', 'fl_census', 'pa_census']
+
+    # Training data columns needed to extract dispensaries
+    DISPENSARY_SOURCE_COLUMNS = ['state', 'latitude', 'longitude', 'has_placer_data', 'regulator_name', 'placer_name']
+
+    def __init__(
+        self,
+        use_snapshot: bool = True,
+        lazy: bool = False,
+        project_root: Optional[Path] = None,
+        watch_interval: Optional[float] = None
+    ):
+        """
+        Initialize data loader and load all required datasets.
+
+        Args:
+            use_snapshot (bool): Load the cleaned tables from the binary startup
+                snapshot when it matches the source files, and (re)write it after
+                parsing the CSVs otherwise
+            lazy (bool): Load nothing now; load each state's dispensaries and
+                census tracts on first use (e.g. get_state_data()) and the
+                training data on first access. Coverage is validated per state.
+            project_root (Path, optional): Repository root holding data/.
+                Default: inferred from this file's location
+            watch_interval (float, optional): Poll the source files every this
+                many seconds and hot-reload changes (see start_watching()).
+                Default: no watching
+        """
+        self._init_state(project_root, lazy=lazy, use_snapshot=use_snapshot)
+        self._stamp_sources()
+
+        if lazy:
+            print("🔄 Multi-state data loader ready (states load on first use)\n")
+        else:
+            print("🔄 Loading multi-state data sources...")
+            if not (use_snapshot and self.load_snapshot()):
+                self.load_training_data()
+                self.load_dispensary_data()
+                self.load_census_data()
+                if use_snapshot:
+                    self.save_snapshot()
+            self.build_spatial_indexes()
+            print("✅ All data sources loaded successfully\n")
+
+        if watch_interval is not None:
+            self.start_watching(watch_interval)
+
+    def _init_state(self, project_root: Optional[Path], lazy: bool, use_snapshot: bool) -> None:
+        """Set up an empty loader (shared by __init__ and from_tables())."""
+        self._lazy = lazy
+        self._use_snapshot = use_snapshot
+        self._loaded_states = set()
+        self._load_lock = threading.RLock()
+        self._reload_lock = threading.Lock()
+        self._source_stamps = {}
+        self._watcher = None
+
+        self._training_data = None
+        self._dispensaries = {}
+        self._tract_tables = {}
+        self.tract_indexes = {}
+        self.dispensary_indexes = {}
+        self._index_versions = {}
 
         # Project root
-        self.project_root = Path(__file__).parent.parent.parent
+        self.project_root = Path(project_root) if project_root is not None else Path(__file__).parent.parent.parent
+
+    def _say(self, *args, **kwargs) -> None:
+        """print() unless the current thread is loading quietly."""
+        if not getattr(_OUTPUT, 'quiet', False):
+            print(*args, **kwargs)
+
+    def publish_shared(self, directory: Optional[Path] = None) -> SharedDataPlane:
+        """
+        Publish the per-state tables for worker processes.
+
+        Workers attach with MultiStateDataLoader.from_shared(plane.path) and
+        map the same files, so a pool of N workers holds about one copy of
+        the numeric data. Close the plane (or use it as a context manager)
+        once the workers are done. Training data is not published.
+
+        Args:
+            directory (Path, optional): Where to write the column files.
+                Default: a new temporary directory
+
+        Returns:
+            SharedDataPlane: The publication (path, close())
+        """
+        return SharedDataPlane({name: getattr(self, name) for name in self.SHARED_TABLES}, directory)
+
+    @classmethod
+    def from_shared(cls, path) -> 'MultiStateDataLoader':
+        """
+        Create a loader over tables published by publish_shared().
+
+        Numeric columns are read-only memory-mapped views (no copy); spatial
+        indexes are built locally. training_data is None.
+
+        Args:
+            path (str or Path): SharedDataPlane.path of the publishing process
+
+        Returns:
+            MultiStateDataLoader: Fully loaded (non-lazy) loader
+        """
+        tables = attach_tables(path)
+        return cls.from_tables({name: tables[name] for name in cls.SHARED_TABLES})
+
+    @classmethod
+    def from_tables(
+        cls,
+        tables: Dict[str, pd.DataFrame],
+        project_root: Optional[Path] = None
+    ) -> 'MultiStateDataLoader':
+        """
+        Create a loader over tables already in memory (no source files are read).
+
+        Spatial indexes are built for both states.
+
+        Args:
+            tables (dict): Frames keyed by SNAPSHOT_TABLES name; every state's
+                dispensaries and census tables are required, training_data is optional
+            project_root (Path, optional): Repository root holding data/.
+                Default: inferred from this file's location
+
+        Returns:
+            MultiStateDataLoader: Fully loaded (non-lazy) loader
+        """
+        loader = cls.__new__(cls)
+        loader._init_state(project_root, lazy=False, use_snapshot=False)
+
+        for name, frame in tables.items():
+            if name not in cls.SNAPSHOT_TABLES:
+                raise ValueError(f"Unknown loader table '{name}'")
+            setattr(loader, name, frame)
+
+        loader.build_spatial_indexes()
+        return loader
+
+    @property
+    def training_data(self) -> pd.DataFrame:
+        """Full training dataset (loaded on first access in lazy mode)."""
+        data = self._training_data
+        if data is None and self._lazy:
+            with self._load_lock:
+                if self._training_data is None:
+                    if not (self._use_snapshot and self.load_snapshot(['training_data'])):
+                        self.load_training_data()
+                data = self._training_data
+        return data
+
+    @training_data.setter
+    def training_data(self, frame: pd.DataFrame) -> None:
+        self._training_data = frame
+
+    @property
+    def fl_dispensaries(self) -> pd.DataFrame:
+        """Florida dispensary locations."""
+        return self._get_dispensaries('FL')
+
+    @fl_dispensaries.setter
+    def fl_dispensaries(self, frame: pd.DataFrame) -> None:
+        self._dispensaries['FL'] = frame
+
+    @property
+    def pa_dispensaries(self) -> pd.DataFrame:
+        """Pennsylvania dispensary locations."""
+        return self._get_dispensaries('PA')
+
+    @pa_dispensaries.setter
+    def pa_dispensaries(self, frame: pd.DataFrame) -> None:
+        self._dispensaries['PA'] = frame
+
+    def _get_dispensaries(self, state: str) -> pd.DataFrame:
+        frame = self._dispensaries.get(state)
+        if frame is None and self._is_pending(state):
+            self.ensure_state_loaded(state)
+            frame = self._dispensaries.get(state)
+        return frame
+
+    @property
+    def fl_census(self) -> pd.DataFrame:
+        """Florida census tracts (including any tracts appended at runtime)."""
+        return self._get_census_frame('FL')
+
+    @fl_census.setter
+    def fl_census(self, frame: pd.DataFrame) -> None:
+        self._set_census_frame('FL', frame)
+
+    @property
+    def pa_census(self) -> pd.DataFrame:
+        """Pennsylvania census tracts (including any tracts appended at runtime)."""
+        return self._get_census_frame('PA')
+
+    @pa_census.setter
+    def pa_census(self, frame: pd.DataFrame) -> None:
+        self._set_census_frame('PA', frame)
+
+    def _get_census_frame(self, state: str) -> pd.DataFrame:
+        table = self._tract_tables.get(state)
+        if table is None and self._is_pending(state):
+            self.ensure_state_loaded(state)
+            table = self._tract_tables.get(state)
+        return None if table is None else table.frame
+
+    def _set_census_frame(self, state: str, frame: pd.DataFrame) -> None:
+        if frame is None:
+            self._tract_tables.pop(state, None)
+        else:
+            self._tract_tables[state] = TractTable(frame)
+
+    def _is_pending(self, state: str) -> bool:
+        """Whether a supported state is still waiting to be loaded (lazy mode only)."""
+        return self._lazy and state in self.SUPPORTED_STATES and state not in self._loaded_states
+
+    @property
+    def loaded_states(self) -> List[str]:
+        """States whose tables are in memory."""
+        if not self._lazy:
+            return list(self.SUPPORTED_STATES)
+        return [st for st in self.SUPPORTED_STATES if st in self._loaded_states]
+
+    def ensure_state_loaded(self, state: str) -> None:
+        """
+        Load one state's dispensaries and census tracts if not loaded yet.
+
+        No-op outside lazy mode (everything is loaded at initialization).
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+
+        Raises:
+            InvalidStateError: If state is not 'FL' or 'PA'
+        """
+        state = state.upper().strip()
+        if state not in self.SUPPORTED_STATES:
+            raise InvalidStateError(
+                f"State '{state}' is not supported. "
+                f"Model only supports: {', '.join(self.SUPPORTED_STATES)}"
+            )
+        if not self._is_pending(state):
+            return
+
+        with self._load_lock:
+            if not self._is_pending(state):
+                return
+
+            prefix = state.lower()
+            print(f"🔄 Loading {self.STATE_NAMES[state]} data sources...")
+            if not (self._use_snapshot and self.load_snapshot([f'{prefix}_dispensaries', f'{prefix}_census'])):
+                self.load_dispensary_data([state])
+                self.load_census_data([state])
+            self._loaded_states.add(state)
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Location of the binary startup snapshot."""
+        return self.project_root / "data" / "cache" / "loader_snapshot.npz"
+
+    def source_scopes(self) -> List[Tuple[Path, str, List[str]]]:
+        """
+        Source files with the table kind and states each one feeds.
+
+        Returns:
+            list: (path, 'dispensaries' or 'census', states) per source file.
+                The training file also feeds training_data.
+        """
+        return [
+            (self.project_root / "data" / "processed" / "combined_with_competitive_features_corrected.csv",
+             'dispensaries', list(self.SUPPORTED_STATES)),
+            (self.project_root / "data" / "census" / "intermediate" / "all_tracts_demographics.csv",
+             'census', list(self.SUPPORTED_STATES)),
+            (self.project_root / "data" / "census" / "cache" / "tract_centroids.csv",
+             'census', list(self.SUPPORTED_STATES)),
+        ] + [
+            (gazetteer_path(self.project_root, st), 'census', [st]) for st in self.SUPPORTED_STATES
+        ]
+
+    def snapshot_sources(self) -> list:
+        """Files the cleaned tables are derived from (the snapshot's cache key)."""
+        return [path for path, _, _ in self.source_scopes()]
+
+    def load_snapshot(self, names: Optional[List[str]] = None) -> bool:
+        """
+        Load cleaned tables from the startup snapshot.
+
+        Args:
+            names (list, optional): Tables to load (default: SNAPSHOT_TABLES)
+
+        Returns:
+            bool: True if loaded; False if the snapshot is missing, unreadable or
+                was built from different source files
+        """
+        names = list(self.SNAPSHOT_TABLES if names is None else names)
+        tables = load_snapshot(self.snapshot_path, source_digest(self.snapshot_sources()), names)
+        if tables is None or any(name not in tables for name in names):
+            return False
+
+        for name in names:
+            setattr(self, name, tables[name])
+
+        self._say("  ⚡ Loaded snapshot: " + ", ".join(f"{name} ({len(tables[name])})" for name in names))
+        return True
+
+    def save_snapshot(self) -> None:
+        """Write the cleaned tables to the startup snapshot (failures are non-fatal)."""
+        # Digest taken after loading: the centroid cache may have just been written
+        digest = source_digest(self.snapshot_sources())
+        try:
+            save_snapshot(
+                self.snapshot_path, digest,
+                {name: getattr(self, name) for name in self.SNAPSHOT_TABLES}
+            )
+            self._say(f"  💾 Saved startup snapshot to {self.snapshot_path}")
+        except (OSError, TypeError, ValueError) as e:
+            self._say(f"  ⚠️  Could not save startup snapshot: {e}")
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _stamp_sources(self) -> None:
+        """Record the current mtime/size of every source file as the reload baseline."""
+        self._source_stamps = {path: (self._stat(path), None) for path, _, _ in self.source_scopes()}
+
+    def _changed_sources(self) -> List[Tuple[Path, str, List[str]]]:
+        """
+        Source files whose contents changed since the last poll.
+
+        A file is hashed only when its mtime or size changed, and reported
+        only when its content hash differs from the last known one (a file
+        touched without changes is not reported once its hash is known).
+        """
+        stamps = self._source_stamps
+        changed = []
 
-        print("🔄 Loading multi-state data sources...")
-        self.load_training_data()
-        self.load_dispensary_data()
-        self.load_census_data()
-        print("✅ All data sources loaded successfully\n")
+        for path, kind, states in self.source_scopes():
+            stat = self._stat(path)
+            if path not in stamps:
+                stamps[path] = (stat, None)  # First sighting: baseline only
+                continue
+
+            old_stat, old_digest = stamps[path]
+            if stat == old_stat:
+                continue
+
+            digest = None if stat is None else source_digest([path])
+            stamps[path] = (stat, digest)
+            if old_digest is None or digest != old_digest:
+                changed.append((path, kind, states))
+
+        return changed
+
+    def check_for_updates(self, verbose: bool = True) -> List[str]:
+        """
+        Poll the source files once and hot-reload whatever changed.
+
+        Args:
+            verbose (bool): Print loading messages
+
+        Returns:
+            list: States whose tables were swapped
+        """
+        with self._reload_lock:
+            changed = self._changed_sources()
+            if not changed:
+                return []
+
+            # Unchanged states among these are detected by comparison and left alone
+            states = sorted({st for _, _, scope in changed for st in scope})
+            tables = tuple(sorted({kind for _, kind, _ in changed}))
+            gazetteer_states = [
+                scope[0] for path, _, scope in changed
+                if len(scope) == 1 and path == gazetteer_path(self.project_root, scope[0])
+            ]
+            return self.reload(states, tables=tables, verbose=verbose, refresh_centroids=gazetteer_states)
+
+    def reload(
+        self,
+        states: Optional[List[str]] = None,
+        tables: Tuple[str, ...] = ('dispensaries', 'census'),
+        verbose: bool = True,
+        refresh_centroids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Rebuild tables from the source files and swap in the states that changed.
+
+        The new tables and spatial indexes are built without holding any lock
+        (readers keep using the current data); each changed state's tables
+        and indexes are then replaced together under the loader lock.
+        Feature calculations already in flight keep the frames they hold.
+        Tracts appended at runtime are dropped from swapped states. If a
+        rebuild fails, the current data is kept and the error is raised.
+
+        Args:
+            states (list, optional): States to consider (default: all loaded states)
+            tables (tuple): Table kinds to rebuild: 'dispensaries' and/or 'census'
+            verbose (bool): Print loading messages
+            refresh_centroids (list, optional): States whose Gazetteer files
+                changed: their shared Gazetteer indexes are dropped and their
+                centroids re-read (and re-cached) instead of taken from the
+                centroid cache
+
+        Returns:
+            list: States whose tables were swapped
+        """
+        states = [st for st in (states or self.SUPPORTED_STATES) if st in self.loaded_states]
+        refresh_centroids = [st for st in (refresh_centroids or []) if st in states]
+        if refresh_centroids:
+            clear_gazetteer_indexes([gazetteer_path(self.project_root, st) for st in refresh_centroids])
+
+        previous_quiet = getattr(_OUTPUT, 'quiet', False)
+        _OUTPUT.quiet = not verbose
+        try:
+            # training_data is re-read only if it is loaded; otherwise dispensaries
+            # come straight from the training file
+            training = None
+            if 'dispensaries' in tables and self._training_data is not None:
+                training = self._read_training_data()
+
+            dispensaries = self._read_dispensary_tables(states, source=training) \
+                if 'dispensaries' in tables and states else {}
+            census = self._read_census_tables(states, refresh_centroids) \
+                if 'census' in tables and states else {}
+
+            swaps = {}
+            for st in states:
+                current_dispensaries = self._dispensaries[st]
+                current_census = self._tract_tables[st].frame
+
+                new_dispensaries = dispensaries.get(st, current_dispensaries)
+                new_census = census.get(st, current_census)
+                if new_dispensaries.equals(current_dispensaries) and new_census.equals(current_census):
+                    continue
+
+                # Always a new table: its identity tells dependants (e.g. cached
+                # what-if contexts) that the state's data was replaced
+                table = TractTable(new_census)
+                swaps[st] = (new_dispensaries, table) + self._build_indexes(new_dispensaries, table.frame)
+
+            with self._load_lock:
+                if training is not None:
+                    self.training_data = training
+                for st, (new_dispensaries, table, dispensary_index, tract_index) in swaps.items():
+                    self._dispensaries[st] = new_dispensaries
+                    self._tract_tables[st] = table
+                    self.dispensary_indexes[st] = dispensary_index
+                    self.tract_indexes[st] = tract_index
+                    self._index_versions[st] = table.version
+
+            if swaps and self._use_snapshot and not self._lazy:
+                self.save_snapshot()
+        finally:
+            _OUTPUT.quiet = previous_quiet
+
+        return sorted(swaps)
+
+    def start_watching(self, interval: float = 30.0) -> None:
+        """
+        Poll the source files in a background thread and hot-reload changes.
+
+        Args:
+            interval (float): Seconds between polls
+        """
+        if self._watcher is not None and self._watcher[0].is_alive():
+            return
+
+        stop = threading.Event()
+
+        def watch():
+            while not stop.wait(interval):
+                try:
+                    swapped = self.check_for_updates(verbose=False)
+                    if swapped:
+                        print(f"🔄 Reloaded data sources for {', '.join(swapped)}")
+                except Exception as e:
+                    print(f"⚠️  Data reload failed, keeping current data: {e}")
+
+        thread = threading.Thread(target=watch, name='data-loader-watch', daemon=True)
+        self._watcher = (thread, stop)
+        thread.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher started by start_watching()."""
+        if self._watcher is None:
+            return
+        thread, stop = self._watcher
+        stop.set()
+        thread.join()
+        self._watcher = None
 
     def load_training_data(self):
         """Load the complete training dataset."""
+        self.training_data = self._read_training_data()
+
+    def _read_training_data(self) -> pd.DataFrame:
+        """Read and validate the training dataset (without storing it)."""
         training_file = self.project_root / "data" / "processed" / "combined_with_competitive_features_corrected.csv"
 
         try:
-            self.training_data = pd.read_csv(training_file)
-            print(f"  ✓ Loaded training data: {len(self.training_data)} records")
+            training_data = pd.read_csv(training_file)
+            self._say(f"  ✓ Loaded training data: {len(training_data)} records")
 
             # Validate required columns exist
             required_cols = ['state', 'latitude', 'longitude', 'has_placer_data']
-            missing_cols = [col for col in required_cols if col not in self.training_data.columns]
+            missing_cols = [col for col in required_cols if col not in training_data.columns]
 
             if missing_cols:
                 raise ValueError(f"Missing required columns: {missing_cols}")
@@ -93,12 +606,16 @@ class MultiStateDataLoader:
         except Exception as e:
             raise RuntimeError(f"Error loading training data: {e}")
 
-    def load_dispensary_data(self):
+        return training_data
+
+    def load_dispensary_data(self, states: Optional[List[str]] = None):
         """
         Load FL and PA dispensaries for competition analysis.
 
         Extracts verified dispensary locations from training data.
         Only includes dispensaries with Placer data (verified locations).
+        If the full training dataset has not been loaded (lazy mode), only the
+        columns needed here are read from the training file.
 
         Returns verified dispensaries with columns:
         - state: FL or PA
@@ -106,12 +623,41 @@ class MultiStateDataLoader:
         - longitude: WGS84 longitude
         - regulator_name: Dispensary name from regulator data
         - placer_name: Dispensary name from Placer data
+
+        Args:
+            states (list, optional): States to load (default: all supported states)
+        """
+        for st, frame in self._read_dispensary_tables(states).items():
+            setattr(self, f"{st.lower()}_dispensaries", frame)
+
+    def _read_dispensary_tables(
+        self,
+        states: Optional[List[str]] = None,
+        source: Optional[pd.DataFrame] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Build cleaned per-state dispensary tables (without storing them).
+
+        Args:
+            states (list, optional): States to build (default: all supported states)
+            source (DataFrame, optional): Training data to extract from. Default:
+                the loaded training data, else the needed columns of the training file
+
+        Returns:
+            dict: State code -> compact dispensary table
         """
-        print("  🏢 Loading dispensary locations for competition analysis...")
+        states = self.SUPPORTED_STATES if states is None else states
+        self._say("  🏢 Loading dispensary locations for competition analysis...")
+
+        if source is None:
+            source = self._training_data
+        if source is None:
+            training_file = self.project_root / "data" / "processed" / "combined_with_competitive_features_corrected.csv"
+            source = pd.read_csv(training_file, usecols=self.DISPENSARY_SOURCE_COLUMNS)
 
         # Filter to verified dispensaries only (has Placer data)
-        dispensaries = self.training_data[
-            self.training_data['has_placer_data'] == True
+        dispensaries = source[
+            source['has_placer_data'] == True
         ].copy()
 
         # Select relevant columns
@@ -128,20 +674,21 @@ class MultiStateDataLoader:
         ]
 
         # Split by state
-        self.fl_dispensaries = dispensaries[dispensaries['state'] == 'FL'].copy()
-        self.pa_dispensaries = dispensaries[dispensaries['state'] == 'PA'].copy()
+        by_state = {st: dispensaries[dispensaries['state'] == st].copy() for st in states}
+
+        for st, frame in by_state.items():
+            self._say(f"    • {self.STATE_NAMES[st]}: {len(frame)} dispensaries")
+        if len(states) > 1:
+            self._say(f"    • Total: {sum(len(frame) for frame in by_state.values())} verified locations")
 
-        print(f"    • Florida: {len(self.fl_dispensaries)} dispensaries")
-        print(f"    • Pennsylvania: {len(self.pa_dispensaries)} dispensaries")
-        print(f"    • Total: {len(self.fl_dispensaries) + len(self.pa_dispensaries)} verified locations")
+        # Validate we have data for every requested state
+        for st, frame in by_state.items():
+            if len(frame) == 0:
+                raise ValueError(f"No {self.STATE_NAMES[st]} dispensaries found in training data")
 
-        # Validate we have data for both states
-        if len(self.fl_dispensaries) == 0:
-            raise ValueError("No Florida dispensaries found in training data")
-        if len(self.pa_dispensaries) == 0:
-            raise ValueError("No Pennsylvania dispensaries found in training data")
+        return {st: compact_frame(frame) for st, frame in by_state.items()}
 
-    def load_census_data(self):
+    def load_census_data(self, states: Optional[List[str]] = None):
         """
         Load FL and PA census tracts for population analysis.
 
@@ -171,8 +718,31 @@ class MultiStateDataLoader:
         - population_density: Population per square mile (calculated)
         - census_data_complete: Boolean flag for data completeness
         - census_api_error: Boolean flag for API errors
+
+        Args:
+            states (list, optional): States to load (default: all supported states)
         """
-        print("  📍 Loading statewide census tract data...")
+        for st, frame in self._read_census_tables(states).items():
+            setattr(self, f"{st.lower()}_census", frame)
+
+    def _read_census_tables(
+        self,
+        states: Optional[List[str]] = None,
+        refresh_centroids: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Build cleaned per-state census tables (without storing them).
+
+        Args:
+            states (list, optional): States to build (default: all supported states)
+            refresh_centroids (list, optional): States whose centroids bypass the
+                centroid cache (see _add_tract_centroids())
+
+        Returns:
+            dict: State code -> compact census table with centroids
+        """
+        states = self.SUPPORTED_STATES if states is None else states
+        self._say("  📍 Loading statewide census tract data...")
 
         # Load full statewide census data from Phase 2 output
         census_file = self.project_root / "data" / "census" / "intermediate" / "all_tracts_demographics.csv"
@@ -184,10 +754,11 @@ class MultiStateDataLoader:
             )
 
         census = pd.read_csv(census_file, dtype={'census_geoid': str})
-        print(f"    • Loaded {len(census)} statewide census tracts")
+        self._say(f"    • Loaded {len(census)} statewide census tracts")
 
         # Add state column from FIPS code
         census['state'] = census['census_state_fips'].map({12: 'FL', 42: 'PA'})
+        census = census[census['state'].isin(states)]
 
         # Remove census tracts with zero or missing population
         # These are unpopulated industrial/commercial areas not useful for retail analysis
@@ -195,30 +766,43 @@ class MultiStateDataLoader:
         census = census[census['total_population'].notna() & (census['total_population'] > 0)]
         removed = original_count - len(census)
         if removed > 0:
-            print(f"    • Removed {removed} unpopulated tracts")
+            self._say(f"    • Removed {removed} unpopulated tracts")
 
         # Calculate population density (population per square mile)
         # tract_area_sqm is in square meters, convert to square miles (1 sq mi = 2,589,988.11 sq m)
         census['population_density'] = census['total_population'] / (census['tract_area_sqm'] / 2589988.11)
 
         # Load census tract centroids for distance calculations
-        census = self._add_tract_centroids(census)
+        # (the shared centroid cache is only rewritten from a full load)
+        census = self._add_tract_centroids(
+            census, save_cache=set(states) == set(self.SUPPORTED_STATES), refresh_states=refresh_centroids
+        )
 
         # Split by state
-        self.fl_census = census[census['state'] == 'FL'].copy()
-        self.pa_census = census[census['state'] == 'PA'].copy()
-
-        print(f"    • Florida: {len(self.fl_census)} census tracts")
-        print(f"    • Pennsylvania: {len(self.pa_census)} census tracts")
-        print(f"    • Total: {len(self.fl_census) + len(self.pa_census)} census tracts with demographics")
-
-        # Validate we have adequate coverage for both states
-        if len(self.fl_census) < 1000:
-            raise ValueError(f"Insufficient Florida census tract coverage: {len(self.fl_census)} (expected ~5,000)")
-        if len(self.pa_census) < 500:
-            raise ValueError(f"Insufficient Pennsylvania census tract coverage: {len(self.pa_census)} (expected ~2,600)")
-
-    def _add_tract_centroids(self, census: pd.DataFrame) -> pd.DataFrame:
+        by_state = {st: census[census['state'] == st].copy() for st in states}
+
+        for st, frame in by_state.items():
+            self._say(f"    • {self.STATE_NAMES[st]}: {len(frame)} census tracts")
+        if len(states) > 1:
+            self._say(f"    • Total: {sum(len(frame) for frame in by_state.values())} census tracts with demographics")
+
+        # Validate we have adequate coverage for every requested state
+        for st, frame in by_state.items():
+            minimum, expected = self.TRACT_COVERAGE[st]
+            if len(frame) < minimum:
+                raise ValueError(
+                    f"Insufficient {self.STATE_NAMES[st]} census tract coverage: {len(frame)} (expected ~{expected:,})"
+                )
+
+        # GEOIDs become int64 keys (find_tract() accepts either form)
+        return {st: compact_frame(frame) for st, frame in by_state.items()}
+
+    def _add_tract_centroids(
+        self,
+        census: pd.DataFrame,
+        save_cache: bool = True,
+        refresh_states: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Add latitude/longitude centroids for census tracts.
 
@@ -226,7 +810,11 @@ class MultiStateDataLoader:
         Gazetteer files provide authoritative per-tract centroids (INTPTLAT/INTPTLONG).
 
         Args:
-            census (DataFrame): Census tract data with census_geoid column
+            census (DataFrame): Census tract data with census_geoid and state columns
+            save_cache (bool): Rewrite the centroid cache after a Gazetteer load
+            refresh_states (list, optional): States whose Gazetteer files changed.
+                Their cached centroids are ignored, and their rows of the centroid
+                cache are rewritten from the Gazetteer
 
         Returns:
             DataFrame: Census data with added 'latitude' and 'longitude' columns
@@ -234,28 +822,31 @@ class MultiStateDataLoader:
         Raises:
             FileNotFoundError: If Gazetteer files are missing and no cache available
         """
-        print("    • Loading census tract centroids...")
+        self._say("    • Loading census tract centroids...")
 
         # Check for cached centroids
         cache_file = self.project_root / "data" / "census" / "cache" / "tract_centroids.csv"
 
         if cache_file.exists():
-            print(f"      ✓ Loading centroids from cache...")
+            self._say(f"      ✓ Loading centroids from cache...")
             centroids_df = pd.read_csv(cache_file, dtype={'census_geoid': str})
             census = census.merge(centroids_df[['census_geoid', 'latitude', 'longitude']],
                                  on='census_geoid', how='left')
+            if refresh_states:
+                census.loc[census['state'].isin(refresh_states), ['latitude', 'longitude']] = np.nan
 
             missing = census['latitude'].isna().sum()
             if missing == 0:
-                print(f"      ✓ All {len(census)} tract centroids loaded from cache")
+                self._say(f"      ✓ All {len(census)} tract centroids loaded from cache")
                 return census
 
         # No cache - load from Gazetteer files
-        print(f"      Loading centroids from Census Gazetteer files...")
+        self._say(f"      Loading centroids from Census Gazetteer files...")
         census = self._load_centroids_from_gazetteer(census)
 
-        # Save to cache for future use
-        self._save_centroid_cache(census)
+        # Save to cache for future use (a partial load only replaces its own tracts)
+        if save_cache or refresh_states:
+            self._save_centroid_cache(census, merge=not save_cache)
 
         return census
 
@@ -275,8 +866,8 @@ class MultiStateDataLoader:
         Raises:
             FileNotFoundError: If Gazetteer files not found
         """
-        fl_gaz = self.project_root / "data" / "census" / "gazeteer" / "2020_Gaz_tracts_12.txt"
-        pa_gaz = self.project_root / "data" / "census" / "gazeteer" / "2020_Gaz_tracts_42.txt"
+        fl_gaz = gazetteer_path(self.project_root, 'FL')
+        pa_gaz = gazetteer_path(self.project_root, 'PA')
 
         # Check files exist
         if not fl_gaz.exists() or not pa_gaz.exists():
@@ -292,44 +883,38 @@ class MultiStateDataLoader:
                 f"  https://www2.census.gov/geo/docs/maps-data/data/gazetteer/2020_Gazetteer/"
             )
 
-        # Load FL centroids
-        fl_centroids = pd.read_csv(fl_gaz, sep='\t', dtype={'GEOID': str})
-        fl_centroids.columns = fl_centroids.columns.str.strip()  # Remove trailing spaces
-        fl_centroids = fl_centroids[['GEOID', 'INTPTLAT', 'INTPTLONG']].rename(
-            columns={'GEOID': 'census_geoid', 'INTPTLAT': 'latitude', 'INTPTLONG': 'longitude'}
-        )
-        print(f"      ✓ Loaded {len(fl_centroids)} FL tract centroids from Gazetteer")
-
-        # Load PA centroids
-        pa_centroids = pd.read_csv(pa_gaz, sep='\t', dtype={'GEOID': str})
-        pa_centroids.columns = pa_centroids.columns.str.strip()  # Remove trailing spaces
-        pa_centroids = pa_centroids[['GEOID', 'INTPTLAT', 'INTPTLONG']].rename(
-            columns={'GEOID': 'census_geoid', 'INTPTLAT': 'latitude', 'INTPTLONG': 'longitude'}
-        )
-        print(f"      ✓ Loaded {len(pa_centroids)} PA tract centroids from Gazetteer")
+        # Shared per-process GEOID indexes (also used for on-the-fly tract fetches).
+        # Each GEOID appears in exactly one state's file.
+        census = census.copy()
+        census['latitude'] = np.nan
+        census['longitude'] = np.nan
 
-        # Combine
-        all_centroids = pd.concat([fl_centroids, pa_centroids], ignore_index=True)
+        for state in ['FL', 'PA']:
+            index = get_gazetteer_index(self.project_root, state)
+            self._say(f"      ✓ Loaded {len(index)} {state} tract centroids from Gazetteer")
 
-        # Merge with census data
-        census = census.merge(all_centroids, on='census_geoid', how='left')
+            latitudes, longitudes, _ = index.lookup_many(census['census_geoid'])
+            found = ~np.isnan(latitudes)
+            census.loc[found, 'latitude'] = latitudes[found]
+            census.loc[found, 'longitude'] = longitudes[found]
 
         # Check for missing (expected for some water/unpopulated tracts)
         missing = census['latitude'].isna().sum()
         if missing > 0:
-            print(f"      ⚠️  {missing} tracts missing centroids (water/unpopulated areas)")
+            self._say(f"      ⚠️  {missing} tracts missing centroids (water/unpopulated areas)")
 
         total_loaded = len(census) - missing
-        print(f"      ✓ Total: {total_loaded:,} tract centroids loaded")
+        self._say(f"      ✓ Total: {total_loaded:,} tract centroids loaded")
 
         return census
 
-    def _save_centroid_cache(self, census: pd.DataFrame) -> None:
+    def _save_centroid_cache(self, census: pd.DataFrame, merge: bool = False) -> None:
         """
         Save tract centroids to cache file.
 
         Args:
             census (DataFrame): Census data with lat/lon
+            merge (bool): Keep cached centroids of tracts not in census
         """
         cache_file = self.project_root / "data" / "census" / "cache" / "tract_centroids.csv"
         cache_file.parent.mkdir(parents=True, exist_ok=True)
@@ -338,13 +923,49 @@ class MultiStateDataLoader:
         centroid_data = census[['census_geoid', 'latitude', 'longitude']].copy()
         centroid_data = centroid_data[centroid_data['latitude'].notna()]
 
+        if merge and cache_file.exists():
+            cached = pd.read_csv(cache_file, dtype={'census_geoid': str})
+            cached = cached.loc[~cached['census_geoid'].isin(census['census_geoid']), centroid_data.columns]
+            centroid_data = pd.concat([cached, centroid_data], ignore_index=True)
+
         centroid_data.to_csv(cache_file, index=False)
-        print(f"      ✓ Cached {len(centroid_data):,} centroids to {cache_file}")
+        self._say(f"      ✓ Cached {len(centroid_data):,} centroids to {cache_file}")
+
+        # Our own rewrite is not a source change for the hot-reload poll
+        if cache_file in self._source_stamps:
+            self._source_stamps[cache_file] = (self._stat(cache_file), source_digest([cache_file]))
+
+    def memory_report(self) -> pd.DataFrame:
+        """
+        Resident size of each loaded table (tables not loaded yet are skipped).
+
+        Returns:
+            DataFrame: One row per table (rows, columns, bytes, mb) plus a 'total' row
+        """
+        tables = {'training_data': self._training_data}
+        for st in self.SUPPORTED_STATES:
+            tables[f'{st.lower()}_dispensaries'] = self._dispensaries.get(st)
+            table = self._tract_tables.get(st)
+            tables[f'{st.lower()}_census'] = None if table is None else table.frame
+
+        report = pd.DataFrame(
+            [
+                {'table': name, 'rows': len(frame), 'columns': frame.shape[1], 'bytes': memory_bytes(frame)}
+                for name, frame in tables.items() if frame is not None
+            ],
+            columns=['table', 'rows', 'columns', 'bytes']
+        ).set_index('table')
+        report.loc['total'] = [report['rows'].sum(), report['columns'].sum(), report['bytes'].sum()]
+        report['mb'] = report['bytes'] / 1024 ** 2
+
+        return report
 
     def get_state_data(self, state: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Get dispensary and census data for specified state.
 
+        In lazy mode the state's tables are loaded on the first call.
+
         Args:
             state (str): State code ('FL' or 'PA')
 
@@ -355,18 +976,153 @@ class MultiStateDataLoader:
             InvalidStateError: If state is not 'FL' or 'PA'
         """
         state = state.upper().strip()
-
-        if state not in self.SUPPORTED_STATES:
-            raise InvalidStateError(
-                f"State '{state}' is not supported. "
-                f"Model only supports: {', '.join(self.SUPPORTED_STATES)}"
-            )
+        self.ensure_state_loaded(state)
 
         if state == 'FL':
             return self.fl_dispensaries, self.fl_census
         elif state == 'PA':
             return self.pa_dispensaries, self.pa_census
 
+    def build_spatial_indexes(self, state: str = None) -> None:
+        """
+        Build spherical spatial indexes for tract centroids and dispensaries.
+
+        Indexes are positional: query results are row positions in the
+        DataFrames returned by get_state_data().
+
+        Args:
+            state (str, optional): State code ('FL' or 'PA'). If None, builds all
+                loaded states.
+        """
+        states = self.loaded_states if state is None else [state.upper().strip()]
+
+        for st in states:
+            dispensaries_df, census_df = self.get_state_data(st)
+            self._index_versions[st] = self.get_tract_table(st).version
+            self.dispensary_indexes[st], self.tract_indexes[st] = self._build_indexes(dispensaries_df, census_df)
+
+        if state is None:
+            print(f"  🗂️  Built spatial indexes for {', '.join(states)}")
+
+    @staticmethod
+    def _build_indexes(
+        dispensaries_df: pd.DataFrame,
+        census_df: pd.DataFrame
+    ) -> Tuple[SphericalIndex, SphericalIndex]:
+        """(dispensary_index, tract_index) over one state's frames."""
+        return (
+            SphericalIndex(
+                dispensaries_df['latitude'].to_numpy(dtype=np.float64),
+                dispensaries_df['longitude'].to_numpy(dtype=np.float64)
+            ),
+            SphericalIndex(
+                census_df['latitude'].to_numpy(dtype=np.float64),
+                census_df['longitude'].to_numpy(dtype=np.float64)
+            )
+        )
+
+    def get_state_view(self, state: str) -> Tuple[pd.DataFrame, pd.DataFrame, SphericalIndex, SphericalIndex]:
+        """
+        Get a state's frames and spatial indexes as one consistent set.
+
+        Use this instead of separate get_state_data()/get_state_indexes() calls
+        when index positions are used against the frames and the loader may be
+        hot-reloading: a reload cannot swap the state between the two reads.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+
+        Returns:
+            Tuple: (dispensaries_df, census_df, dispensary_index, tract_index)
+
+        Raises:
+            InvalidStateError: If state is not 'FL' or 'PA'
+        """
+        with self._load_lock:
+            dispensaries_df, census_df = self.get_state_data(state)
+            dispensary_index, tract_index = self.get_state_indexes(state)
+        return dispensaries_df, census_df, dispensary_index, tract_index
+
+    def get_state_indexes(self, state: str) -> Tuple[SphericalIndex, SphericalIndex]:
+        """
+        Get spatial indexes for specified state.
+
+        Rebuilds the state's indexes if they are missing or stale: the tract
+        table's version changed (e.g. a fetched tract was merged) or the
+        dispensary row count no longer matches.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+
+        Returns:
+            Tuple[SphericalIndex, SphericalIndex]: (dispensary_index, tract_index) for state
+
+        Raises:
+            InvalidStateError: If state is not 'FL' or 'PA'
+        """
+        state = state.upper().strip()
+        dispensaries_df, census_df = self.get_state_data(state)
+
+        tract_index = self.tract_indexes.get(state)
+        dispensary_index = self.dispensary_indexes.get(state)
+        if (tract_index is None or dispensary_index is None or
+                self._index_versions.get(state) != self.get_tract_table(state).version or
+                len(tract_index) != len(census_df) or
+                len(dispensary_index) != len(dispensaries_df)):
+            self.build_spatial_indexes(state)
+
+        return self.dispensary_indexes[state], self.tract_indexes[state]
+
+    def get_tract_table(self, state: str) -> TractTable:
+        """
+        Get the indexed tract table for specified state.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+
+        Returns:
+            TractTable: State census tracts indexed by GEOID
+
+        Raises:
+            InvalidStateError: If state is not 'FL' or 'PA'
+        """
+        state = state.upper().strip()
+        self.ensure_state_loaded(state)
+        return self._tract_tables[state]
+
+    def find_tract(self, state: str, geoid: str) -> Optional[pd.Series]:
+        """
+        Look up one census tract by GEOID (constant time).
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            geoid (str): 11-digit census tract GEOID
+
+        Returns:
+            Series: Tract demographics, or None if the tract is not loaded
+        """
+        return self.get_tract_table(state).get(geoid)
+
+    def append_tract(self, state: str, tract: Dict) -> bool:
+        """
+        Add a tract fetched at runtime (e.g. from the ACS API) to a state.
+
+        The tract is buffered and merged into the state frame in bulk, so
+        appends stay cheap; it is visible to find_tract() immediately and to
+        get_state_data() on the next call.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            tract (dict or Series): Tract values including census_geoid
+
+        Returns:
+            bool: True if added, False if the tract was already present
+        """
+        state = state.upper().strip()
+        record = dict(tract)
+        record.setdefault('state', state)
+        return self.get_tract_table(state).append(record)
+
     def get_state_bounds(self, state: str) -> Dict[str, float]:
         """
         Get geographic boundaries for state validation.
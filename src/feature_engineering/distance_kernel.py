@@ -0,0 +1,251 @@
+"""
+Vectorized Distance Kernel
+
+NumPy-backed great-circle distances from one site to many points (census tract
+centroids or dispensaries) in a single array operation.
+
+The spherical (haversine) distance differs from the WGS84 geodesic used in
+training by at most ~0.56%. That error only matters for points sitting close to
+a radius boundary, where it could flip radius membership, so those points are
+optionally refined with an exact geodesic calculation. Every other point keeps
+its haversine distance.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import numpy as np
+from typing import Iterable, Optional
+from geopy.distance import geodesic
+
+# Mean Earth radius in miles (IUGG mean radius, 6,371,008.8 m)
+EARTH_RADIUS_MILES = 3958.7613
+
+# Worst-case relative error of the spherical approximation vs the WGS84 ellipsoid
+HAVERSINE_MAX_RELATIVE_ERROR = 0.0056
+
+# Absolute slack (miles) added to every refinement band
+BOUNDARY_ABSOLUTE_SLACK = 0.001
+
+
+def haversine_miles(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate great-circle distances from one point to many points.
+
+    Args:
+        latitude (float): Site latitude in decimal degrees
+        longitude (float): Site longitude in decimal degrees
+        latitudes (ndarray): Target latitudes in decimal degrees
+        longitudes (ndarray): Target longitudes in decimal degrees
+
+    Returns:
+        ndarray: Distances in miles (float64), same length as latitudes
+    """
+    lat1 = np.radians(latitude)
+    lon1 = np.radians(longitude)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon2 = np.radians(np.asarray(longitudes, dtype=np.float64))
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat / 2.0) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2.0) ** 2
+    # Clip guards against tiny floating point overshoot above 1.0
+    return 2.0 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def boundary_mask(
+    distances: np.ndarray,
+    radii: Iterable[float],
+    tolerance: float = HAVERSINE_MAX_RELATIVE_ERROR
+) -> np.ndarray:
+    """
+    Flag distances whose radius membership is ambiguous under the spherical model.
+
+    A point is flagged when it lies within the worst-case approximation error
+    of any radius, i.e. |distance - radius| <= radius * tolerance + slack.
+
+    Args:
+        distances (ndarray): Approximate distances in miles
+        radii (iterable): Radius boundaries in miles
+        tolerance (float): Relative error band around each radius
+
+    Returns:
+        ndarray: Boolean mask of points that need exact refinement
+    """
+    mask = np.zeros(len(distances), dtype=bool)
+    for radius in radii:
+        band = radius * tolerance + BOUNDARY_ABSOLUTE_SLACK
+        mask |= np.abs(distances - radius) <= band
+    return mask
+
+
+def refine_geodesic(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    distances: np.ndarray,
+    mask: np.ndarray
+) -> np.ndarray:
+    """
+    Replace masked distances with exact WGS84 geodesic distances.
+
+    Args:
+        latitude (float): Site latitude in decimal degrees
+        longitude (float): Site longitude in decimal degrees
+        latitudes (ndarray): Target latitudes in decimal degrees
+        longitudes (ndarray): Target longitudes in decimal degrees
+        distances (ndarray): Approximate distances in miles
+        mask (ndarray): Boolean mask of points to refine
+
+    Returns:
+        ndarray: Copy of distances with masked entries refined
+    """
+    refined = np.array(distances, dtype=np.float64, copy=True)
+    site = (latitude, longitude)
+    for i in np.flatnonzero(mask):
+        refined[i] = geodesic(site, (latitudes[i], longitudes[i])).miles
+    return refined
+
+
+def site_distances_miles(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    radii: Optional[Iterable[float]] = None,
+    refine: bool = True,
+    refine_within: Optional[float] = None
+) -> np.ndarray:
+    """
+    Distances from a site to every target point, refined where it matters.
+
+    Computes all haversine distances in one vectorized pass, then (optionally)
+    recomputes exact geodesic distances for points near a radius boundary and,
+    if refine_within is given, for every point inside that distance.
+
+    Args:
+        latitude (float): Site latitude in decimal degrees
+        longitude (float): Site longitude in decimal degrees
+        latitudes (ndarray): Target latitudes in decimal degrees
+        longitudes (ndarray): Target longitudes in decimal degrees
+        radii (iterable, optional): Radius boundaries (miles) to refine around
+        refine (bool): If False, return pure haversine distances
+        refine_within (float, optional): Refine all points within this many miles
+            (useful when the distances themselves feed a score, not just counts)
+
+    Returns:
+        ndarray: Distances in miles
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+
+    distances = haversine_miles(latitude, longitude, latitudes, longitudes)
+
+    if not refine or len(distances) == 0:
+        return distances
+
+    mask = np.zeros(len(distances), dtype=bool)
+    if radii is not None:
+        mask |= boundary_mask(distances, radii)
+    if refine_within is not None:
+        limit = refine_within * (1 + HAVERSINE_MAX_RELATIVE_ERROR) + BOUNDARY_ABSOLUTE_SLACK
+        mask |= distances <= limit
+
+    if not mask.any():
+        return distances
+
+    return refine_geodesic(latitude, longitude, latitudes, longitudes, distances, mask)
+
+
+def pairwise_haversine_miles(
+    site_latitudes: np.ndarray,
+    site_longitudes: np.ndarray,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate great-circle distances for every (site, target) pair.
+
+    Args:
+        site_latitudes (ndarray): Site latitudes in decimal degrees, shape (m,)
+        site_longitudes (ndarray): Site longitudes in decimal degrees, shape (m,)
+        latitudes (ndarray): Target latitudes in decimal degrees, shape (n,)
+        longitudes (ndarray): Target longitudes in decimal degrees, shape (n,)
+
+    Returns:
+        ndarray: (m, n) distance block in miles
+    """
+    lat1 = np.radians(np.asarray(site_latitudes, dtype=np.float64))[:, None]
+    lon1 = np.radians(np.asarray(site_longitudes, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))[None, :]
+    lon2 = np.radians(np.asarray(longitudes, dtype=np.float64))[None, :]
+
+    a = np.sin((lat2 - lat1) / 2.0) ** 2
+    a += np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    np.clip(a, 0.0, 1.0, out=a)
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2.0 * EARTH_RADIUS_MILES
+    return a
+
+
+def pairwise_site_distances_miles(
+    site_latitudes: np.ndarray,
+    site_longitudes: np.ndarray,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    radii: Optional[Iterable[float]] = None,
+    refine: bool = True,
+    refine_within: Optional[float] = None
+) -> np.ndarray:
+    """
+    Distance block from many sites to every target point, refined where it matters.
+
+    Block equivalent of site_distances_miles(): one vectorized haversine pass,
+    then exact geodesic refinement for pairs near a radius boundary (and, if
+    refine_within is given, for every pair inside that distance).
+
+    Args:
+        site_latitudes (ndarray): Site latitudes in decimal degrees, shape (m,)
+        site_longitudes (ndarray): Site longitudes in decimal degrees, shape (m,)
+        latitudes (ndarray): Target latitudes in decimal degrees, shape (n,)
+        longitudes (ndarray): Target longitudes in decimal degrees, shape (n,)
+        radii (iterable, optional): Radius boundaries (miles) to refine around
+        refine (bool): If False, return pure haversine distances
+        refine_within (float, optional): Refine all pairs within this many miles
+
+    Returns:
+        ndarray: (m, n) distance block in miles
+    """
+    site_latitudes = np.asarray(site_latitudes, dtype=np.float64)
+    site_longitudes = np.asarray(site_longitudes, dtype=np.float64)
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+
+    distances = pairwise_haversine_miles(site_latitudes, site_longitudes, latitudes, longitudes)
+
+    if not refine or distances.size == 0:
+        return distances
+
+    mask = np.zeros(distances.shape, dtype=bool)
+    if radii is not None:
+        for radius in radii:
+            band = radius * HAVERSINE_MAX_RELATIVE_ERROR + BOUNDARY_ABSOLUTE_SLACK
+            mask |= np.abs(distances - radius) <= band
+    if refine_within is not None:
+        limit = refine_within * (1 + HAVERSINE_MAX_RELATIVE_ERROR) + BOUNDARY_ABSOLUTE_SLACK
+        mask |= distances <= limit
+
+    for i, j in zip(*np.nonzero(mask)):
+        distances[i, j] = geodesic(
+            (site_latitudes[i], site_longitudes[i]), (latitudes[j], longitudes[j])
+        ).miles
+
+    return distances
@@ -0,0 +1,267 @@
+"""
+Census Gazetteer Tract Index
+
+In-memory, GEOID-keyed store of tract centroids (INTPTLAT/INTPTLONG) and land
+areas (ALAND) from the Census Bureau's 2020 tract Gazetteer files.
+
+Each state's file is parsed at most once per process. The parsed arrays are
+persisted next to the other census caches as a compact .npz file, stamped with
+the source file's size and modification time, so later processes skip the
+text parse entirely. GEOIDs are stored as sorted int64 keys and looked up by
+binary search.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# State FIPS codes of the Gazetteer files used by the model
+GAZETTEER_STATE_FIPS = {'FL': '12', 'PA': '42'}
+
+# Process-level cache of loaded indexes, keyed by resolved source path
+_INDEXES: Dict[Path, 'GazetteerIndex'] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def geoid_keys(geoids: Iterable) -> np.ndarray:
+    """
+    Convert GEOID strings to int64 keys.
+
+    Args:
+        geoids (iterable): 11-digit GEOID strings
+
+    Returns:
+        ndarray: int64 keys, -1 where a GEOID is missing or not numeric
+    """
+    keys = pd.to_numeric(pd.Series(list(geoids), dtype=object), errors='coerce')
+    return keys.fillna(-1).to_numpy(dtype=np.int64)
+
+
+class GazetteerIndex:
+    """
+    Sorted GEOID index over one Gazetteer tract file.
+
+    Attributes:
+        keys (ndarray): Sorted int64 GEOID keys
+        latitudes (ndarray): Internal point latitude per key (INTPTLAT)
+        longitudes (ndarray): Internal point longitude per key (INTPTLONG)
+        land_areas (ndarray): Land area in square meters per key (ALAND)
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        land_areas: np.ndarray
+    ):
+        order = np.argsort(keys, kind='stable')
+        self.keys = np.asarray(keys, dtype=np.int64)[order]
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)[order]
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)[order]
+        self.land_areas = np.asarray(land_areas, dtype=np.float64)[order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, geoid: str) -> bool:
+        return self._position(geoid) is not None
+
+    @classmethod
+    def from_text(cls, path: Path) -> 'GazetteerIndex':
+        """
+        Parse a tab-separated Gazetteer tract file.
+
+        Args:
+            path (Path): Path to 2020_Gaz_tracts_{fips}.txt
+
+        Returns:
+            GazetteerIndex: Index over every tract in the file
+        """
+        gaz_df = pd.read_csv(path, sep='\t', dtype={'GEOID': str})
+        gaz_df.columns = gaz_df.columns.str.strip()  # Gazetteer headers have trailing spaces
+
+        land_areas = gaz_df['ALAND'] if 'ALAND' in gaz_df.columns else np.zeros(len(gaz_df))
+        return cls(
+            geoid_keys(gaz_df['GEOID']),
+            gaz_df['INTPTLAT'].to_numpy(dtype=np.float64),
+            gaz_df['INTPTLONG'].to_numpy(dtype=np.float64),
+            np.asarray(land_areas, dtype=np.float64)
+        )
+
+    @classmethod
+    def load(cls, path: Path, cache_path: Optional[Path] = None) -> 'GazetteerIndex':
+        """
+        Load an index, preferring a persisted binary copy of the source file.
+
+        The cache is used only if its stamp (source size and mtime) matches the
+        current source file; otherwise the text file is parsed and the cache
+        rewritten.
+
+        Args:
+            path (Path): Gazetteer text file
+            cache_path (Path, optional): .npz cache location (no caching if None)
+
+        Returns:
+            GazetteerIndex: Loaded index
+        """
+        stat = Path(path).stat()
+        stamp = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+        if cache_path is not None and Path(cache_path).exists():
+            try:
+                with np.load(cache_path) as cached:
+                    if np.array_equal(cached['source_stamp'], stamp):
+                        return cls(
+                            cached['keys'], cached['latitudes'],
+                            cached['longitudes'], cached['land_areas']
+                        )
+            except (OSError, KeyError, ValueError):
+                pass  # Unreadable cache - rebuild below
+
+        index = cls.from_text(path)
+
+        if cache_path is not None:
+            index.save(cache_path, stamp)
+
+        return index
+
+    def save(self, cache_path: Path, source_stamp: np.ndarray) -> None:
+        """
+        Persist the index as an .npz file (written atomically).
+
+        Args:
+            cache_path (Path): Destination .npz path
+            source_stamp (ndarray): (size, mtime_ns) of the source file
+        """
+        cache_path = Path(cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.stem + '.tmp.npz')
+
+        np.savez(
+            tmp_path,
+            keys=self.keys,
+            latitudes=self.latitudes,
+            longitudes=self.longitudes,
+            land_areas=self.land_areas,
+            source_stamp=source_stamp
+        )
+        tmp_path.replace(cache_path)
+
+    def _position(self, geoid: str) -> Optional[int]:
+        """Array position of a GEOID, or None if absent."""
+        key = geoid_keys([geoid])[0]
+        if key < 0:
+            return None
+        position = int(np.searchsorted(self.keys, key))
+        if position < len(self.keys) and self.keys[position] == key:
+            return position
+        return None
+
+    def lookup(self, geoid: str) -> Optional[Dict[str, float]]:
+        """
+        Look up one tract.
+
+        Args:
+            geoid (str): 11-digit census tract GEOID
+
+        Returns:
+            dict: {'latitude': float, 'longitude': float, 'area_sqm': float} or None
+        """
+        position = self._position(geoid)
+        if position is None:
+            return None
+
+        return {
+            'latitude': float(self.latitudes[position]),
+            'longitude': float(self.longitudes[position]),
+            'area_sqm': float(self.land_areas[position])
+        }
+
+    def lookup_many(self, geoids: Iterable) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Look up many tracts at once.
+
+        Args:
+            geoids (iterable): 11-digit census tract GEOIDs
+
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]: (latitudes, longitudes, land areas),
+                NaN for GEOIDs not in the index
+        """
+        keys = geoid_keys(geoids)
+        results = tuple(np.full(len(keys), np.nan) for _ in range(3))
+        if len(self.keys) == 0:
+            return results
+
+        positions = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = (keys >= 0) & (self.keys[positions] == keys)
+
+        for column, values in zip(results, (self.latitudes, self.longitudes, self.land_areas)):
+            column[found] = values[positions[found]]
+
+        return results
+
+
+def gazetteer_path(project_root: Path, state: str) -> Optional[Path]:
+    """
+    Path of a state's Gazetteer tract file.
+
+    Args:
+        project_root (Path): Repository root
+        state (str): State code ('FL' or 'PA')
+
+    Returns:
+        Path: Gazetteer file path, or None for unsupported states
+    """
+    state_fips = GAZETTEER_STATE_FIPS.get(state.upper())
+    if state_fips is None:
+        return None
+    return Path(project_root) / "data" / "census" / "gazeteer" / f"2020_Gaz_tracts_{state_fips}.txt"
+
+
+def get_gazetteer_index(project_root: Path, state: str) -> Optional[GazetteerIndex]:
+    """
+    Shared Gazetteer index for a state, loaded at most once per process.
+
+    Args:
+        project_root (Path): Repository root
+        state (str): State code ('FL' or 'PA')
+
+    Returns:
+        GazetteerIndex: The state's index, or None if the state is unsupported
+            or its Gazetteer file is missing
+    """
+    path = gazetteer_path(project_root, state)
+    if path is None or not path.exists():
+        return None
+
+    path = path.resolve()
+    with _INDEX_LOCK:
+        index = _INDEXES.get(path)
+        if index is None:
+            cache_path = Path(project_root) / "data" / "census" / "cache" / f"gazetteer_{path.stem}.npz"
+            index = GazetteerIndex.load(path, cache_path)
+            _INDEXES[path] = index
+
+    return index
+
+
+def clear_gazetteer_indexes(paths: Optional[Iterable[Path]] = None) -> None:
+    """
+    Drop process-level indexes (e.g. after replacing Gazetteer files).
+
+    Args:
+        paths (iterable, optional): Gazetteer files whose indexes to drop (default: all)
+    """
+    with _INDEX_LOCK:
+        if paths is None:
+            _INDEXES.clear()
+        else:
+            for path in paths:
+                _INDEXES.pop(Path(path).resolve(), None)
@@ -7,7 +7,7 @@ Uses state-specific Albers equal-area projections for accurate distance-based bu
 CRITICAL IMPLEMENTATION NOTES:
 1. Area-weighting prevents over-counting in sparse counties
 2. State-specific CRS ensures accurate circular buffers (not ellipses)
-3. Multi-radius approach (1, 3, 5, 10, 20 mi) based on trade area analysis
+3. Multi-radius approach (default 1, 3, 5, 10, 20 mi) based on trade area analysis
 
 Author: Multi-State Dispensary Model - Phase 2
 Date: October 2025
@@ -22,6 +22,14 @@ from typing import Dict, List, Tuple
 import pygris
 import warnings
 
+try:
+    from .site_context import validate_radii
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from site_context import validate_radii
+
 # Suppress pygris warnings about cached data
 warnings.filterwarnings('ignore', category=UserWarning, module='pygris')
 
@@ -53,7 +61,7 @@ class GeographicAnalyzer:
     # Miles to meters conversion
     MILES_TO_METERS = 1609.34
 
-    # Radii to calculate (based on trade area analysis)
+    # Default radii to calculate (based on trade area analysis)
     RADII_MILES = [1, 3, 5, 10, 20]
 
     # State-specific CRS (Albers equal-area projections)
@@ -68,13 +76,17 @@ class GeographicAnalyzer:
         'PA': '42'
     }
 
-    def __init__(self, cache_dir: str = "data/census/tract_shapefiles"):
+    def __init__(self, cache_dir: str = "data/census/tract_shapefiles", radii: List[float] = None):
         """
         Initialize Geographic Analyzer.
 
         Args:
             cache_dir: Directory for caching tract shapefiles
+            radii: Trade area radii in miles (default: RADII_MILES)
         """
+        if radii is not None:
+            self.RADII_MILES = validate_radii(radii)
+
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -276,15 +288,16 @@ class GeographicAnalyzer:
         tract_populations: gpd.GeoDataFrame
     ) -> Dict:
         """
-        Calculate area-weighted population within 1, 3, 5, 10, 20 mile radii.
+        Calculate area-weighted population within each trade area radius.
 
         Based on Insa trade area analysis showing ~19% of visits from 30+ miles.
 
         Implementation:
         1. Reproject point from WGS84 to state-specific Albers CRS
         2. Create buffers in planar CRS (accurate distance-based circles)
-        3. Calculate area-weighted population for each buffer
-        4. Validate monotonic increase (1mi <= 3mi <= ... <= 20mi)
+        3. Find candidate tracts once with the largest buffer
+        4. Calculate area-weighted population for each buffer over the candidates
+        5. Validate monotonic increase (1mi <= 3mi <= ... <= 20mi)
 
         Args:
             latitude: Dispensary latitude (WGS84)
@@ -339,6 +352,13 @@ class GeographicAnalyzer:
             'crs_used': self.STATE_CRS[state]
         }
 
+        # Every tract touching a smaller buffer also touches the largest one, so a
+        # single spatial query over the full state bounds the work for all radii
+        outer_buffer, _ = self.create_buffer(latitude, longitude, max(self.RADII_MILES), state)
+        candidates = tracts_with_pop.iloc[
+            tracts_with_pop.sindex.query(outer_buffer, predicate='intersects')
+        ]
+
         for radius in self.RADII_MILES:
             # Create buffer
             buffer, crs = self.create_buffer(latitude, longitude, radius, state)
@@ -346,7 +366,7 @@ class GeographicAnalyzer:
             # Calculate area-weighted population
             pop_data = self.calculate_area_weighted_population(
                 buffer,
-                tracts_with_pop,
+                candidates,
                 population_col='B01001_001E'
             )
 
@@ -0,0 +1,163 @@
+"""
+Loader Snapshot
+
+Binary columnar snapshot of the tables MultiStateDataLoader builds at
+startup (training data, per-state dispensaries, per-state census tracts with
+centroids), so later processes skip CSV parsing, cleaning and the centroid
+merge entirely.
+
+Each table is stored column by column in a single uncompressed .npz file
+(numpy only, no pickling): numeric and boolean columns as native arrays,
+categorical columns as codes plus JSON-encoded categories, object columns
+(names, GEOIDs, mixed values) as one JSON-encoded string.
+The file is stamped with a SHA-256 digest of the source files' contents and
+of SNAPSHOT_FORMAT; a snapshot whose digest no longer matches is ignored and
+rebuilt by the loader.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Bump whenever the loader's cleaning logic or the file layout changes
+SNAPSHOT_FORMAT = 2
+
+_KEY_ENTRY = '__source_digest__'
+_TABLES_ENTRY = '__tables__'
+
+
+def source_digest(paths: Iterable[Path]) -> str:
+    """
+    Content digest of the files a snapshot is derived from.
+
+    Args:
+        paths (iterable): Source file paths (missing files are recorded as missing)
+
+    Returns:
+        str: Hex SHA-256 of SNAPSHOT_FORMAT, each file name and each file's bytes
+    """
+    digest = hashlib.sha256(f"format={SNAPSHOT_FORMAT}".encode())
+
+    for path in paths:
+        path = Path(path)
+        digest.update(f"\0{path.name}\0".encode())
+        if not path.exists():
+            digest.update(b'<missing>')
+            continue
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _json_scalar(value):
+    """JSON fallback for numpy scalars stored in object columns."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot snapshot value of type {type(value).__name__}")
+
+
+def _frame_entries(name: str, frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Flatten one DataFrame into named .npz entries."""
+    columns: List[Dict[str, str]] = []
+    entries = {f"{name}/__index__": frame.index.to_numpy()}
+
+    for i, (column, series) in enumerate(frame.items()):
+        key = f"{name}/{i}"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            entries[key] = series.cat.codes.to_numpy()
+            columns.append({
+                'name': column, 'kind': 'category',
+                'categories': json.dumps(series.cat.categories.tolist(), default=_json_scalar)
+            })
+        elif series.dtype == object:
+            entries[key] = np.array(json.dumps(series.tolist(), default=_json_scalar))
+            columns.append({'name': column, 'kind': 'json'})
+        else:
+            entries[key] = series.to_numpy()
+            columns.append({'name': column, 'kind': 'array'})
+
+    entries[f"{name}/__columns__"] = np.array(json.dumps(columns))
+    return entries
+
+
+def _read_frame(data, name: str) -> pd.DataFrame:
+    """Rebuild one DataFrame written by _frame_entries()."""
+    columns = json.loads(str(data[f"{name}/__columns__"]))
+    values = {}
+
+    for i, column in enumerate(columns):
+        entry = data[f"{name}/{i}"]
+        if column['kind'] == 'json':
+            values[column['name']] = pd.Series(json.loads(str(entry)), dtype=object)
+        elif column['kind'] == 'category':
+            values[column['name']] = pd.Categorical.from_codes(entry, json.loads(column['categories']))
+        else:
+            values[column['name']] = entry
+
+    frame = pd.DataFrame(values, columns=[c['name'] for c in columns])
+    frame.index = data[f"{name}/__index__"]
+    return frame
+
+
+def save_snapshot(path: Path, digest: str, tables: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write tables to a snapshot file (atomically).
+
+    Args:
+        path (Path): Destination .npz path
+        digest (str): source_digest() of the files the tables were built from
+        tables (dict): Table name -> DataFrame
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    entries = {
+        _KEY_ENTRY: np.array(digest),
+        _TABLES_ENTRY: np.array(json.dumps(list(tables)))
+    }
+    for name, frame in tables.items():
+        entries.update(_frame_entries(name, frame))
+
+    tmp_path = path.with_name(path.stem + '.tmp.npz')
+    np.savez(tmp_path, **entries)
+    tmp_path.replace(path)
+
+
+def load_snapshot(path: Path, digest: str, names: Optional[Iterable[str]] = None) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Read a snapshot if it exists and was built from the current sources.
+
+    Only the requested tables are read from disk.
+
+    Args:
+        path (Path): Snapshot .npz path
+        digest (str): Expected source_digest()
+        names (iterable, optional): Tables to read (default: all); names not
+            in the snapshot are omitted from the result
+
+    Returns:
+        dict: Table name -> DataFrame, or None if the snapshot is missing,
+            stale or unreadable
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data[_KEY_ENTRY]) != digest:
+                return None
+            stored = json.loads(str(data[_TABLES_ENTRY]))
+            if names is not None:
+                stored = [name for name in stored if name in set(names)]
+            return {name: _read_frame(data, name) for name in stored}
+    except (OSError, KeyError, ValueError):
+        return None  # Unreadable snapshot - caller rebuilds it
@@ -0,0 +1,301 @@
+"""
+Offline Census Tract Resolver
+
+Point-in-polygon census tract identification from TIGER/Line tract polygons,
+with no network round trip per lookup.
+
+Polygons are obtained once per state through GeographicAnalyzer._load_tracts
+(pygris, same TIGER vintage as the population buffers), reprojected to WGS84
+and persisted locally as WKB in a compact .npz file. Later processes load the
+polygons from that file, prepare them, and build a shapely STRtree, so each
+lookup is a tree query plus a prepared-geometry containment test.
+
+shapely (and, for the first download, geopandas/pygris) are optional: if they
+are unavailable the resolver reports itself unavailable and callers fall back
+to the Census Geocoding API.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import threading
+import logging
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import shapely
+    from shapely import STRtree
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _StateTracts:
+    """Prepared tract polygons and their STRtree for one state."""
+
+    def __init__(self, geoids: np.ndarray, geometries: np.ndarray):
+        self.geoids = np.asarray(geoids, dtype='<U11')
+        self.geometries = geometries
+        self.positions = {geoid: i for i, geoid in enumerate(self.geoids.tolist())}
+        shapely.prepare(self.geometries)
+        self.tree = STRtree(self.geometries)
+
+
+class OfflineTractResolver:
+    """
+    Resolve coordinates to census tracts from locally persisted TIGER polygons.
+
+    Results use the same dict format as
+    CensusTractIdentifier.get_tract_from_coordinates(), plus 'source': 'offline'.
+
+    Attributes:
+        cache_dir (Path): Directory holding tract_polygons_{fips}_{year}.npz files
+        allow_download (bool): Fetch polygons via pygris when no local copy exists
+    """
+
+    STATE_FIPS = {'FL': '12', 'PA': '42'}
+
+    # Same TIGER/Line vintage as GeographicAnalyzer._load_tracts
+    TIGER_YEAR = 2023
+
+    def __init__(self, cache_dir: str = "data/census/cache", allow_download: bool = True):
+        """
+        Initialize the resolver. Polygons are loaded lazily per state.
+
+        Args:
+            cache_dir: Directory for persisted tract polygons
+            allow_download: Download polygons via pygris if not persisted yet
+        """
+        self.cache_dir = Path(cache_dir)
+        self.allow_download = allow_download
+        self._states: Dict[str, _StateTracts] = {}
+        self._unavailable: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """Whether the geometry engine (shapely) is installed."""
+        return SHAPELY_AVAILABLE
+
+    def polygon_file(self, state: str) -> Path:
+        """Local path of a state's persisted tract polygons."""
+        return self.cache_dir / f"tract_polygons_{self.STATE_FIPS[state]}_{self.TIGER_YEAR}.npz"
+
+    def add_state(self, state: str, geoids: Sequence[str], geometries: Sequence, persist: bool = True) -> None:
+        """
+        Register tract polygons for a state (WGS84 lon/lat geometries).
+
+        Args:
+            state: 'FL' or 'PA'
+            geoids: 11-digit tract GEOIDs
+            geometries: shapely Polygon/MultiPolygon per GEOID
+            persist: Also write them to polygon_file(state)
+        """
+        geometries = np.asarray(geometries, dtype=object)
+        tracts = _StateTracts(np.asarray(geoids), geometries)
+
+        if persist:
+            self._save(self.polygon_file(state), tracts)
+
+        with self._lock:
+            self._states[state] = tracts
+            self._unavailable.pop(state, None)
+
+    def _save(self, path: Path, tracts: _StateTracts) -> None:
+        """Write geometries as concatenated WKB plus offsets (no pickling)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        wkb = shapely.to_wkb(tracts.geometries)
+        lengths = np.fromiter((len(b) for b in wkb), dtype=np.int64, count=len(wkb))
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        blob = np.frombuffer(b''.join(wkb), dtype=np.uint8)
+
+        tmp_path = path.with_name(path.stem + '.tmp.npz')
+        np.savez(tmp_path, geoids=tracts.geoids, wkb=blob, offsets=offsets)
+        tmp_path.replace(path)
+        logger.info(f"Saved {len(tracts.geoids)} tract polygons to {path}")
+
+    def _load(self, path: Path) -> _StateTracts:
+        """Read geometries written by _save()."""
+        with np.load(path) as data:
+            geoids = data['geoids']
+            blob = data['wkb'].tobytes()
+            offsets = data['offsets']
+
+        wkb = [blob[offsets[i]:offsets[i + 1]] for i in range(len(geoids))]
+        return _StateTracts(geoids, shapely.from_wkb(wkb))
+
+    def _download(self, state: str) -> None:
+        """Fetch TIGER tract polygons via GeographicAnalyzer and persist them."""
+        try:
+            from .geographic_analyzer import GeographicAnalyzer
+        except ImportError:
+            import sys
+            sys.path.insert(0, str(Path(__file__).parent))
+            from geographic_analyzer import GeographicAnalyzer
+
+        tracts_gdf = GeographicAnalyzer()._load_tracts(state).to_crs('EPSG:4326')
+        self.add_state(state, tracts_gdf['GEOID'].astype(str).to_numpy(), tracts_gdf.geometry.to_numpy())
+
+    def _get_state(self, state: str) -> Optional[_StateTracts]:
+        """Load (once) and return a state's tracts, or None if unavailable."""
+        with self._lock:
+            if state in self._states:
+                return self._states[state]
+            if state in self._unavailable:
+                return None
+
+        if not SHAPELY_AVAILABLE:
+            reason = 'shapely not installed'
+        elif state not in self.STATE_FIPS:
+            reason = f'unsupported state {state}'
+        else:
+            reason = None
+            try:
+                path = self.polygon_file(state)
+                if path.exists():
+                    tracts = self._load(path)
+                    with self._lock:
+                        self._states[state] = tracts
+                    logger.info(f"Loaded {len(tracts.geoids)} {state} tract polygons from {path}")
+                elif self.allow_download:
+                    self._download(state)
+                else:
+                    reason = f'no tract polygons at {path}'
+            except Exception as e:
+                reason = f'failed to load tract polygons: {e}'
+
+        if reason is not None:
+            logger.warning(f"Offline tract resolution unavailable for {state}: {reason}")
+            with self._lock:
+                self._unavailable[state] = reason
+            return None
+
+        return self._states[state]
+
+    def resolve(self, latitude: float, longitude: float, state: str) -> Dict:
+        """
+        Identify the census tract containing a point.
+
+        Points exactly on a shared tract boundary resolve to the lowest GEOID.
+
+        Args:
+            latitude: Latitude in decimal degrees (WGS84)
+            longitude: Longitude in decimal degrees (WGS84)
+            state: 'FL' or 'PA'
+
+        Returns:
+            dict: {
+                'state_fips', 'county_fips', 'tract_fips', 'geoid', 'tract_name',
+                'success': bool, 'error': Optional[str], 'source': 'offline'
+            }
+        """
+        state = state.upper().strip()
+        tracts = self._get_state(state)
+
+        if tracts is None:
+            return self.failure_result(f"Offline tract polygons unavailable: {self._unavailable.get(state)}")
+
+        hits = tracts.tree.query(shapely.Point(longitude, latitude), predicate='intersects')
+        if len(hits) == 0:
+            return self.failure_result('No census tract found')
+
+        geoid = str(min(tracts.geoids[hits]))
+        return {
+            'state_fips': geoid[:2],
+            'county_fips': geoid[2:5],
+            'tract_fips': geoid[5:],
+            'geoid': geoid,
+            'tract_name': None,
+            'success': True,
+            'error': None,
+            'source': 'offline'
+        }
+
+    def resolve_many(self, latitudes: Sequence[float], longitudes: Sequence[float], state: str) -> List[Optional[str]]:
+        """
+        Identify tracts for many points in one tree query.
+
+        Args:
+            latitudes: Latitudes in decimal degrees (WGS84)
+            longitudes: Longitudes in decimal degrees (WGS84)
+            state: 'FL' or 'PA'
+
+        Returns:
+            list: GEOID per point, None where no tract contains the point
+                (or polygons are unavailable)
+        """
+        state = state.upper().strip()
+        tracts = self._get_state(state)
+        result: List[Optional[str]] = [None] * len(latitudes)
+
+        if tracts is None or len(result) == 0:
+            return result
+
+        points = shapely.points(np.asarray(longitudes, dtype=np.float64), np.asarray(latitudes, dtype=np.float64))
+        point_idx, tract_idx = tracts.tree.query(points, predicate='intersects')
+
+        # Lowest GEOID wins on shared boundaries, matching resolve()
+        for p, t in zip(point_idx, tract_idx):
+            geoid = str(tracts.geoids[t])
+            if result[p] is None or geoid < result[p]:
+                result[p] = geoid
+
+        return result
+
+    def contains(self, geoid: str, latitude: float, longitude: float, state: str) -> Optional[bool]:
+        """
+        Whether a point lies strictly inside a given tract.
+
+        Much cheaper than resolve() when the candidate tract is already known
+        (e.g. a site moved slightly from a previously resolved position).
+
+        Args:
+            geoid: 11-digit tract GEOID
+            latitude: Latitude in decimal degrees (WGS84)
+            longitude: Longitude in decimal degrees (WGS84)
+            state: 'FL' or 'PA'
+
+        Returns:
+            bool: True/False, or None if the tract's polygon is not available
+        """
+        tracts = self._get_state(state.upper().strip())
+        if tracts is None:
+            return None
+
+        position = tracts.positions.get(geoid)
+        if position is None:
+            return None
+
+        return bool(shapely.contains_xy(tracts.geometries[position], longitude, latitude))
+
+    def polygon(self, geoid: str):
+        """
+        A tract's polygon (WGS84), or None if its state's polygons are unavailable.
+
+        Args:
+            geoid: 11-digit tract GEOID (state taken from its FIPS prefix)
+        """
+        state = next((s for s, fips in self.STATE_FIPS.items() if geoid.startswith(fips)), None)
+        tracts = self._get_state(state) if state is not None else None
+        if tracts is None:
+            return None
+
+        position = tracts.positions.get(geoid)
+        return tracts.geometries[position] if position is not None else None
+
+    @staticmethod
+    def failure_result(error: str) -> Dict:
+        return {
+            'state_fips': None,
+            'county_fips': None,
+            'tract_fips': None,
+            'geoid': None,
+            'tract_name': None,
+            'success': False,
+            'error': error,
+            'source': 'offline'
+        }
@@ -0,0 +1,174 @@
+"""
+Shared Data Plane
+
+Lets a pool of worker processes use one copy of the loader's tables instead
+of each worker parsing and holding its own.
+
+The parent publishes every column of the per-state census and dispensary
+tables as a raw .npy file in one directory (with a manifest.json). Workers
+memory-map those files read-only, so numeric columns (coordinates,
+populations, demographics) are backed by the same page-cache pages in every
+process; only object columns (GEOIDs, names, nullable flags) are
+materialized per worker.
+
+Memory-mapped files are used rather than multiprocessing.shared_memory
+blocks: they need no resource-tracker bookkeeping, survive worker crashes
+without leaking segments, and are cleaned up by removing one directory.
+
+Typical use:
+
+    with loader.publish_shared() as plane:
+        with ProcessPoolExecutor(initializer=init_worker, initargs=(str(plane.path),)) as pool:
+            ...
+
+    # in each worker
+    loader = MultiStateDataLoader.from_shared(path)
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import json
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def publish_tables(directory: Path, tables: Dict[str, pd.DataFrame]) -> Path:
+    """
+    Write tables column by column as memory-mappable .npy files.
+
+    Args:
+        directory (Path): Destination directory (created if missing)
+        tables (dict): Table name -> DataFrame
+
+    Returns:
+        Path: The directory
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+
+    for name, frame in tables.items():
+        columns = []
+        for i, (column, series) in enumerate(frame.items()):
+            spec = {'name': column, 'file': f"{name}.{i}.npy"}
+
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                np.save(directory / spec['file'], series.cat.codes.to_numpy())
+                spec['kind'] = 'category'
+                spec['categories'] = [
+                    value.item() if isinstance(value, np.generic) else value
+                    for value in series.cat.categories
+                ]
+            elif series.dtype == object:
+                inferred = pd.api.types.infer_dtype(series, skipna=True)
+                if inferred == 'boolean':
+                    spec['kind'], fill, dtype = 'bool', False, bool
+                elif inferred in ('string', 'empty'):
+                    spec['kind'], fill, dtype = 'str', '', str
+                else:
+                    raise TypeError(f"Cannot share column '{column}' of table '{name}' ({inferred} values)")
+
+                nulls = series.isna().to_numpy()
+                np.save(directory / spec['file'], series.where(~nulls, fill).to_numpy(dtype=dtype))
+                if nulls.any():
+                    spec['nulls'] = f"{name}.{i}.nulls.npy"
+                    np.save(directory / spec['nulls'], nulls)
+            else:
+                np.save(directory / spec['file'], series.to_numpy())
+                spec['kind'] = 'array'
+
+            columns.append(spec)
+
+        manifest[name] = {'rows': len(frame), 'columns': columns}
+
+    # Manifest last: its presence marks a complete publication
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest))
+    return directory
+
+
+def attach_tables(directory: Path) -> Dict[str, pd.DataFrame]:
+    """
+    Open tables written by publish_tables() without copying numeric data.
+
+    Args:
+        directory (Path): Directory passed to publish_tables()
+
+    Returns:
+        dict: Table name -> DataFrame (RangeIndex); numeric columns are
+            read-only views of the memory-mapped files
+
+    Raises:
+        FileNotFoundError: If the directory holds no complete publication
+    """
+    directory = Path(directory)
+    manifest = json.loads((directory / MANIFEST_NAME).read_text())
+    tables = {}
+
+    for name, table in manifest.items():
+        values = {}
+        for spec in table['columns']:
+            # Plain read-only ndarray view of the mapping (no np.memmap subclass in frames)
+            data = np.asarray(np.load(directory / spec['file'], mmap_mode='r'))
+            if spec['kind'] in ('str', 'bool'):
+                column = data.astype(object)
+                if 'nulls' in spec:
+                    column[np.load(directory / spec['nulls'])] = np.nan
+                data = column
+            elif spec['kind'] == 'category':
+                data = pd.Categorical.from_codes(data, spec['categories'])
+            values[spec['name']] = data
+
+        tables[name] = pd.DataFrame(
+            values, columns=[spec['name'] for spec in table['columns']],
+            index=pd.RangeIndex(table['rows']), copy=False
+        )
+
+    return tables
+
+
+class SharedDataPlane:
+    """
+    A published set of loader tables, removed on close().
+
+    Attributes:
+        path (Path): Directory to pass to MultiStateDataLoader.from_shared()
+    """
+
+    def __init__(self, tables: Dict[str, pd.DataFrame], directory: Optional[Path] = None):
+        """
+        Publish tables.
+
+        Args:
+            tables (dict): Table name -> DataFrame
+            directory (Path, optional): Where to write the column files.
+                Default: a new temporary directory
+        """
+        self._owns_directory = directory is None
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='dispensary_data_plane_')
+        self.path = publish_tables(Path(directory), tables)
+
+    def close(self) -> None:
+        """Remove the published files (workers that already attached keep their mappings)."""
+        if self.path is None:
+            return
+        if self._owns_directory:
+            shutil.rmtree(self.path, ignore_errors=True)
+        else:
+            for file in self.path.glob('*.npy'):
+                file.unlink(missing_ok=True)
+            (self.path / MANIFEST_NAME).unlink(missing_ok=True)
+        self.path = None
+
+    def __enter__(self) -> 'SharedDataPlane':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
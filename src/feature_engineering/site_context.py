@@ -0,0 +1,474 @@
+"""
+Per-Site Distance Context
+
+Holds the distances from one candidate site to every census tract centroid and
+every dispensary in its state. The context is computed once per site and then
+shared by the population, competitor, normalized-competition and
+weighted-competition features, so a site costs exactly one distance pass per
+dataset.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+try:
+    from .distance_kernel import (
+        haversine_miles, site_distances_miles, HAVERSINE_MAX_RELATIVE_ERROR, BOUNDARY_ABSOLUTE_SLACK
+    )
+    from .spatial_index import SphericalIndex
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent))
+    from distance_kernel import (
+        haversine_miles, site_distances_miles, HAVERSINE_MAX_RELATIVE_ERROR, BOUNDARY_ABSOLUTE_SLACK
+    )
+    from spatial_index import SphericalIndex
+
+
+def validate_radii(radii: List[float]) -> List[float]:
+    """
+    Validate and normalize an analysis radius ladder.
+
+    Args:
+        radii (list): Radii in miles
+
+    Returns:
+        list: Sorted, de-duplicated radii (whole miles as int, so feature
+            names read 'pop_5mi' rather than 'pop_5.0mi')
+
+    Raises:
+        ValueError: If radii is empty or contains non-positive values
+    """
+    radii = sorted(set(int(r) if float(r).is_integer() else float(r) for r in radii))
+    if not radii:
+        raise ValueError("At least one analysis radius is required")
+    if radii[0] <= 0:
+        raise ValueError(f"Analysis radii must be positive, got {radii[0]}")
+    return radii
+
+
+def _candidate_positions(
+    index: Optional[SphericalIndex],
+    size: int,
+    latitude: float,
+    longitude: float,
+    radius_miles: float
+) -> np.ndarray:
+    """
+    Row positions that can possibly lie within radius_miles of the site.
+
+    The search radius is widened by the spherical approximation's error bound
+    so no point whose exact geodesic distance is within the radius is missed.
+    Without an index, every row is a candidate.
+    """
+    if index is None:
+        return np.arange(size)
+
+    search_radius = radius_miles * (1 + HAVERSINE_MAX_RELATIVE_ERROR) + BOUNDARY_ABSOLUTE_SLACK
+    return index.query_radius(latitude, longitude, search_radius)
+
+
+def column_rows(frame: pd.DataFrame, column: str, positions: np.ndarray) -> np.ndarray:
+    """
+    A numeric column's values at row positions, as float64.
+
+    Rows are selected before upcasting, so a compact float32/int32 column is
+    not converted in full for every site.
+    """
+    return frame[column].to_numpy()[positions].astype(np.float64)
+
+
+def cumulative_within(
+    distances: np.ndarray,
+    radii: List[float],
+    weights: Optional[np.ndarray] = None,
+    inclusive: bool = True
+) -> np.ndarray:
+    """
+    Count (or weighted sum) of points within each radius from a single sort.
+
+    Distances are sorted once; each radius is then a binary search into the
+    sorted distances plus a lookup into the cumulative weights, so adding
+    radii costs O(log n) each rather than another pass over every point.
+
+    Args:
+        distances (ndarray): (n,) distances in miles (NaN never counts)
+        radii (list): Radii in miles, any order
+        weights (ndarray, optional): (n,) weight per point (NaN treated as 0).
+            Default: count points.
+        inclusive (bool): Count distance <= radius if True, < radius if False
+
+    Returns:
+        ndarray: One value per radius (int64 counts, or float64 weighted sums)
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    order = np.argsort(distances, kind='stable')
+    positions = np.searchsorted(
+        distances[order], np.asarray(radii, dtype=np.float64),
+        side='right' if inclusive else 'left'
+    )
+
+    if weights is None:
+        return positions.astype(np.int64)
+
+    weights = np.nan_to_num(np.asarray(weights, dtype=np.float64))
+    cumulative = np.concatenate([[0.0], np.cumsum(weights[order])])
+    return cumulative[positions]
+
+
+def cumulative_within_blocks(
+    distances: np.ndarray,
+    radii: List[float],
+    weights: Optional[np.ndarray] = None,
+    inclusive: bool = True
+) -> np.ndarray:
+    """
+    Block equivalent of cumulative_within(): one row of results per site.
+
+    Each distance is binary-searched into the sorted radius ladder to find the
+    smallest radius containing it; per-site bucket totals are accumulated in
+    one bincount and turned into per-radius totals with a cumulative sum.
+    The cost is one pass over the block regardless of how many radii there are.
+
+    Args:
+        distances (ndarray): (m, n) distances in miles (NaN never counts)
+        radii (list): Radii in miles, any order
+        weights (ndarray, optional): (n,) or (m, n) weights (NaN treated as 0).
+            Default: count points.
+        inclusive (bool): Count distance <= radius if True, < radius if False
+
+    Returns:
+        ndarray: (m, len(radii)) int64 counts or float64 weighted sums
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    radii = np.asarray(radii, dtype=np.float64)
+    m, n_radii = distances.shape[0], len(radii)
+
+    order = np.argsort(radii, kind='stable')
+    buckets = np.searchsorted(radii[order], distances, side='left' if inclusive else 'right')
+    buckets += (np.arange(m) * (n_radii + 1))[:, None]
+
+    if weights is not None:
+        weights = np.broadcast_to(
+            np.nan_to_num(np.asarray(weights, dtype=np.float64)), distances.shape
+        ).ravel()
+
+    per_bucket = np.bincount(buckets.ravel(), weights=weights, minlength=m * (n_radii + 1))
+    cumulative = np.cumsum(per_bucket.reshape(m, n_radii + 1)[:, :n_radii], axis=1)
+
+    result = np.empty_like(cumulative)
+    result[:, order] = cumulative
+    return result.astype(np.int64) if weights is None else result
+
+
+class SiteDistanceContext:
+    """
+    Distances from one site to all tracts and dispensaries in its state.
+
+    Attributes:
+        state (str): State code ('FL' or 'PA')
+        latitude (float): Site latitude in decimal degrees
+        longitude (float): Site longitude in decimal degrees
+        radii (list): Analysis radii in miles
+        tract_positions (ndarray): Row positions of candidate tracts in the census data
+        tract_distances (ndarray): Miles from site to each candidate tract centroid
+        tract_populations (ndarray): Population of each candidate tract
+        dispensary_positions (ndarray): Row positions of candidate dispensaries
+        dispensary_distances (ndarray): Miles from site to each candidate dispensary
+        self_exclusion_miles (float): Dispensaries closer than this are the site itself
+        weighted_radius (float): Radius within which dispensary distances are exact
+        search_padding (float): Extra miles beyond the largest radius included in the
+            candidate rows, so the site can be moved that far without a new index query
+        drift_miles (float): Upper bound on how far the site has moved since the
+            tract distances were last computed exactly (see moved())
+    """
+
+    def __init__(
+        self,
+        state: str,
+        latitude: float,
+        longitude: float,
+        radii: List[float],
+        tract_positions: np.ndarray,
+        tract_distances: np.ndarray,
+        tract_populations: np.ndarray,
+        dispensary_positions: np.ndarray,
+        dispensary_distances: np.ndarray,
+        self_exclusion_miles: float = 0.1,
+        weighted_radius: float = 20,
+        search_padding: float = 0.0,
+        drift_miles: float = 0.0
+    ):
+        self.state = state
+        self.latitude = latitude
+        self.longitude = longitude
+        self.radii = list(radii)
+        self.tract_positions = tract_positions
+        self.tract_distances = tract_distances
+        self.tract_populations = tract_populations
+        self.dispensary_positions = dispensary_positions
+        self.dispensary_distances = dispensary_distances
+        self.self_exclusion_miles = self_exclusion_miles
+        self.weighted_radius = weighted_radius
+        self.search_padding = search_padding
+        self.drift_miles = drift_miles
+
+    @classmethod
+    def build(
+        cls,
+        state: str,
+        latitude: float,
+        longitude: float,
+        dispensaries_df: pd.DataFrame,
+        census_df: pd.DataFrame,
+        radii: List[float],
+        self_exclusion_miles: float = 0.1,
+        weighted_radius: float = 20,
+        tract_index: Optional[SphericalIndex] = None,
+        dispensary_index: Optional[SphericalIndex] = None,
+        search_padding: float = 0.0
+    ) -> 'SiteDistanceContext':
+        """
+        Compute the distance context for a site in one pass per dataset.
+
+        Tract distances are exact near each radius boundary. Dispensary
+        distances are exact near each boundary and for every dispensary inside
+        the weighted-competition radius, because those feed the weighted score.
+
+        When spatial indexes are supplied, only rows that can fall inside the
+        largest radius are touched; all other rows can never contribute.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            latitude (float): Site latitude in decimal degrees
+            longitude (float): Site longitude in decimal degrees
+            dispensaries_df (DataFrame): State dispensaries with latitude/longitude
+            census_df (DataFrame): State census tracts with latitude/longitude/total_population
+            radii (list): Analysis radii in miles
+            self_exclusion_miles (float): Self-match distance threshold
+            weighted_radius (float): Radius for the weighted competition score
+            tract_index (SphericalIndex, optional): Positional index over census_df
+            dispensary_index (SphericalIndex, optional): Positional index over dispensaries_df
+            search_padding (float): Also keep rows up to this many miles beyond the
+                largest radius (for contexts that will be moved())
+
+        Returns:
+            SiteDistanceContext: Context shared by all distance-based features
+        """
+        max_radius = max(radii) + search_padding
+
+        tract_positions = _candidate_positions(
+            tract_index, len(census_df), latitude, longitude, max_radius
+        )
+        tract_distances = site_distances_miles(
+            latitude, longitude,
+            column_rows(census_df, 'latitude', tract_positions),
+            column_rows(census_df, 'longitude', tract_positions),
+            radii=radii
+        )
+        tract_populations = column_rows(census_df, 'total_population', tract_positions)
+
+        dispensary_positions = _candidate_positions(
+            dispensary_index, len(dispensaries_df), latitude, longitude,
+            max(max_radius, weighted_radius + search_padding)
+        )
+        dispensary_distances = site_distances_miles(
+            latitude, longitude,
+            column_rows(dispensaries_df, 'latitude', dispensary_positions),
+            column_rows(dispensaries_df, 'longitude', dispensary_positions),
+            radii=list(radii) + [self_exclusion_miles],
+            refine_within=weighted_radius
+        )
+
+        return cls(
+            state, latitude, longitude, radii,
+            tract_positions, tract_distances, tract_populations,
+            dispensary_positions, dispensary_distances,
+            self_exclusion_miles=self_exclusion_miles,
+            weighted_radius=weighted_radius,
+            search_padding=search_padding
+        )
+
+    def moved(
+        self,
+        latitude: float,
+        longitude: float,
+        dispensaries_df: pd.DataFrame,
+        census_df: pd.DataFrame
+    ) -> Optional['SiteDistanceContext']:
+        """
+        Context for the same site moved to a nearby position, updated incrementally.
+
+        Moving the site by d miles changes every distance by at most d, so a
+        tract can only change radius membership if its current distance lies
+        in an annulus of that width (plus the spherical error band) around a
+        radius boundary. Only those tracts are recomputed; all others keep
+        their stale distance, which still places them on the correct side of
+        every boundary. Dispensary distances feed the weighted score, so they
+        are all recomputed (there are few of them).
+
+        Args:
+            latitude (float): New site latitude in decimal degrees
+            longitude (float): New site longitude in decimal degrees
+            dispensaries_df (DataFrame): The state dispensaries this context was built from
+            census_df (DataFrame): The state census tracts this context was built from
+
+        Returns:
+            SiteDistanceContext: Updated context, or None if the accumulated
+                movement exceeds search_padding (build a fresh context instead)
+        """
+        step = haversine_miles(self.latitude, self.longitude, [latitude], [longitude])[0]
+        drift = self.drift_miles + float(step) * (1 + HAVERSINE_MAX_RELATIVE_ERROR)
+        if drift > self.search_padding:
+            return None
+
+        tract_distances = self.tract_distances.copy()
+        annulus = np.zeros(len(tract_distances), dtype=bool)
+        band = drift + tract_distances * HAVERSINE_MAX_RELATIVE_ERROR + BOUNDARY_ABSOLUTE_SLACK
+        for radius in self.radii:
+            annulus |= np.abs(tract_distances - radius) <= band
+
+        if annulus.any():
+            rows = self.tract_positions[annulus]
+            tract_distances[annulus] = site_distances_miles(
+                latitude, longitude,
+                column_rows(census_df, 'latitude', rows),
+                column_rows(census_df, 'longitude', rows),
+                radii=self.radii
+            )
+
+        dispensary_distances = site_distances_miles(
+            latitude, longitude,
+            column_rows(dispensaries_df, 'latitude', self.dispensary_positions),
+            column_rows(dispensaries_df, 'longitude', self.dispensary_positions),
+            radii=list(self.radii) + [self.self_exclusion_miles],
+            refine_within=self.weighted_radius
+        )
+
+        return SiteDistanceContext(
+            self.state, latitude, longitude, self.radii,
+            self.tract_positions, tract_distances, self.tract_populations,
+            self.dispensary_positions, dispensary_distances,
+            self_exclusion_miles=self.self_exclusion_miles,
+            weighted_radius=self.weighted_radius,
+            search_padding=self.search_padding,
+            drift_miles=drift
+        )
+
+    def populations(self) -> Dict[str, int]:
+        """
+        Total population of tracts whose centroids fall within each radius.
+
+        Returns:
+            dict: {'pop_{radius}mi': int} for each radius
+        """
+        sums = cumulative_within(self.tract_distances, self.radii, weights=self.tract_populations)
+        return {f'pop_{radius}mi': int(total) for radius, total in zip(self.radii, sums)}
+
+    def competitors(self) -> Dict[str, float]:
+        """
+        Competitor counts and competitors per 100k population at each radius.
+
+        Excludes the site itself (any dispensary within self_exclusion_miles).
+
+        Returns:
+            dict: {'competitors_{radius}mi': int,
+                   'competitors_per_100k_{radius}mi': float} for each radius
+        """
+        populations = self.populations()
+        competitor_distances = self.dispensary_distances[
+            self.dispensary_distances > self.self_exclusion_miles
+        ]
+        counts = cumulative_within(competitor_distances, self.radii)
+
+        competitors = {}
+        for radius, count in zip(self.radii, counts):
+            count = int(count)
+            competitors[f'competitors_{radius}mi'] = count
+
+            population = populations[f'pop_{radius}mi']
+            if population > 0:
+                per_100k = (count / population) * 100000
+            else:
+                per_100k = 0.0
+
+            competitors[f'competitors_per_100k_{radius}mi'] = per_100k
+
+        return competitors
+
+    def competition_weighted(self, radius: float = 20) -> float:
+        """
+        Distance-weighted competition score: sum(1 / (distance + 0.01)).
+
+        Args:
+            radius (float): Analysis radius in miles (at most weighted_radius
+                for exact geodesic weights)
+
+        Returns:
+            float: Distance-weighted competition score
+        """
+        distances = self.dispensary_distances
+        within = (distances > self.self_exclusion_miles) & (distances <= radius)
+
+        if not within.any():
+            return 0.0
+
+        return float(np.sum(1.0 / (distances[within] + 0.01)))
+
+
+def aggregate_distance_blocks(
+    tract_distances: np.ndarray,
+    tract_populations: np.ndarray,
+    dispensary_distances: np.ndarray,
+    radii: List[float],
+    self_exclusion_miles: float = 0.1,
+    weighted_radius: float = 20
+) -> Dict[str, np.ndarray]:
+    """
+    Distance-based features for many sites at once.
+
+    Block equivalent of SiteDistanceContext's populations(), competitors() and
+    competition_weighted(): each row of the distance blocks is one site.
+
+    Args:
+        tract_distances (ndarray): (m, n) miles from each site to each tract centroid
+        tract_populations (ndarray): (n,) population of each tract
+        dispensary_distances (ndarray): (m, k) miles from each site to each dispensary
+        radii (list): Analysis radii in miles
+        self_exclusion_miles (float): Self-match distance threshold
+        weighted_radius (float): Radius for the weighted competition score
+
+    Returns:
+        dict: Feature name -> (m,) array for every pop_*, competitors_*,
+            competitors_per_100k_* feature and competition_weighted_{radius}mi
+    """
+    competitor = dispensary_distances > self_exclusion_miles
+
+    pops = cumulative_within_blocks(tract_distances, radii, weights=tract_populations)
+    counts = cumulative_within_blocks(
+        dispensary_distances, radii, weights=competitor
+    ).astype(np.int64)
+
+    features = {}
+    for i, radius in enumerate(radii):
+        pop = pops[:, i]
+        count = counts[:, i]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            per_100k = np.where(pop > 0, (count / pop) * 100000, 0.0)
+
+        features[f'pop_{radius}mi'] = pop.astype(np.int64)
+        features[f'competitors_{radius}mi'] = count
+        features[f'competitors_per_100k_{radius}mi'] = per_100k
+
+    within = competitor & (dispensary_distances <= weighted_radius)
+    weights = np.where(within, 1.0 / (dispensary_distances + 0.01), 0.0)
+    features[f'competition_weighted_{weighted_radius}mi'] = weights.sum(axis=1)
+
+    return features
@@ -0,0 +1,161 @@
+"""
+Spatial Geocoding Cache
+
+Answers geocoding queries from the polygons of tracts that have already
+been resolved, so a point 20 feet from a cached one (or the next cell of a
+grid scan) costs no network round trip.
+
+Whenever the Census Geocoding API resolves a point to a tract, that tract's
+TIGER polygon (from OfflineTractResolver's locally persisted polygons) is
+added to a shapely STRtree. A later point strictly inside one of those
+polygons gets the cached tract result directly. Points on or outside every
+cached boundary still go to the geocoder, and a polygon is only cached if it
+contains the point the geocoder placed in it, so a TIGER/geocoder vintage
+mismatch can not return a different answer than the API would.
+
+shapely is optional: without it (or without local polygons for a state)
+the layer stays empty and every coordinate-cache miss reaches the API.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import threading
+import logging
+import numpy as np
+from typing import Callable, Dict, Iterable, Optional
+
+try:
+    import shapely
+    from shapely import STRtree
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class SpatialGeocodeCache:
+    """
+    R-tree of resolved tract polygons answering point-in-tract lookups.
+
+    Attributes:
+        polygon_for (callable): GEOID -> WGS84 polygon, or None if unavailable
+    """
+
+    def __init__(self, polygon_for: Callable[[str], Optional[object]]):
+        """
+        Args:
+            polygon_for: Polygon source, e.g. OfflineTractResolver.polygon
+        """
+        self.polygon_for = polygon_for
+        self._results: Dict[str, Dict] = {}
+        self._geometries: Dict[str, object] = {}
+        self._tree = None
+        self._tree_geoids = np.empty(0, dtype=object)
+        self._last_geoid: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """Whether the geometry engine (shapely) is installed."""
+        return SHAPELY_AVAILABLE
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def add(self, result: Dict, latitude: float, longitude: float) -> bool:
+        """
+        Cache the tract of a successful geocoding result.
+
+        Args:
+            result: get_tract_from_coordinates() result
+            latitude: Latitude the geocoder resolved
+            longitude: Longitude the geocoder resolved
+
+        Returns:
+            bool: True if the tract's polygon is now cached
+        """
+        geoid = result.get('geoid') if result.get('success') else None
+        if not SHAPELY_AVAILABLE or geoid is None:
+            return False
+        if geoid in self._results:
+            return True
+
+        geometry = self.polygon_for(geoid)
+        if geometry is None or not shapely.contains_xy(geometry, longitude, latitude):
+            return False
+
+        shapely.prepare(geometry)
+        with self._lock:
+            self._results[geoid] = result
+            self._geometries[geoid] = geometry
+            self._tree = None  # rebuilt on the next lookup
+        return True
+
+    def add_many(self, results: Iterable[Dict]) -> int:
+        """
+        Seed from previously cached results (e.g. the persistent coordinate cache).
+
+        The geocoded point is not known here, so the check that the polygon
+        contains it is replaced by a check that the polygon exists.
+
+        Returns:
+            int: Tracts added
+        """
+        added = 0
+        if not SHAPELY_AVAILABLE:
+            return added
+
+        for result in results:
+            geoid = result.get('geoid') if isinstance(result, dict) and result.get('success') else None
+            if geoid is None or geoid in self._results:
+                continue
+            geometry = self.polygon_for(geoid)
+            if geometry is None:
+                continue
+            shapely.prepare(geometry)
+            with self._lock:
+                self._results[geoid] = result
+                self._geometries[geoid] = geometry
+                self._tree = None
+            added += 1
+        return added
+
+    def _index(self):
+        """(tree, geoids) for the current polygon set."""
+        with self._lock:
+            if self._tree is None and self._geometries:
+                self._tree_geoids = np.array(list(self._geometries), dtype=object)
+                self._tree = STRtree([self._geometries[g] for g in self._tree_geoids])
+            return self._tree, self._tree_geoids
+
+    def lookup(self, latitude: float, longitude: float) -> Optional[Dict]:
+        """
+        Cached tract result for a point strictly inside a cached polygon.
+
+        Args:
+            latitude: Latitude in decimal degrees (WGS84)
+            longitude: Longitude in decimal degrees (WGS84)
+
+        Returns:
+            dict: The tract's cached result, or None
+        """
+        if not SHAPELY_AVAILABLE or not self._results:
+            return None
+
+        # Consecutive queries (grid scans, nudged pins) usually stay in one tract
+        last = self._last_geoid
+        if last is not None and shapely.contains_xy(self._geometries[last], longitude, latitude):
+            return self._results[last]
+
+        tree, geoids = self._index()
+        hits = tree.query(shapely.Point(longitude, latitude), predicate='within')
+        if len(hits) == 0:
+            return None
+        if len(hits) > 1:
+            return None  # overlapping cached polygons: let the geocoder decide
+
+        geoid = geoids[hits[0]]
+        self._last_geoid = geoid
+        return self._results[geoid]
@@ -0,0 +1,154 @@
+"""
+Spherical Spatial Index
+
+KD-tree over unit-sphere (x, y, z) coordinates for fast radius and
+k-nearest-neighbor queries on latitude/longitude points.
+
+Chord length on the unit sphere is a monotonic function of great-circle
+distance, so a Euclidean KD-tree on 3-D unit vectors answers great-circle
+radius queries exactly (under the spherical Earth model) without the
+distortion of a lat/lon grid.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import numpy as np
+from typing import Tuple
+from scipy.spatial import cKDTree
+
+try:
+    from .distance_kernel import EARTH_RADIUS_MILES
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent))
+    from distance_kernel import EARTH_RADIUS_MILES
+
+
+def to_unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Convert latitude/longitude (degrees) to unit-sphere Cartesian coordinates.
+
+    Args:
+        latitudes (ndarray): Latitudes in decimal degrees
+        longitudes (ndarray): Longitudes in decimal degrees
+
+    Returns:
+        ndarray: (n, 3) array of unit vectors
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def miles_to_chord(miles: np.ndarray) -> np.ndarray:
+    """Convert great-circle distance in miles to unit-sphere chord length."""
+    angle = np.minimum(np.asarray(miles, dtype=np.float64) / EARTH_RADIUS_MILES, np.pi)
+    return 2.0 * np.sin(angle / 2.0)
+
+
+def chord_to_miles(chord: np.ndarray) -> np.ndarray:
+    """Convert unit-sphere chord length to great-circle distance in miles."""
+    half = np.clip(np.asarray(chord, dtype=np.float64) / 2.0, 0.0, 1.0)
+    return 2.0 * EARTH_RADIUS_MILES * np.arcsin(half)
+
+
+class SphericalIndex:
+    """
+    Spatial index over a fixed set of latitude/longitude points.
+
+    Points with missing coordinates are excluded from the tree but keep their
+    original positions, so returned indices always refer to rows of the
+    source arrays (e.g. positional rows of a census or dispensary DataFrame).
+
+    Attributes:
+        size (int): Number of source points (including excluded ones)
+        indexed_count (int): Number of points with valid coordinates
+    """
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray):
+        """
+        Build the index.
+
+        Args:
+            latitudes (ndarray): Latitudes in decimal degrees
+            longitudes (ndarray): Longitudes in decimal degrees
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        valid = np.isfinite(latitudes) & np.isfinite(longitudes)
+        self.size = len(latitudes)
+        self.indexed_count = int(valid.sum())
+
+        # Map tree positions back to source positions
+        self._positions = np.flatnonzero(valid)
+        self._tree = cKDTree(to_unit_vectors(latitudes[valid], longitudes[valid]))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def query_radius(self, latitude: float, longitude: float, radius_miles: float) -> np.ndarray:
+        """
+        Find all points within a great-circle radius of a location.
+
+        Args:
+            latitude (float): Query latitude in decimal degrees
+            longitude (float): Query longitude in decimal degrees
+            radius_miles (float): Search radius in miles
+
+        Returns:
+            ndarray: Sorted source positions of points within the radius
+        """
+        if self.indexed_count == 0:
+            return np.empty(0, dtype=np.intp)
+
+        center = to_unit_vectors([latitude], [longitude])[0]
+        hits = self._tree.query_ball_point(center, float(miles_to_chord(radius_miles)))
+        return np.sort(self._positions[np.asarray(hits, dtype=np.intp)])
+
+    def query_nearest(self, latitude: float, longitude: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest points to a location.
+
+        Args:
+            latitude (float): Query latitude in decimal degrees
+            longitude (float): Query longitude in decimal degrees
+            k (int): Number of neighbors to return
+
+        Returns:
+            Tuple[ndarray, ndarray]: (great-circle distances in miles, source positions),
+                ordered nearest first. Fewer than k entries if the index is smaller.
+        """
+        k = min(k, self.indexed_count)
+        if k == 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+
+        center = to_unit_vectors([latitude], [longitude])[0]
+        chords, hits = self._tree.query(center, k=k)
+        chords = np.atleast_1d(chords)
+        hits = np.atleast_1d(hits)
+        return chord_to_miles(chords), self._positions[hits]
+
+    def query_nearest_many(self, latitudes: np.ndarray, longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest point to each of many locations.
+
+        Args:
+            latitudes (ndarray): Query latitudes in decimal degrees
+            longitudes (ndarray): Query longitudes in decimal degrees
+
+        Returns:
+            Tuple[ndarray, ndarray]: (great-circle distances in miles, source positions),
+                one entry per query location. Distances are inf and positions -1
+                when the index is empty.
+        """
+        n = len(latitudes)
+        if self.indexed_count == 0:
+            return np.full(n, np.inf), np.full(n, -1, dtype=np.intp)
+
+        chords, hits = self._tree.query(to_unit_vectors(latitudes, longitudes), k=1)
+        return chord_to_miles(chords), self._positions[hits]
@@ -0,0 +1,173 @@
+"""
+Indexed Census Tract Table
+
+Per-state census tract store with:
+- A hash index on census_geoid, so tract lookups are O(1) instead of a
+  boolean scan over the whole state frame
+- A small delta buffer for tracts fetched on the fly from the Census API,
+  merged into the main frame in one concat (on the next full-table read,
+  or once the buffer reaches merge_threshold) rather than once per tract
+- Stable column dtypes: appended tracts are coerced to the main frame's
+  schema instead of turning numeric columns into object dtype
+- GEOIDs may be stored as strings or as int64 keys (see compact_dtypes);
+  lookups accept either form
+
+Every merge gets a new, process-unique version number so dependants (e.g.
+the loader's spatial indexes) can tell when the table has changed.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import itertools
+import threading
+import pandas as pd
+from typing import Any, Dict, List, Mapping, Optional
+
+# Process-wide version counter shared by every table
+_VERSIONS = itertools.count(1)
+
+
+class TractTable:
+    """
+    Census tracts for one state, indexed by GEOID.
+
+    Attributes:
+        merge_threshold (int): Buffered tracts that trigger an eager merge
+        version (int): Changes whenever the merged frame changes
+        uid (int): Process-unique id of this table (unlike id(), never reused)
+    """
+
+    DEFAULT_MERGE_THRESHOLD = 64
+
+    def __init__(self, frame: pd.DataFrame, merge_threshold: int = DEFAULT_MERGE_THRESHOLD):
+        """
+        Wrap a census frame.
+
+        Args:
+            frame (DataFrame): State census tracts with a census_geoid column
+            merge_threshold (int): Buffered tracts that trigger an eager merge
+        """
+        self.merge_threshold = merge_threshold
+        # Frames that are already positional are kept as-is (no copy), e.g.
+        # memory-mapped frames attached from a shared data plane
+        if not frame.index.equals(pd.RangeIndex(len(frame))):
+            frame = frame.reset_index(drop=True)
+        self._frame = frame
+        self._positions = {self.key(geoid): i for i, geoid in enumerate(self._frame['census_geoid'])}
+        self._delta: List[Dict[str, Any]] = []
+        self._delta_positions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.version = next(_VERSIONS)
+        self.uid = self.version
+
+    @staticmethod
+    def key(geoid: Any) -> Any:
+        """Hash key of a GEOID: the same int for '12095000100' and 12095000100."""
+        try:
+            return int(geoid)
+        except (TypeError, ValueError):
+            return geoid
+
+    def __len__(self) -> int:
+        return len(self._frame) + len(self._delta)
+
+    def __contains__(self, geoid: Any) -> bool:
+        key = self.key(geoid)
+        return key in self._positions or key in self._delta_positions
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Every tract, including buffered ones, as one DataFrame (positional index)."""
+        if self._delta:
+            self.merge()
+        return self._frame
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered tracts not yet merged into the frame."""
+        return len(self._delta)
+
+    def get(self, geoid: Any) -> Optional[pd.Series]:
+        """
+        Look up one tract by GEOID.
+
+        Args:
+            geoid (str or int): 11-digit census tract GEOID or its int64 key
+
+        Returns:
+            Series: Tract row (with the frame's columns), or None if absent
+        """
+        key = self.key(geoid)
+        with self._lock:
+            position = self._positions.get(key)
+            if position is not None:
+                return self._frame.iloc[position]
+
+            position = self._delta_positions.get(key)
+            if position is not None:
+                return pd.Series(self._delta[position])
+
+        return None
+
+    def append(self, record: Mapping[str, Any]) -> bool:
+        """
+        Buffer a new tract.
+
+        Args:
+            record (mapping): Tract values keyed by column name (must include census_geoid)
+
+        Returns:
+            bool: True if added, False if the GEOID is already present
+        """
+        record = dict(record)
+        geoid = record['census_geoid']
+
+        with self._lock:
+            if geoid in self:
+                return False
+
+            self._delta_positions[self.key(geoid)] = len(self._delta)
+            self._delta.append(record)
+
+            if len(self._delta) >= self.merge_threshold:
+                self.merge()
+
+        return True
+
+    def merge(self) -> None:
+        """Merge buffered tracts into the main frame with the frame's dtypes."""
+        with self._lock:
+            if not self._delta:
+                return
+
+            delta = pd.DataFrame(self._delta)
+            columns = list(self._frame.columns) + [c for c in delta.columns if c not in self._frame.columns]
+            delta = delta.reindex(columns=columns)
+
+            frame = self._frame
+            for column, dtype in frame.dtypes.items():
+                if isinstance(dtype, pd.CategoricalDtype):
+                    new = delta[column].dropna().unique()
+                    new = [value for value in new if value not in dtype.categories]
+                    if new:
+                        frame = frame.assign(**{column: frame[column].cat.add_categories(new)})
+                        dtype = frame[column].dtype
+                elif delta[column].isna().any() and (
+                        pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype)):
+                    continue  # Would turn missing values into True/garbage; let concat pick
+
+                try:
+                    delta[column] = delta[column].astype(dtype)
+                except (TypeError, ValueError):
+                    # e.g. non-numeric strings in a numeric column; let concat pick a common dtype
+                    pass
+
+            start = len(frame)
+            self._frame = pd.concat([frame, delta], ignore_index=True)
+            for offset, record in enumerate(self._delta):
+                self._positions[self.key(record['census_geoid'])] = start + offset
+
+            self._delta = []
+            self._delta_positions = {}
+            self.version = next(_VERSIONS)
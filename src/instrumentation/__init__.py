@@ -0,0 +1,9 @@
+"""
+Lightweight timing and counter instrumentation for the prediction path.
+
+Disabled by default; every timer and counter is a no-op until enabled.
+"""
+
+from .profiler import Profiler, profiler, capture_cprofile
+
+__all__ = ['Profiler', 'profiler', 'capture_cprofile']
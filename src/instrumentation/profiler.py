@@ -0,0 +1,222 @@
+"""
+Stage Profiler
+
+Named wall-clock timers and counters for the stages of a site analysis
+(tract lookup, cache hits/misses, distance computation, radius aggregation,
+feature validation, model inference, confidence intervals, report rendering).
+
+A single process-wide `profiler` is shared by every module. While disabled
+(the default), timer() returns a shared no-op context manager and count()
+returns immediately, so instrumented code pays one attribute check per call.
+
+Usage:
+    from src.instrumentation import profiler
+
+    profiler.enable()
+    with profiler.timer('model_inference'):
+        ...
+    profiler.count('geocode_cache.hit')
+    profiler.export_json('run_profile.json')
+
+Timers may nest (e.g. confidence_interval includes the model_inference it
+triggers), so totals of different timers are not additive.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import cProfile
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Shared no-op returned by timer() while disabled
+_NULL_TIMER = nullcontext()
+
+
+class _Timer:
+    """Context manager recording one timed section into a Profiler."""
+
+    __slots__ = ('_profiler', '_name', '_start')
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.record(self._name, time.perf_counter() - self._start)
+
+
+class Profiler:
+    """
+    Thread-safe registry of named timers and counters.
+
+    Attributes:
+        enabled (bool): Whether timers and counters record anything
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._timers: Dict[str, list] = {}
+        self._counters: Dict[str, int] = {}
+        self._started = time.perf_counter()
+        self._started_at = datetime.now()
+
+    def enable(self) -> None:
+        """Start recording (existing measurements are kept)."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording (existing measurements are kept)."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discard all measurements and restart the run clock."""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self._started = time.perf_counter()
+            self._started_at = datetime.now()
+
+    def timer(self, name: str):
+        """
+        Time a block of code.
+
+        Args:
+            name: Stage name (e.g. 'distance_computation')
+
+        Returns:
+            Context manager; a shared no-op while disabled
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name: str) -> Callable:
+        """
+        Decorator timing every call of a function (checked per call, so the
+        profiler can be enabled after the function is defined).
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Decorator
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Timer(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one measured duration to a timer."""
+        with self._lock:
+            stats = self._timers.get(name)
+            if stats is None:
+                # [calls, total seconds, max seconds]
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+                stats[2] = max(stats[2], seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name (e.g. 'geocode_cache.hit')
+            n: Increment
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current measurements as a JSON-serializable dict.
+
+        Returns:
+            dict: {'started_at', 'wall_time_ms',
+                   'timers': {name: {'calls', 'total_ms', 'mean_ms', 'max_ms'}},
+                   'counters': {name: int}}
+        """
+        with self._lock:
+            timers = {
+                name: {
+                    'calls': calls,
+                    'total_ms': round(total * 1000, 3),
+                    'mean_ms': round(total * 1000 / calls, 3),
+                    'max_ms': round(longest * 1000, 3)
+                }
+                for name, (calls, total, longest) in sorted(self._timers.items())
+            }
+            counters = dict(sorted(self._counters.items()))
+
+        return {
+            'started_at': self._started_at.isoformat(),
+            'wall_time_ms': round((time.perf_counter() - self._started) * 1000, 3),
+            'timers': timers,
+            'counters': counters
+        }
+
+    def export_json(self, path: str) -> Path:
+        """
+        Write snapshot() to a JSON file.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path: Written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return path
+
+
+# Process-wide profiler used by all instrumented modules
+profiler = Profiler()
+
+
+@contextmanager
+def capture_cprofile(path: Optional[str]) -> Iterator[Optional[cProfile.Profile]]:
+    """
+    Run a block under cProfile and dump the stats (pstats format) to path.
+
+    Args:
+        path: Output .prof path; if None, the block runs unprofiled
+
+    Yields:
+        cProfile.Profile or None
+    """
+    if path is None:
+        yield None
+        return
+
+    capture = cProfile.Profile()
+    capture.enable()
+    try:
+        yield capture
+    finally:
+        capture.disable()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        capture.dump_stats(str(path))
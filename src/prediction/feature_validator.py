@@ -32,8 +32,22 @@ Usage:
 
 import json
 import os
+import re
+import numpy as np
+import pandas as pd
+from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 
+try:
+    from ..instrumentation import profiler
+    from ..feature_engineering.site_context import validate_radii
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from instrumentation import profiler
+    from feature_engineering.site_context import validate_radii
+
 
 class FeatureValidator:
     """
@@ -104,14 +118,66 @@ class FeatureValidator:
         'median_household_income_PA'
     ]
 
-    def __init__(self, ranges_path: str = 'data/models/feature_ranges.json'):
+    # Radius ladder the feature lists above are written for
+    DEFAULT_RADII = [1, 3, 5, 10, 20]
+
+    # Radii referenced by the fixed interaction features (pop_3mi, pop_5mi, pop_20mi, ...)
+    ANCHOR_RADII = [3, 5, 20]
+
+    def __init__(
+        self,
+        ranges_path: str = 'data/models/feature_ranges.json',
+        radii: Optional[List[float]] = None
+    ):
         """
         Initialize validator with training data ranges.
 
         Args:
             ranges_path: Path to JSON file with feature min/max/mean/median values
+            radii: Radius ladder of the target model (e.g. MultiStatePredictor.radii).
+                Default: DEFAULT_RADII. Must include ANCHOR_RADII.
         """
         self.feature_ranges = self._load_feature_ranges(ranges_path)
+        self.radii = list(self.DEFAULT_RADII)
+
+        if radii is not None:
+            self._configure_radii(radii)
+
+    def _configure_radii(self, radii: List[float]) -> None:
+        """Rebuild the radius-dependent feature lists for a custom radius ladder."""
+        radii = validate_radii(radii)
+
+        missing = [r for r in self.ANCHOR_RADII if r not in radii]
+        if missing:
+            raise ValueError(
+                f"Radius ladder must include {self.ANCHOR_RADII} "
+                f"(used by interaction features), missing {missing}"
+            )
+
+        if radii == self.DEFAULT_RADII:
+            return
+
+        self.radii = radii
+        self.REQUIRED_BASE_FEATURES = self._expand_radius_features(self.REQUIRED_BASE_FEATURES, radii)
+        self.AUTO_GENERATED_FEATURES = self._expand_radius_features(self.AUTO_GENERATED_FEATURES, radii)
+        self.ALL_FEATURES = self._expand_radius_features(self.ALL_FEATURES, radii)
+
+    @staticmethod
+    def _expand_radius_features(features: List[str], radii: List[float]) -> List[str]:
+        """Replace each pop_/competitors_/saturation_ radius group with the given ladder."""
+        pattern = re.compile(r'^(pop|competitors|saturation)_[\d.]+mi$')
+        expanded = []
+        seen = set()
+
+        for feature in features:
+            match = pattern.match(feature)
+            if not match:
+                expanded.append(feature)
+            elif match.group(1) not in seen:
+                seen.add(match.group(1))
+                expanded.extend(f'{match.group(1)}_{r}mi' for r in radii)
+
+        return expanded
 
     def _load_feature_ranges(self, path: str) -> Dict[str, Dict[str, float]]:
         """Load feature ranges from JSON file."""
@@ -144,6 +210,7 @@ class FeatureValidator:
         features, _ = self.prepare_features_with_warnings(base_features, state)
         return features
 
+    @profiler.timed('feature_validation')
     def prepare_features_with_warnings(
         self, base_features: Dict[str, Any], state: str
     ) -> Tuple[Dict[str, float], List[Dict[str, str]]]:
@@ -296,10 +363,10 @@ class FeatureValidator:
         complete['is_PA'] = 1.0 if state == 'PA' else 0.0
 
         # 2. Market saturation (dispensaries per capita)
-        for radius in ['1mi', '3mi', '5mi', '10mi', '20mi']:
-            pop_key = f'pop_{radius}'
-            comp_key = f'competitors_{radius}'
-            sat_key = f'saturation_{radius}'
+        for radius in self.radii:
+            pop_key = f'pop_{radius}mi'
+            comp_key = f'competitors_{radius}mi'
+            sat_key = f'saturation_{radius}mi'
 
             if base_features[pop_key] > 0:
                 complete[sat_key] = base_features[comp_key] / base_features[pop_key] * 100000
@@ -365,6 +432,81 @@ class FeatureValidator:
 
         return complete
 
+    @profiler.timed('feature_validation.frame')
+    def prepare_features_frame(self, base_df: pd.DataFrame, state: str) -> pd.DataFrame:
+        """
+        Generate all 44 features for many sites in one state at once.
+
+        Column-wise equivalent of _generate_all_derived_features() for large
+        batches (e.g. raster cells). Range warnings are not produced; callers
+        are expected to mask out rows with missing base features themselves.
+
+        Args:
+            base_df: DataFrame with one row per site and all required base features
+            state: State code ('FL' or 'PA') shared by every row
+
+        Returns:
+            DataFrame with all 44 features in model order (float64)
+
+        Raises:
+            ValueError: If state is invalid or base features are missing
+        """
+        state = self._validate_state(state)
+
+        missing = [f for f in self.REQUIRED_BASE_FEATURES if f not in base_df.columns]
+        if missing:
+            raise ValueError(
+                f"Missing required base features: {missing}\n"
+                f"Required features: {self.REQUIRED_BASE_FEATURES}"
+            )
+
+        base = {f: base_df[f].to_numpy(dtype=np.float64) for f in self.REQUIRED_BASE_FEATURES}
+        complete = dict(base)
+
+        # 1. State indicators
+        is_fl = 1.0 if state == 'FL' else 0.0
+        is_pa = 1.0 if state == 'PA' else 0.0
+        complete['is_FL'] = np.full(len(base_df), is_fl)
+        complete['is_PA'] = np.full(len(base_df), is_pa)
+
+        # 2. Market saturation (dispensaries per capita)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for radius in self.radii:
+                pop = base[f'pop_{radius}mi']
+                complete[f'saturation_{radius}mi'] = np.where(
+                    pop > 0, base[f'competitors_{radius}mi'] / pop * 100000, 0.0
+                )
+
+            # 3. Demographic interactions
+            bachelor_plus = (
+                base['bachelors_degree'] + base['masters_degree'] +
+                base['professional_degree'] + base['doctorate_degree']
+            )
+            pop_25_plus = base['total_pop_25_plus']
+            complete['pct_bachelor_plus'] = np.where(
+                pop_25_plus > 0, bachelor_plus / pop_25_plus * 100, 0.0
+            )
+
+        complete['affluent_market_5mi'] = base['pop_5mi'] * base['median_household_income'] / 1e6
+        complete['educated_urban_score'] = complete['pct_bachelor_plus'] * base['population_density']
+        complete['age_adjusted_catchment_3mi'] = base['median_age'] * base['pop_3mi'] / 1000
+
+        # 4. State interaction features
+        complete['pop_5mi_FL'] = base['pop_5mi'] * is_fl
+        complete['pop_5mi_PA'] = base['pop_5mi'] * is_pa
+        complete['pop_20mi_FL'] = base['pop_20mi'] * is_fl
+        complete['pop_20mi_PA'] = base['pop_20mi'] * is_pa
+        complete['competitors_5mi_FL'] = base['competitors_5mi'] * is_fl
+        complete['competitors_5mi_PA'] = base['competitors_5mi'] * is_pa
+        complete['saturation_5mi_FL'] = complete['saturation_5mi'] * is_fl
+        complete['saturation_5mi_PA'] = complete['saturation_5mi'] * is_pa
+        complete['median_household_income_FL'] = base['median_household_income'] * is_fl
+        complete['median_household_income_PA'] = base['median_household_income'] * is_pa
+
+        return pd.DataFrame(
+            {f: complete[f] for f in self.ALL_FEATURES}, index=base_df.index
+        )
+
     def _validate_complete_features(self, features: Dict[str, float]) -> None:
         """Final check that all 44 required features are present."""
         missing = []
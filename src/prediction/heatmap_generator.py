@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Statewide Predicted-Visits Heatmap Generator
+
+Evaluates the v3 state model on a regular lattice of candidate sites covering
+Florida or Pennsylvania (e.g. one cell every 0.25 miles) to produce a
+"white-space" raster that reports can overlay.
+
+The lattice is processed in square tiles. For each tile:
+- Distance features (populations, competitor counts, weighted competition)
+  are computed as vectorized cell x tract / cell x dispensary blocks, limited
+  to the tracts and dispensaries that can fall inside the largest radius of
+  any cell in the tile (via the loader's spatial indexes).
+- Demographics come from the nearest census tract centroid, which stands in
+  for a point-in-polygon lookup. Cells farther than max_tract_distance_miles
+  from every centroid (open water, outside the state) are written as nodata.
+- Features are derived column-wise and scored with predict_batch().
+
+Tiles run on a thread pool; NumPy and the model's predict release the GIL for
+the heavy work, and tiles write disjoint slices of one memory-mapped grid.
+
+Output is a .npy grid (float32, row 0 = north edge) plus a JSON sidecar with a
+GeoTIFF-style affine transform, CRS, nodata value and run parameters.
+
+Usage:
+    python3 src/prediction/heatmap_generator.py --state FL --spacing 0.25 \\
+        --output data/heatmaps/fl_visits
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import sys
+import json
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.prediction.predictor import MultiStatePredictor
+from src.prediction.feature_validator import FeatureValidator
+from src.feature_engineering.data_loader import MultiStateDataLoader
+from src.feature_engineering.coordinate_calculator import CoordinateFeatureCalculator
+from src.feature_engineering.site_context import validate_radii
+from src.feature_engineering.distance_kernel import (
+    haversine_miles, EARTH_RADIUS_MILES, HAVERSINE_MAX_RELATIVE_ERROR, BOUNDARY_ABSOLUTE_SLACK
+)
+
+# Miles spanned by one degree of latitude on the spherical Earth
+MILES_PER_DEGREE_LAT = EARTH_RADIUS_MILES * np.pi / 180.0
+
+
+class HeatmapGenerator:
+    """
+    Generate predicted-visit rasters over a state's bounding box.
+
+    Attributes:
+        data_loader (MultiStateDataLoader): Tract and dispensary data with spatial indexes
+        calculator (CoordinateFeatureCalculator): Distance feature block computation
+        validator (FeatureValidator): Derived feature generation
+        model_version (str): Predictor model version ('v3' state-specific by default)
+    """
+
+    DEFAULT_SPACING_MILES = 0.25
+    DEFAULT_TILE_CELLS = 32
+    DEFAULT_MAX_TRACT_DISTANCE_MILES = 5.0
+    NODATA = -9999.0
+
+    # Base features taken from the nearest census tract
+    TRACT_FEATURES = [
+        'total_population', 'median_age', 'median_household_income',
+        'per_capita_income', 'total_pop_25_plus', 'bachelors_degree',
+        'masters_degree', 'professional_degree', 'doctorate_degree',
+        'population_density', 'tract_area_sqm'
+    ]
+
+    def __init__(
+        self,
+        data_loader: MultiStateDataLoader = None,
+        calculator: CoordinateFeatureCalculator = None,
+        validator: FeatureValidator = None,
+        predictors: Optional[Dict[str, MultiStatePredictor]] = None,
+        model_version: str = 'v3'
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            data_loader (MultiStateDataLoader, optional): Pre-loaded data loader
+            calculator (CoordinateFeatureCalculator, optional): Calculator sharing the loader
+            validator (FeatureValidator, optional): Feature validator
+            predictors (dict, optional): Pre-loaded predictors keyed by state code
+            model_version (str): Model version used when loading predictors
+        """
+        if data_loader is None:
+            data_loader = calculator.data_loader if calculator is not None else MultiStateDataLoader()
+
+        self.data_loader = data_loader
+        self.calculator = calculator or CoordinateFeatureCalculator(self.data_loader)
+        self.validator = validator or FeatureValidator()
+        self.model_version = model_version
+        self._predictors = dict(predictors or {})
+        self._validators = {tuple(self.validator.radii): self.validator}
+
+    def get_predictor(self, state: str) -> MultiStatePredictor:
+        """
+        Get (and cache) the predictor for a state.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+
+        Returns:
+            MultiStatePredictor: State-specific predictor
+        """
+        if state not in self._predictors:
+            self._predictors[state] = MultiStatePredictor(state=state, model_version=self.model_version)
+        return self._predictors[state]
+
+    def get_validator(self, radii) -> FeatureValidator:
+        """
+        Get (and cache) a validator for a model's radius ladder.
+
+        Args:
+            radii (list): Radius ladder of the model (MultiStatePredictor.radii)
+
+        Returns:
+            FeatureValidator: Validator generating features for those radii
+        """
+        key = tuple(validate_radii(radii))
+        if key not in self._validators:
+            self._validators[key] = FeatureValidator(radii=list(key))
+        return self._validators[key]
+
+    def build_lattice(
+        self,
+        state: str,
+        spacing_miles: float = DEFAULT_SPACING_MILES,
+        bounds: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """
+        Define the lattice covering a bounding box.
+
+        Rows are evenly spaced in latitude and columns in longitude. The
+        longitude step is chosen so cells are spacing_miles wide at the
+        box's middle latitude.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            spacing_miles (float): Distance between neighbouring cell centers
+            bounds (dict, optional): lat_min/lat_max/lon_min/lon_max sub-region.
+                Default: the state's bounding box.
+
+        Returns:
+            dict: north, west, lat_step, lon_step (degrees), rows, cols
+        """
+        if spacing_miles <= 0:
+            raise ValueError(f"spacing_miles must be positive, got {spacing_miles}")
+
+        bounds = bounds or self.data_loader.get_state_bounds(state)
+        lat_step = spacing_miles / MILES_PER_DEGREE_LAT
+        mid_lat = (bounds['lat_min'] + bounds['lat_max']) / 2.0
+        lon_step = lat_step / np.cos(np.radians(mid_lat))
+
+        return {
+            'north': bounds['lat_max'],
+            'west': bounds['lon_min'],
+            'lat_step': lat_step,
+            'lon_step': lon_step,
+            'rows': int(np.ceil((bounds['lat_max'] - bounds['lat_min']) / lat_step)),
+            'cols': int(np.ceil((bounds['lon_max'] - bounds['lon_min']) / lon_step))
+        }
+
+    def compute_tile(
+        self,
+        state: str,
+        lattice: Dict[str, float],
+        rows: Tuple[int, int],
+        cols: Tuple[int, int],
+        sq_ft: float,
+        max_tract_distance_miles: float = DEFAULT_MAX_TRACT_DISTANCE_MILES,
+        memory_budget_mb: float = 64,
+        refine: bool = False
+    ) -> np.ndarray:
+        """
+        Predict visits for every cell in one tile.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            lattice (dict): Lattice definition from build_lattice()
+            rows (tuple): (start, stop) row range of the tile
+            cols (tuple): (start, stop) column range of the tile
+            sq_ft (float): Dispensary size assumed for every cell
+            max_tract_distance_miles (float): Cells farther than this from every
+                tract centroid are nodata
+            memory_budget_mb (float): Distance block budget for this tile
+            refine (bool): Refine boundary distances to exact geodesic (slower)
+
+        Returns:
+            ndarray: (rows, cols) float32 predictions, NODATA where masked
+        """
+        row_idx = np.arange(rows[0], rows[1])
+        col_idx = np.arange(cols[0], cols[1])
+        cell_lats = lattice['north'] - (row_idx + 0.5) * lattice['lat_step']
+        cell_lons = lattice['west'] + (col_idx + 0.5) * lattice['lon_step']
+        lat_grid, lon_grid = np.meshgrid(cell_lats, cell_lons, indexing='ij')
+        lats = lat_grid.ravel()
+        lons = lon_grid.ravel()
+
+        result = np.full(len(lats), self.NODATA, dtype=np.float32)
+
+        predictor = self.get_predictor(state)
+        radii = validate_radii(predictor.radii)
+        dispensaries_df, census_df, dispensary_index, tract_index = self.data_loader.get_state_view(state)
+
+        # Demographics from the nearest tract centroid; far-away cells are nodata
+        tract_miles, nearest = tract_index.query_nearest_many(lats, lons)
+        tract_values = census_df[self.TRACT_FEATURES].to_numpy(dtype=np.float64)
+        valid = tract_miles <= max_tract_distance_miles
+        valid[valid] = np.isfinite(tract_values[nearest[valid]]).all(axis=1)
+
+        if not valid.any():
+            return result.reshape(len(row_idx), len(col_idx))
+
+        # Only targets that can fall inside the largest radius of some cell
+        center_lat = float(cell_lats.mean())
+        center_lon = float(cell_lons.mean())
+        half_diagonal = float(haversine_miles(
+            center_lat, center_lon,
+            np.array([cell_lats[0], cell_lats[0], cell_lats[-1], cell_lats[-1]]),
+            np.array([cell_lons[0], cell_lons[-1], cell_lons[0], cell_lons[-1]])
+        ).max())
+        weighted_radius = 20
+        reach = max(max(radii), weighted_radius)
+        search = half_diagonal + reach * (1 + HAVERSINE_MAX_RELATIVE_ERROR) + BOUNDARY_ABSOLUTE_SLACK
+
+        features = self.calculator.calculate_distance_features_block(
+            state, lats[valid], lons[valid],
+            memory_budget_mb=memory_budget_mb,
+            refine=refine,
+            weighted_radius=weighted_radius,
+            tract_positions=tract_index.query_radius(center_lat, center_lon, search),
+            dispensary_positions=dispensary_index.query_radius(center_lat, center_lon, search),
+            radii=radii,
+            state_frames=(dispensaries_df, census_df)
+        )
+
+        base_df = pd.DataFrame(features)
+        base_df[self.TRACT_FEATURES] = tract_values[nearest[valid]]
+        base_df['sq_ft'] = float(sq_ft)
+
+        features_df = self.get_validator(radii).prepare_features_frame(base_df, state)
+        predictions = predictor.predict_batch(features_df)['predicted_visits']
+        result[valid] = predictions.to_numpy(dtype=np.float32)
+
+        return result.reshape(len(row_idx), len(col_idx))
+
+    def generate(
+        self,
+        state: str,
+        output_path: str,
+        spacing_miles: float = DEFAULT_SPACING_MILES,
+        bounds: Optional[Dict[str, float]] = None,
+        sq_ft: Optional[float] = None,
+        tile_cells: int = DEFAULT_TILE_CELLS,
+        max_workers: Optional[int] = None,
+        max_tract_distance_miles: float = DEFAULT_MAX_TRACT_DISTANCE_MILES,
+        memory_budget_mb: float = 64,
+        refine: bool = False
+    ) -> Dict:
+        """
+        Generate the heatmap and write it to disk.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            output_path (str): Output path; '.npy' and '.json' files are written
+            spacing_miles (float): Distance between neighbouring cell centers
+            bounds (dict, optional): lat_min/lat_max/lon_min/lon_max sub-region
+            sq_ft (float, optional): Assumed dispensary size. Default: state median.
+            tile_cells (int): Tile edge length in cells
+            max_workers (int, optional): Tile worker threads (ThreadPoolExecutor default if None)
+            max_tract_distance_miles (float): Nodata distance from nearest tract centroid
+            memory_budget_mb (float): Distance block budget per tile
+            refine (bool): Refine boundary distances to exact geodesic (slower)
+
+        Returns:
+            dict: Metadata written to the JSON sidecar
+        """
+        state = state.upper().strip()
+        self.data_loader.get_state_bounds(state)  # validates state
+        if sq_ft is None:
+            sq_ft = self.calculator.STATE_MEDIAN_SQ_FT[state]
+
+        # Load the model before starting workers so threads share one predictor
+        self.get_predictor(state)
+
+        lattice = self.build_lattice(state, spacing_miles, bounds)
+        n_rows, n_cols = lattice['rows'], lattice['cols']
+
+        grid_path = Path(output_path).with_suffix('.npy')
+        meta_path = Path(output_path).with_suffix('.json')
+        grid_path.parent.mkdir(parents=True, exist_ok=True)
+
+        grid = np.lib.format.open_memmap(
+            grid_path, mode='w+', dtype=np.float32, shape=(n_rows, n_cols)
+        )
+        grid[:] = self.NODATA
+
+        tiles = [
+            ((r, min(r + tile_cells, n_rows)), (c, min(c + tile_cells, n_cols)))
+            for r in range(0, n_rows, tile_cells)
+            for c in range(0, n_cols, tile_cells)
+        ]
+
+        print(f"🗺️  Generating {state} heatmap: {n_rows:,} x {n_cols:,} cells "
+              f"({spacing_miles} mi spacing, {len(tiles):,} tiles)")
+
+        progress_step = max(1, len(tiles) // 10)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.compute_tile, state, lattice, rows, cols, sq_ft,
+                    max_tract_distance_miles, memory_budget_mb, refine
+                ): (rows, cols)
+                for rows, cols in tiles
+            }
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                (r0, r1), (c0, c1) = futures[future]
+                grid[r0:r1, c0:c1] = future.result()
+                if done % progress_step == 0 or done == len(tiles):
+                    print(f"   {done:,}/{len(tiles):,} tiles complete")
+
+        grid.flush()
+        valid = grid != self.NODATA
+        valid_cells = int(valid.sum())
+
+        metadata = {
+            'state': state,
+            'value': 'predicted_visits',
+            'model_version': self.get_predictor(state).model_version,
+            'dtype': 'float32',
+            'nodata': self.NODATA,
+            'shape': [n_rows, n_cols],
+            'crs': 'EPSG:4326',
+            'spacing_miles': spacing_miles,
+            'bounds': {
+                'west': lattice['west'],
+                'east': lattice['west'] + n_cols * lattice['lon_step'],
+                'south': lattice['north'] - n_rows * lattice['lat_step'],
+                'north': lattice['north']
+            },
+            # GDAL-style geotransform: x = c0 + col * c1, y = c3 + row * c5 (cell corners)
+            'geotransform': [
+                lattice['west'], lattice['lon_step'], 0.0,
+                lattice['north'], 0.0, -lattice['lat_step']
+            ],
+            'sq_ft': float(sq_ft),
+            'radii_miles': validate_radii(self.get_predictor(state).radii),
+            'refined_distances': refine,
+            'max_tract_distance_miles': max_tract_distance_miles,
+            'valid_cells': valid_cells,
+            'min_prediction': float(grid[valid].min()) if valid_cells else None,
+            'max_prediction': float(grid[valid].max()) if valid_cells else None,
+            'grid_file': grid_path.name,
+            'created': datetime.now().isoformat()
+        }
+
+        with open(meta_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+
+        print(f"✅ Heatmap saved: {grid_path} ({valid_cells:,} valid cells)")
+        print(f"   Metadata: {meta_path}")
+
+        return metadata
+
+
+def load_heatmap(output_path: str) -> Tuple[np.ndarray, Dict]:
+    """
+    Open a generated heatmap without reading it into memory.
+
+    Args:
+        output_path (str): Path given to generate() (with or without suffix)
+
+    Returns:
+        Tuple[ndarray, dict]: (read-only memory-mapped grid, metadata)
+    """
+    with open(Path(output_path).with_suffix('.json')) as f:
+        metadata = json.load(f)
+    grid = np.load(Path(output_path).with_suffix('.npy'), mmap_mode='r')
+    return grid, metadata
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description='Generate a statewide predicted-visits heatmap')
+    parser.add_argument('--state', required=True, choices=['FL', 'PA', 'fl', 'pa'])
+    parser.add_argument('--output', required=True, help='Output path (writes .npy and .json)')
+    parser.add_argument('--spacing', type=float, default=HeatmapGenerator.DEFAULT_SPACING_MILES,
+                        help='Cell spacing in miles (default: 0.25)')
+    parser.add_argument('--bbox', type=float, nargs=4, metavar=('LAT_MIN', 'LON_MIN', 'LAT_MAX', 'LON_MAX'),
+                        help='Restrict to a sub-region of the state')
+    parser.add_argument('--sq-ft', type=float, default=None,
+                        help='Assumed dispensary size (default: state median)')
+    parser.add_argument('--tile-cells', type=int, default=HeatmapGenerator.DEFAULT_TILE_CELLS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--refine', action='store_true',
+                        help='Refine distances near radius boundaries to exact geodesic')
+    args = parser.parse_args()
+
+    bounds = None
+    if args.bbox:
+        lat_min, lon_min, lat_max, lon_max = args.bbox
+        bounds = {'lat_min': lat_min, 'lat_max': lat_max, 'lon_min': lon_min, 'lon_max': lon_max}
+
+    generator = HeatmapGenerator()
+    generator.generate(
+        args.state.upper(), args.output,
+        spacing_miles=args.spacing,
+        bounds=bounds,
+        sq_ft=args.sq_ft,
+        tile_cells=args.tile_cells,
+        max_workers=args.workers,
+        refine=args.refine
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,14 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    from ..instrumentation import profiler
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from instrumentation import profiler
+
 
 class MultiStatePredictor:
     """
@@ -33,6 +41,9 @@ class MultiStatePredictor:
     - Feature contribution analysis
     """
 
+    # Trade-area radii (miles) for artifacts that predate the 'radii' entry
+    DEFAULT_RADII = [1, 3, 5, 10, 20]
+
     def __init__(self, model_path: str = None, state: str = None, model_version: str = 'v3'):
         """
         Initialize predictor and load model artifact.
@@ -74,6 +85,7 @@ class MultiStatePredictor:
         self.best_alpha = None
         self.training_date = None
         self.model_metadata = None
+        self.radii = list(self.DEFAULT_RADII)
 
         self.load_model()
 
@@ -109,6 +121,9 @@ class MultiStatePredictor:
             # v3 models don't have best_alpha (might be Random Forest or XGBoost)
             self.best_alpha = model_artifact.get('best_alpha', None)
 
+            # Radius ladder the model's pop_*/competitors_* features were built with
+            self.radii = list(model_artifact.get('radii', self.DEFAULT_RADII))
+
             # Get model info for logging
             model_version = model_artifact.get('model_version', 'v2')
             algorithm = model_artifact.get('algorithm', 'ridge')
@@ -120,6 +135,8 @@ class MultiStatePredictor:
                 print(f"   State: {self.state}")
             print(f"   Algorithm: {algorithm}")
             print(f"   Features: {len(self.feature_names)}")
+            if self.radii != self.DEFAULT_RADII:
+                print(f"   Radii: {self.radii}")
             if self.best_alpha:
                 print(f"   Alpha: {self.best_alpha}")
             if cv_r2:
@@ -153,6 +170,7 @@ class MultiStatePredictor:
 
         return True, []
 
+    @profiler.timed('model_inference')
     def predict(self, features_dict: Dict[str, float]) -> float:
         """
         Generate visit prediction from feature dictionary.
@@ -191,6 +209,7 @@ class MultiStatePredictor:
 
         return prediction
 
+    @profiler.timed('confidence_interval')
     def predict_with_confidence(
         self,
         features_dict: Dict[str, float],
@@ -552,6 +571,7 @@ class MultiStatePredictor:
 
         return contributions.head(n)
 
+    @profiler.timed('model_inference.batch')
     def predict_batch(
         self,
         features_df: pd.DataFrame,
@@ -625,6 +645,7 @@ class MultiStatePredictor:
             'model_path': str(self.model_path),
             'training_date': self.training_date,
             'n_features': len(self.feature_names),
+            'radii': self.radii,
             'model_version': self.model_metadata.get('model_version', 'v2'),
             'algorithm': self.model_metadata.get('algorithm', 'ridge')
         }
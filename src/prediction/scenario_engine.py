@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Competition Scenario Engine
+
+Answers "what happens to our stores if a competitor opens (or closes) here?"
+without rebuilding an all-pairs distance matrix.
+
+The engine keeps a sparse neighbor graph: every dispensary (existing or
+hypothetical) is linked to the scored sites within reach of it (the largest
+of the model's radii and the 20-mile weighted-competition radius), together
+with the exact distances. Each site's competition features are the sum of
+its incoming edges, so:
+- Inserting a store queries the site index once, computes distances to the
+  sites in reach, and adds its contributions to those sites only.
+- Removing a store subtracts exactly the contributions it added.
+- Only sites whose features changed are re-scored, with one
+  MultiStatePredictor.predict_batch() call.
+
+Competition features follow the prediction-time definitions used by
+CoordinateFeatureCalculator: a competitor counts at radius r if its distance
+is <= r, dispensaries within 0.1 miles of a site are the site itself, and the
+weighted score is sum(1 / (distance + 0.01)) within 20 miles. Baseline
+features are recomputed from the graph with the same definitions, so
+scenario deltas never mix in training-time feature differences.
+
+Author: Multi-State Dispensary Model - Performance Improvements
+Date: October 2025
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.prediction.predictor import MultiStatePredictor
+from src.prediction.feature_validator import FeatureValidator
+from src.feature_engineering.data_loader import MultiStateDataLoader
+from src.feature_engineering.spatial_index import SphericalIndex
+from src.feature_engineering.distance_kernel import (
+    site_distances_miles, HAVERSINE_MAX_RELATIVE_ERROR, BOUNDARY_ABSOLUTE_SLACK
+)
+
+
+class CompetitionScenarioEngine:
+    """
+    Incremental competition features and predictions for hypothetical store changes.
+
+    Attributes:
+        state (str): State code ('FL' or 'PA')
+        sites (DataFrame): Scored sites (positional index) with their base features
+        radii (list): Competitor count radii (the predictor's ladder)
+        reach_miles (float): Largest distance at which a store affects a site
+        baseline_visits (ndarray): Predicted visits per site with no scenario changes
+        scenario_visits (ndarray): Predicted visits per site under the current scenario
+            (as of the last rescore())
+    """
+
+    SELF_EXCLUSION_MILES = 0.1
+    WEIGHTED_RADIUS = 20
+
+    def __init__(
+        self,
+        state: str,
+        sites_df: pd.DataFrame,
+        dispensaries_df: Optional[pd.DataFrame] = None,
+        predictor: Optional[MultiStatePredictor] = None,
+        validator: Optional[FeatureValidator] = None,
+        data_loader: Optional[MultiStateDataLoader] = None,
+        model_version: str = 'v3'
+    ):
+        """
+        Build the neighbor graph and score the baseline.
+
+        Args:
+            state (str): State code ('FL' or 'PA')
+            sites_df (DataFrame): Stores to score, with latitude/longitude and every
+                required base feature except the competition ones (sq_ft, pop_*,
+                demographics). competitors_* and competition_weighted_20mi are
+                computed from the graph.
+            dispensaries_df (DataFrame, optional): Existing dispensaries with
+                latitude/longitude. Default: the loader's dispensaries for the state.
+            predictor (MultiStatePredictor, optional): State model. Default: loaded
+                for state and model_version.
+            validator (FeatureValidator, optional): Validator for the predictor's radii
+            data_loader (MultiStateDataLoader, optional): Used only when
+                dispensaries_df is not given
+            model_version (str): Model version used when loading the predictor
+
+        Raises:
+            ValueError: If sites_df lacks coordinates
+        """
+        self.state = state.upper().strip()
+
+        missing = [c for c in ('latitude', 'longitude') if c not in sites_df.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        if dispensaries_df is None:
+            data_loader = data_loader or MultiStateDataLoader()
+            dispensaries_df, _ = data_loader.get_state_data(self.state)
+
+        self.predictor = predictor or MultiStatePredictor(state=self.state, model_version=model_version)
+        self.radii = sorted(self.predictor.radii)
+        self.validator = validator or FeatureValidator(radii=self.radii)
+        self.reach_miles = float(max(max(self.radii), self.WEIGHTED_RADIUS))
+
+        self.sites = sites_df.reset_index(drop=True)
+        self._site_lats = self.sites['latitude'].to_numpy(dtype=np.float64)
+        self._site_lons = self.sites['longitude'].to_numpy(dtype=np.float64)
+        self._site_index = SphericalIndex(self._site_lats, self._site_lons)
+        self._radii = np.asarray(self.radii, dtype=np.float64)
+
+        n_sites = len(self.sites)
+        self._counts = np.zeros((n_sites, len(self.radii)), dtype=np.int64)
+        self._weighted = np.zeros(n_sites, dtype=np.float64)
+
+        # Node id -> (site positions, distances) of its outgoing edges
+        self._edges: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._stores: Dict[int, Dict] = {}
+        self._removed: Dict[int, Tuple[Dict, Tuple[np.ndarray, np.ndarray]]] = {}
+        self._next_id = 0
+        self._dirty = set()
+
+        for latitude, longitude in dispensaries_df[['latitude', 'longitude']].to_numpy(dtype=np.float64):
+            self.add_store(latitude, longitude, hypothetical=False)
+
+        self._baseline_counts = self._counts.copy()
+        self._baseline_weighted = self._weighted.copy()
+
+        self.baseline_visits = self._predict(np.arange(n_sites))
+        self.scenario_visits = self.baseline_visits.copy()
+        self._dirty.clear()
+
+    def _site_edges(self, latitude: float, longitude: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Scored sites a store at (latitude, longitude) competes with, and their distances."""
+        search = self.reach_miles * (1 + HAVERSINE_MAX_RELATIVE_ERROR) + BOUNDARY_ABSOLUTE_SLACK
+        positions = self._site_index.query_radius(latitude, longitude, search)
+
+        distances = site_distances_miles(
+            latitude, longitude, self._site_lats[positions], self._site_lons[positions],
+            radii=self.radii + [self.SELF_EXCLUSION_MILES],
+            refine_within=self.WEIGHTED_RADIUS
+        )
+
+        keep = (distances > self.SELF_EXCLUSION_MILES) & (distances <= self.reach_miles)
+        return positions[keep], distances[keep]
+
+    def _apply_edges(self, positions: np.ndarray, distances: np.ndarray, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) one store's contributions."""
+        within = distances[:, None] <= self._radii[None, :]
+        self._counts[positions] += sign * within.astype(np.int64)
+
+        weights = np.where(distances <= self.WEIGHTED_RADIUS, 1.0 / (distances + 0.01), 0.0)
+        self._weighted[positions] += sign * weights
+        self._dirty.update(positions.tolist())
+
+    def add_store(
+        self,
+        latitude: float,
+        longitude: float,
+        name: Optional[str] = None,
+        hypothetical: bool = True
+    ) -> int:
+        """
+        Insert a store into the market.
+
+        Args:
+            latitude (float): Store latitude in decimal degrees
+            longitude (float): Store longitude in decimal degrees
+            name (str, optional): Label for reporting
+            hypothetical (bool): Whether the store is part of a scenario
+
+        Returns:
+            int: Store id (pass to remove_store())
+        """
+        store_id = self._next_id
+        self._next_id += 1
+
+        positions, distances = self._site_edges(float(latitude), float(longitude))
+        self._apply_edges(positions, distances, 1)
+
+        self._edges[store_id] = (positions, distances)
+        self._stores[store_id] = {
+            'latitude': float(latitude), 'longitude': float(longitude),
+            'name': name, 'hypothetical': hypothetical
+        }
+        return store_id
+
+    def remove_store(self, store_id: int) -> None:
+        """
+        Remove a store (existing or hypothetical) from the market.
+
+        Existing dispensaries have ids 0..n-1 in dispensaries_df row order.
+
+        Args:
+            store_id (int): Id returned by add_store()
+
+        Raises:
+            KeyError: If the store is not in the market
+        """
+        if store_id not in self._edges:
+            raise KeyError(f"Store {store_id} is not in the market")
+
+        edges = self._edges.pop(store_id)
+        store = self._stores.pop(store_id)
+        if not store['hypothetical']:
+            self._removed[store_id] = (store, edges)
+
+        self._apply_edges(*edges, -1)
+
+    def stores(self) -> pd.DataFrame:
+        """Every store currently in the market, indexed by store id."""
+        return pd.DataFrame.from_dict(self._stores, orient='index')
+
+    def competition_features(self) -> pd.DataFrame:
+        """
+        Current competition features of every site.
+
+        Returns:
+            DataFrame: competitors_{r}mi per radius and competition_weighted_20mi
+        """
+        features = pd.DataFrame(
+            self._counts, columns=[f'competitors_{r}mi' for r in self.radii]
+        )
+        features[f'competition_weighted_{self.WEIGHTED_RADIUS}mi'] = self._weighted
+        return features
+
+    def _predict(self, positions: np.ndarray) -> np.ndarray:
+        """Predicted visits for some sites under the current competition features."""
+        if len(positions) == 0:
+            return np.empty(0)
+
+        competition = self.competition_features().iloc[positions].reset_index(drop=True)
+        base_df = self.sites.iloc[positions].reset_index(drop=True)
+        base_df = base_df.drop(columns=[c for c in competition.columns if c in base_df.columns])
+        base_df = pd.concat([base_df, competition], axis=1)
+
+        features_df = self.validator.prepare_features_frame(base_df, self.state)
+        predictions = self.predictor.predict_batch(features_df)['predicted_visits']
+        return predictions.to_numpy(dtype=np.float64)
+
+    def affected_sites(self) -> np.ndarray:
+        """Positions of sites whose competition features differ from the baseline."""
+        changed = (self._counts != self._baseline_counts).any(axis=1)
+        changed |= ~np.isclose(self._weighted, self._baseline_weighted, rtol=0, atol=1e-9)
+        return np.flatnonzero(changed)
+
+    def rescore(self) -> pd.DataFrame:
+        """
+        Re-predict the sites touched since the last rescore (one predict_batch call).
+
+        Returns:
+            DataFrame: One row per site affected by the current scenario, indexed
+                by site position, with latitude, longitude, current competition
+                features, baseline_visits, scenario_visits, delta_visits and
+                delta_pct
+        """
+        dirty = np.fromiter(self._dirty, dtype=np.intp, count=len(self._dirty))
+        self._dirty.clear()
+
+        affected = self.affected_sites()
+        changed = np.intersect1d(dirty, affected)
+        self.scenario_visits[changed] = self._predict(changed)
+
+        # Sites back at their baseline features get exactly the baseline prediction
+        restored = np.setdiff1d(dirty, affected)
+        self.scenario_visits[restored] = self.baseline_visits[restored]
+
+        result = self.sites.loc[affected, ['latitude', 'longitude']].copy()
+        features = self.competition_features().iloc[affected]
+        for column in features.columns:
+            result[column] = features[column].to_numpy()
+
+        result['baseline_visits'] = self.baseline_visits[affected]
+        result['scenario_visits'] = self.scenario_visits[affected]
+        result['delta_visits'] = result['scenario_visits'] - result['baseline_visits']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['delta_pct'] = np.where(
+                result['baseline_visits'] != 0,
+                result['delta_visits'] / result['baseline_visits'] * 100, np.nan
+            )
+
+        return result
+
+    def evaluate_new_competitor(self, latitude: float, longitude: float) -> pd.DataFrame:
+        """
+        Impact of one hypothetical competitor, leaving the scenario unchanged.
+
+        Args:
+            latitude (float): Competitor latitude in decimal degrees
+            longitude (float): Competitor longitude in decimal degrees
+
+        Returns:
+            DataFrame: rescore() result with the competitor added
+        """
+        store_id = self.add_store(latitude, longitude)
+        try:
+            return self.rescore()
+        finally:
+            self.remove_store(store_id)
+            self.rescore()
+
+    def reset(self) -> None:
+        """Remove every hypothetical store and restore removed existing ones."""
+        for store_id in [i for i, s in self._stores.items() if s['hypothetical']]:
+            self.remove_store(store_id)
+
+        for store_id, (store, edges) in self._removed.items():
+            self._stores[store_id] = store
+            self._edges[store_id] = edges
+        self._removed.clear()
+
+        self._counts = self._baseline_counts.copy()
+        self._weighted = self._baseline_weighted.copy()
+        self.scenario_visits = self.baseline_visits.copy()
+        self._dirty.clear()
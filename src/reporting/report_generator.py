@@ -21,6 +21,14 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
+try:
+    from ..instrumentation import profiler
+except ImportError:
+    # Allow running as standalone script
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from instrumentation import profiler
+
 
 class ReportGenerator:
     """Generate comprehensive reports for multi-state dispensary analysis."""
@@ -42,6 +50,7 @@ class ReportGenerator:
         self.timestamp = datetime.now()
         self.state_benchmarks = self._calculate_state_benchmarks()
 
+    @profiler.timed('report_rendering')
     def generate_reports(
         self,
         results: List[Dict[str, Any]],
@@ -106,6 +115,7 @@ class ReportGenerator:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
 
+    @profiler.timed('report_rendering.html')
     def generate_html_report(
         self,
         results: List[Dict[str, Any]],
@@ -842,6 +852,7 @@ class ReportGenerator:
             print(f"⚠️  Chart generation failed: {e}")
             return None
 
+    @profiler.timed('report_rendering.csv')
     def generate_csv_report(
         self,
         results: List[Dict[str, Any]],
@@ -895,6 +906,7 @@ class ReportGenerator:
 
         return csv_path
 
+    @profiler.timed('report_rendering.txt')
     def generate_text_report(
         self,
         results: List[Dict[str, Any]],
@@ -946,7 +958,7 @@ class ReportGenerator:
         results: List[Dict[str, Any]],
         output_dir: Path
     ) -> Optional[Path]:
-        """Generate JSON run receipt with metadata."""
+        """Generate JSON run receipt with metadata (plus the stage profile, if profiling is enabled)."""
         receipt_data = {
             'analysis_timestamp': self.timestamp.isoformat(),
             'model_version': 'v3.0',
@@ -957,6 +969,9 @@ class ReportGenerator:
             'states_covered': list(set(r.get('state', 'N/A') for r in results))
         }
 
+        if profiler.enabled:
+            receipt_data['profile'] = profiler.snapshot()
+
         receipt_path = output_dir / "run_receipt.json"
         with open(receipt_path, 'w') as f:
             json.dump(receipt_data, f, indent=2)
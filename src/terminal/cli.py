@@ -8,10 +8,13 @@ batch processing from CSV files.
 
 Usage:
     python3 src/terminal/cli.py
+    python3 src/terminal/cli.py --profile run_profile.json   # stage timings/counters
+    python3 src/terminal/cli.py --cprofile run.prof          # full cProfile capture
 """
 
 import sys
 import csv
+import argparse
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import pandas as pd
@@ -24,8 +27,10 @@ from src.prediction.predictor import MultiStatePredictor
 from src.prediction.feature_validator import FeatureValidator
 from src.feature_engineering.data_loader import MultiStateDataLoader
 from src.feature_engineering.coordinate_calculator import CoordinateFeatureCalculator
+from src.feature_engineering.site_context import validate_radii
 from src.feature_engineering.exceptions import DataNotFoundError, InvalidStateError
 from src.reporting.report_generator import ReportGenerator
+from src.instrumentation import profiler, capture_cprofile
 
 
 class TerminalInterface:
@@ -37,14 +42,19 @@ class TerminalInterface:
         try:
             # Use v2 unified model for header/info display
             self.predictor = MultiStatePredictor(model_version='v2')
-            self.validator = FeatureValidator()
+            self.validator = FeatureValidator(radii=self.predictor.radii)
 
             # Cache for state-specific predictors (v3)
             self._state_predictors = {}
 
             # Initialize coordinate calculator for auto-feature generation
+            # (on the model's radius ladder)
             self.data_loader = MultiStateDataLoader()
-            self.calculator = CoordinateFeatureCalculator(self.data_loader)
+            self.calculator = CoordinateFeatureCalculator(self.data_loader, radii=self.predictor.radii)
+
+            # Validators/calculators per radius ladder (state models may use other radii)
+            self._validators = {tuple(self.validator.radii): self.validator}
+            self._calculators = {tuple(self.calculator.RADII): self.calculator}
 
             print("✅ Model and data loaded successfully\n")
         except Exception as e:
@@ -74,6 +84,46 @@ class TerminalInterface:
 
         return self._state_predictors[state]
 
+    def get_validator_for_state(self, state: str) -> FeatureValidator:
+        """
+        Get a feature validator matching the state model's radius ladder.
+
+        Parameters:
+        -----------
+        state : str
+            State code ('FL' or 'PA')
+
+        Returns:
+        --------
+        FeatureValidator
+            Validator generating features for the state predictor's radii
+        """
+        radii = tuple(validate_radii(self.get_predictor_for_state(state).radii))
+        if radii not in self._validators:
+            self._validators[radii] = FeatureValidator(radii=list(radii))
+
+        return self._validators[radii]
+
+    def get_calculator_for_state(self, state: str) -> CoordinateFeatureCalculator:
+        """
+        Get a coordinate feature calculator matching the state model's radius ladder.
+
+        Parameters:
+        -----------
+        state : str
+            State code ('FL' or 'PA')
+
+        Returns:
+        --------
+        CoordinateFeatureCalculator
+            Calculator (sharing the loaded data) for the state predictor's radii
+        """
+        radii = tuple(validate_radii(self.get_predictor_for_state(state).radii))
+        if radii not in self._calculators:
+            self._calculators[radii] = CoordinateFeatureCalculator(self.data_loader, radii=list(radii))
+
+        return self._calculators[radii]
+
     def run(self):
         """Main entry point - run interactive session."""
         self.print_header()
@@ -174,7 +224,8 @@ class TerminalInterface:
             print("  • Extracting demographics")
 
             try:
-                base_features = self.calculator.calculate_all_features(
+                calculator = self.get_calculator_for_state(state)
+                base_features = calculator.calculate_all_features(
                     state,
                     coords['latitude'],
                     coords['longitude'],
@@ -228,7 +279,8 @@ class TerminalInterface:
             # Validate and generate derived features
             print("\n🔄 Validating inputs and generating derived features...")
             try:
-                complete_features, warnings = self.validator.prepare_features_with_warnings(
+                validator = self.get_validator_for_state(state)
+                complete_features, warnings = validator.prepare_features_with_warnings(
                     base_features, state
                 )
 
@@ -379,8 +431,14 @@ class TerminalInterface:
             print(f"❌ Error loading CSV: {e}")
             return
 
-        # Validate required columns
-        required_cols = self.validator.get_required_base_features() + ['state']
+        # Validate required columns (for the radius ladder of each state's model)
+        states = df['state'].dropna().astype(str).str.upper().unique() if 'state' in df.columns else []
+        validators = [
+            self.get_validator_for_state(st) for st in states if st in MultiStateDataLoader.SUPPORTED_STATES
+        ] or [self.validator]
+        required_cols = ['state']
+        for validator in validators:
+            required_cols += [col for col in validator.get_required_base_features() if col not in required_cols]
         missing_cols = [col for col in required_cols if col not in df.columns]
 
         if missing_cols:
@@ -393,15 +451,17 @@ class TerminalInterface:
 
         for idx, row in df.iterrows():
             try:
+                state = str(row['state']).upper()
+                validator = self.get_validator_for_state(state)
+
                 # Extract base features
                 base_features = {
                     col: row[col]
-                    for col in self.validator.get_required_base_features()
+                    for col in validator.get_required_base_features()
                 }
-                state = str(row['state']).upper()
 
                 # Validate and generate
-                complete_features, warnings = self.validator.prepare_features_with_warnings(
+                complete_features, warnings = validator.prepare_features_with_warnings(
                     base_features, state
                 )
 
@@ -1067,11 +1127,31 @@ class TerminalInterface:
         print("\n" + "=" * 70)
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description='Multi-State Dispensary Prediction Model CLI')
+    parser.add_argument(
+        '--profile', nargs='?', const='run_profile.json', default=None, metavar='PATH',
+        help='Record stage timings and counters and write them as JSON to PATH '
+             '(default: run_profile.json); also attached to run receipts'
+    )
+    parser.add_argument(
+        '--cprofile', default=None, metavar='PATH',
+        help='Capture a full cProfile of the session to PATH (pstats format)'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Entry point for CLI."""
+    args = parse_args(argv)
+    if args.profile:
+        profiler.enable()
+
     try:
-        cli = TerminalInterface()
-        cli.run()
+        with capture_cprofile(args.cprofile):
+            cli = TerminalInterface()
+            cli.run()
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user. Exiting...")
         sys.exit(0)
@@ -1080,6 +1160,11 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if args.profile:
+            print(f"⏱️  Stage profile: {profiler.export_json(args.profile)}")
+        if args.cprofile:
+            print(f"⏱️  cProfile stats: {args.cprofile}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the test suite.
+"""
+
+import json
+import threading
+import time
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.census_http import TransportResponse
+from src.feature_engineering.data_loader import MultiStateDataLoader
+
+
+# Centre of each state's synthetic tracts and dispensaries
+SYNTHETIC_CENTERS = {'FL': (28.5, -81.2), 'PA': (40.4, -80.0)}
+
+_STATE_FIPS = {'FL': '12', 'PA': '42'}
+
+_DEMOGRAPHICS = [
+    'median_age', 'median_household_income', 'per_capita_income',
+    'total_pop_25_plus', 'bachelors_degree', 'masters_degree',
+    'professional_degree', 'doctorate_degree', 'population_density', 'tract_area_sqm'
+]
+
+
+def synthetic_tables(seed, n_tracts, n_dispensaries):
+    """Random FL and PA census/dispensary tables around SYNTHETIC_CENTERS."""
+    rng = np.random.default_rng(seed)
+    tables = {}
+    for state, (lat, lon) in SYNTHETIC_CENTERS.items():
+        tables[f'{state.lower()}_census'] = pd.DataFrame({
+            'census_geoid': [f'{_STATE_FIPS[state]}003{i:06d}' for i in range(n_tracts)],
+            'latitude': lat + rng.uniform(-0.3, 0.3, n_tracts),
+            'longitude': lon + rng.uniform(-0.3, 0.3, n_tracts),
+            'total_population': rng.integers(500, 6000, n_tracts),
+            **{col: rng.uniform(1, 5000, n_tracts) for col in _DEMOGRAPHICS},
+            'census_data_complete': np.array([True if i % 2 == 0 else np.nan for i in range(n_tracts)], dtype=object),
+            'state': state
+        })
+        tables[f'{state.lower()}_dispensaries'] = pd.DataFrame({
+            'state': state,
+            'latitude': lat + rng.uniform(-0.25, 0.25, n_dispensaries),
+            'longitude': lon + rng.uniform(-0.25, 0.25, n_dispensaries),
+            'regulator_name': [f'Store {i}' if i % 3 else np.nan for i in range(n_dispensaries)]
+        })
+    return tables
+
+
+@pytest.fixture
+def synthetic_loader():
+    """Factory for real loaders over small random FL and PA sets (no data files needed)."""
+    def make(seed=11, n_tracts=200, n_dispensaries=25):
+        return MultiStateDataLoader.from_tables(synthetic_tables(seed, n_tracts, n_dispensaries))
+    return make
+
+
+class GeocoderTransport:
+    """
+    Census geocoder stand-in (a census_http transport): longitude -(80 + i/100) lies in PA tract i.
+
+    Counts answered calls; raises KeyboardInterrupt (a crash) once `fail_after`
+    calls have been answered.
+    """
+
+    def __init__(self, tract_of=None, fail_after=None):
+        self.tract_of = tract_of or (lambda longitude: round((-longitude - 80) * 100))
+        self.fail_after = fail_after
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, params, timeout):
+        with self._lock:
+            if self.calls == self.fail_after:
+                raise KeyboardInterrupt
+            self.calls += 1
+        tract = self.tract_of(float(params['x']))
+        return TransportResponse(200, {'result': {'geographies': {'Census Tracts': [{
+            'STATE': '42', 'COUNTY': '003', 'TRACT': f'{tract:06d}',
+            'GEOID': f'42003{tract:06d}', 'BASENAME': str(tract)
+        }]}}})
+
+
+class StubServer:
+    """
+    Local HTTP server answering each GET with a transport's TransportResponse.
+
+    The transport is called with the request path and its (string) query
+    parameters. Each response takes `latency` seconds; `hits` records
+    (path, query) per request and `max_in_flight` the most requests served at once.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.latency = 0.0
+        self.hits = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub._respond(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _respond(self, request):
+        url = urlparse(request.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.hits.append((url.path, query))
+        try:
+            time.sleep(self.latency)
+            response = self.transport(url.path, query, None)
+            body = json.dumps(response.payload).encode() if response.payload is not None else b''
+
+            request.send_response(response.status)
+            if response.retry_after is not None:
+                request.send_header('Retry-After', str(response.retry_after))
+            request.send_header('Content-Type', 'application/json')
+            request.send_header('Content-Length', str(len(body)))
+            request.end_headers()
+            request.wfile.write(body)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def geocoder_transport():
+    """Factory for GeocoderTransport stand-ins."""
+    return GeocoderTransport
+
+
+@pytest.fixture
+def stub_server():
+    """Factory starting a StubServer over a transport; servers stop after the test."""
+    servers = []
+
+    def start(transport):
+        servers.append(StubServer(transport))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.close()
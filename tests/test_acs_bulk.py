@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit tests for county-level bulk ACS fetching.
+
+Uses an in-process transport standing in for the ACS 5-Year API.
+"""
+
+import time
+import pandas as pd
+import pytest
+import requests
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.acs_data_collector import ACSDataCollector
+from src.feature_engineering.census_http import CensusSession, RequestsTransport, TransportResponse
+from src.feature_engineering.checkpoint_log import CheckpointLog, checkpoint_log_path
+
+# Tracts per county in the stand-in API (county 005 has none)
+COUNTIES = {'001': ['000100', '000200', '000300'], '003': ['010100', '010200'], '005': []}
+
+
+class _AcsApi:
+    """Transport answering county listings and for=tract:* / single-tract queries."""
+
+    def __init__(self):
+        self.requests = []
+        self.timeouts = {}
+
+    def __call__(self, url, params, timeout):
+        self.requests.append(params['for'])
+        self.timeouts[params['for']] = timeout
+        scope = params['in'].replace('+', ' ').split()  # single-tract queries join with '+'
+        state = scope[0].split(':')[1]
+
+        if params['for'] == 'county:*':
+            return TransportResponse(200, [['NAME', 'state', 'county']] + [
+                [f'County {c}', state, c] for c in COUNTIES
+            ])
+
+        county = scope[1].split(':')[1]
+        variables = params['get'].split(',')
+        wanted = params['for'].split(':')[1]
+        rows = [
+            [str(1000 + i) for i in range(len(variables))] + [state, county, tract]
+            for tract in COUNTIES[county] if wanted in ('*', tract)
+        ]
+        if not rows:
+            return TransportResponse(204)
+        return TransportResponse(200, [variables + ['state', 'county', 'tract']] + rows)
+
+
+@pytest.fixture
+def collector(tmp_path, monkeypatch):
+    monkeypatch.setenv('CENSUS_API_KEY', 'test-key-1234')
+    api = _AcsApi()
+    collector = ACSDataCollector(cache_dir=str(tmp_path / 'cache'), transport=api, requests_per_second=1000)
+    collector.api = api
+    return collector
+
+
+class TestAcsBulk:
+    """Test suite for get_county_demographics(), bulk batches and warm_state()."""
+
+    def test_bulk_batch_makes_one_request_per_county(self, collector, tmp_path):
+        """Five tracts (plus a duplicate row and an unknown tract) in two counties: two requests."""
+        tracts = pd.DataFrame({
+            'census_state_fips': ['42'] * 7,
+            'census_county_fips': ['001', '001', '001', '003', '003', '003', '001'],
+            'census_tract_fips': ['000100', '000200', '000300', '010100', '010200', '999999', '000100'],
+        })
+
+        result = collector.batch_collect_demographics(
+            tracts, checkpoint_file=str(tmp_path / 'demographics.csv')
+        )
+
+        assert collector.api.requests == ['tract:*', 'tract:*']
+        assert result['census_data_complete'].tolist() == [True] * 5 + [False, True]
+        assert result['census_api_error'].tolist() == [False] * 5 + [True, False]
+        assert result['total_population'].iloc[0] == 1000
+
+    def test_per_tract_requests_overlap(self, collector, tmp_path):
+        """Without bulk mode, tracts are requested concurrently and only the token bucket paces them."""
+        tracts = pd.DataFrame({
+            'census_state_fips': ['42'] * 5,
+            'census_county_fips': ['001', '001', '001', '003', '003'],
+            'census_tract_fips': ['000100', '000200', '000300', '010100', '010200'],
+        })
+
+        start = time.monotonic()
+        result = collector.batch_collect_demographics(
+            tracts, checkpoint_file=str(tmp_path / 'demographics.csv'), bulk=False, max_workers=4
+        )
+
+        assert time.monotonic() - start < 0.5
+        assert sorted(collector.api.requests) == sorted(f'tract:{t}' for t in tracts['census_tract_fips'])
+        assert result['census_data_complete'].all()
+
+    def test_warm_state_prefills_every_tract(self, collector):
+        """warm_state() lists counties once, fetches each once, and later lookups are local."""
+        assert collector.warm_state('PA') == 5
+        assert collector.api.requests == ['county:*', 'tract:*', 'tract:*', 'tract:*']
+
+        assert collector.get_tract_demographics('42', '003', '010200')['success']
+        assert collector.get_county_demographics('42', '001').keys() == {
+            '42001000100', '42001000200', '42001000300'
+        }
+        collector.warm_state('PA')
+        assert collector.api.requests == ['county:*', 'tract:*', 'tract:*', 'tract:*', 'county:*']
+
+    def test_merge_yields_typed_columns(self, collector, tmp_path):
+        """ACS columns come back float64 with NaN gaps; flags are bool; missing FIPS flag an error."""
+        tracts = pd.DataFrame({
+            'census_state_fips': ['42', '42', None],
+            'census_county_fips': ['003', '001', None],
+            'census_tract_fips': ['010100', '999999', None],
+        }, index=[10, 20, 30])
+
+        result = collector.batch_collect_demographics(
+            tracts, checkpoint_file=str(tmp_path / 'demographics.csv')
+        )
+
+        assert result.index.tolist() == [10, 20, 30]
+        assert (result[list(ACSDataCollector.ACS_VARIABLES.values())].dtypes == 'float64').all()
+        assert result[['census_data_complete', 'census_api_error']].dtypes.tolist() == ['bool', 'bool']
+        assert result['total_population'].iloc[0] == 1000
+        assert result['total_population'].iloc[1:].isna().all()
+        assert result['census_api_error'].tolist() == [False, True, True]
+
+    def test_merge_keeps_row_order_and_flags_records_without_success(self, collector, tmp_path):
+        """Duplicate GEOIDs map back onto their own rows; a logged record lacking 'success' is an error."""
+        checkpoint = tmp_path / 'demographics.csv'
+        with CheckpointLog(checkpoint_log_path(checkpoint)) as log:
+            log.append('42003010200', {'total_population': 7, 'data_complete': True})
+
+        tracts = pd.DataFrame({
+            'census_state_fips': ['42'] * 5,
+            'census_county_fips': ['003', '001', '003', '001', '003'],
+            'census_tract_fips': ['010100', '000200', '010200', '000200', '010100'],
+        }, index=[40, 10, 30, 10, 20])
+
+        result = collector.batch_collect_demographics(tracts, checkpoint_file=str(checkpoint))
+
+        assert result.index.tolist() == [40, 10, 30, 10, 20]
+        assert result['census_tract_fips'].tolist() == tracts['census_tract_fips'].tolist()
+        assert result['total_population'].tolist() == [1000, 1000, 7, 1000, 1000]
+        assert result['census_api_error'].tolist() == [False, False, True, False, False]
+
+    def test_county_without_tracts_is_cached_empty(self, tmp_path, monkeypatch, stub_server):
+        """A 204 from the real API for a county is cached as "no tracts", not retried per tract."""
+        server = stub_server(lambda url, params, timeout: TransportResponse(204))
+        monkeypatch.setenv('CENSUS_API_KEY', 'test-key-1234')
+        collector = ACSDataCollector(
+            cache_dir=str(tmp_path), requests_per_second=1000, session=CensusSession(RequestsTransport())
+        )
+        collector.base_url = f"{server.url}/acs"
+
+        assert collector.get_county_demographics('42', '005') == {}
+        assert collector.get_county_demographics('42', '005') == {}
+        assert len(server.hits) == 1
+
+    @pytest.mark.parametrize('failure', [
+        TransportResponse(200, []),
+        requests.exceptions.Timeout('county list timed out'),
+    ])
+    def test_warm_state_survives_bad_county_list(self, tmp_path, monkeypatch, failure):
+        """An empty county list or a timeout is logged and warms nothing."""
+        def transport(url, params, timeout):
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+
+        monkeypatch.setenv('CENSUS_API_KEY', 'test-key-1234')
+        collector = ACSDataCollector(cache_dir=str(tmp_path), transport=transport, requests_per_second=1000)
+        collector.client.backoff_base = 0.01
+
+        assert collector.warm_state('PA') == 0
+
+    def test_county_requests_get_the_bulk_timeout(self, collector):
+        """County and county-list requests may run up to bulk_timeout; single tracts keep request_timeout."""
+        assert collector.get_tract_demographics('42', '001', '000100')['success']
+        collector.warm_state('PA')
+
+        session = collector.client.session
+        assert collector.api.timeouts['county:*'] == session.bulk_timeout
+        assert collector.api.timeouts['tract:*'] == session.bulk_timeout
+        assert collector.api.timeouts['tract:000100'] == session.request_timeout < session.bulk_timeout
+
+    def test_rate_limit_delay_is_deprecated(self, collector, tmp_path):
+        """The old pacing keyword still works, warns, and does not slow the batch down."""
+        tracts = pd.DataFrame({
+            'census_state_fips': ['42'] * 3,
+            'census_county_fips': ['001'] * 3,
+            'census_tract_fips': ['000100', '000200', '000300'],
+        })
+
+        start = time.monotonic()
+        with pytest.warns(DeprecationWarning, match='rate_limit_delay'):
+            result = collector.batch_collect_demographics(
+                tracts, checkpoint_file=str(tmp_path / 'demographics.csv'), rate_limit_delay=1.0, bulk=False
+            )
+
+        assert time.monotonic() - start < 1.0
+        assert result['census_data_complete'].all()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asyncio census client layer.
+
+A local stub server replays recorded Census Geocoder / ACS responses, so
+the tests run offline.
+"""
+
+import asyncio
+import time
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.acs_data_collector import ACSDataCollector
+from src.feature_engineering.census_http import CensusSession, RateLimitedClient, RetryBudget, TransportResponse
+from src.feature_engineering.census_tract_identifier import CensusTractIdentifier
+
+
+def _geocoder_body(state, county, tract, name):
+    return {'result': {
+        'input': {'benchmark': {'benchmarkName': 'Public_AR_Current'}, 'vintage': {'vintageName': 'Current_Current'}},
+        'geographies': {'Census Tracts': [{
+            'STATE': state, 'COUNTY': county, 'TRACT': tract,
+            'GEOID': f'{state}{county}{tract}', 'BASENAME': name, 'NAME': f'Census Tract {name}'
+        }]}
+    }}
+
+
+_ACS_HEADER = list(ACSDataCollector.ACS_VARIABLES) + ['state', 'county', 'tract']
+
+# (path, query key) -> (status, body)
+RECORDED = {
+    ('/geocoder', '-80.191788,25.761681'): (200, _geocoder_body('12', '086', '006713', '67.13')),
+    ('/geocoder', '-75.165222,39.952583'): (200, _geocoder_body('42', '101', '000500', '5')),
+    ('/acs', 'tract:* state:42 county:101'): (200, [
+        _ACS_HEADER,
+        ['2874', '34.1', '81250', '60411', '2204', '700', '402', '95', '61', '42', '101', '000500'],
+        ['3310', '29.8', '-666666666', '31870', '2015', '311', '96', '12', '8', '42', '101', '000600'],
+    ]),
+    ('/acs', 'tract:006713 state:12+county:086'): (200, [
+        _ACS_HEADER,
+        ['4102', '38.7', '54102', '40233', '3120', '820', '390', '77', '30', '12', '086', '006713'],
+    ]),
+}
+
+
+def _replay(url, params, timeout):
+    """Transport serving RECORDED responses; '/down' (like anything unrecorded) answers 503."""
+    key = f"{params['x']},{params['y']}" if 'x' in params else f"{params.get('for')} {params.get('in')}"
+    status, body = RECORDED.get((url, key), (503, None))
+    return TransportResponse(status, body, retry_after=0 if status == 503 else None)
+
+
+class TestAsyncCensusClients:
+    """Test suite for the shared CensusSession and the clients' coroutine methods."""
+
+    @pytest.fixture(autouse=True)
+    def _server(self, stub_server):
+        """Start the replay server."""
+        self.server = stub_server(_replay)
+        self.base = self.server.url
+
+    def _clients(self, tmp_path, monkeypatch, session):
+        monkeypatch.setenv('CENSUS_API_KEY', 'test-key-1234')
+        identifier = CensusTractIdentifier(cache_dir=str(tmp_path), requests_per_second=1000, session=session)
+        identifier.geocoding_url = f"{self.base}/geocoder"
+        collector = ACSDataCollector(cache_dir=str(tmp_path), requests_per_second=1000, session=session)
+        collector.base_url = f"{self.base}/acs"
+        return identifier, collector
+
+    def test_clients_share_one_concurrency_limit(self, tmp_path, monkeypatch):
+        """Geocoder and ACS lookups awaited together never exceed the session's limit."""
+        self.server.latency = 0.1
+        identifier, collector = self._clients(tmp_path, monkeypatch, CensusSession(max_concurrency=2))
+
+        async def collect():
+            return await asyncio.gather(
+                identifier.aget_tract_from_coordinates(25.761681, -80.191788),
+                identifier.aget_tract_from_coordinates(39.952583, -75.165222),
+                collector.aget_county_demographics('42', '101'),
+                collector.aget_tract_demographics('12', '086', '006713'),
+            )
+
+        miami, philly, county, tract = asyncio.run(collect())
+
+        assert (miami['geoid'], philly['geoid']) == ('12086006713', '42101000500')
+        assert county['42101000500']['total_population'] == 2874
+        assert county['42101000600']['median_household_income'] is None
+        assert tract['data_complete'] and tract['median_age'] == 38.7
+        assert len(self.server.hits) == 4
+        assert self.server.max_in_flight == 2
+
+    def test_sync_wrappers_work_inside_running_loop(self, tmp_path, monkeypatch):
+        """Existing synchronous callers keep working, even from async code."""
+        identifier, collector = self._clients(tmp_path, monkeypatch, CensusSession())
+
+        async def caller():
+            return identifier.get_tract_from_coordinates(39.952583, -75.165222)
+
+        assert asyncio.run(caller())['geoid'] == '42101000500'
+        assert collector.get_county_demographics('42', '101').keys() == {'42101000500', '42101000600'}
+        assert identifier.get_tract_from_coordinates(39.952583, -75.165222)['geoid'] == '42101000500'
+        assert len(self.server.hits) == 2
+
+    def test_cancellation_abandons_lookup(self, tmp_path, monkeypatch):
+        """A cancelled lookup raises CancelledError promptly and caches nothing."""
+        self.server.latency = 1.0
+        identifier, _ = self._clients(tmp_path, monkeypatch, CensusSession())
+
+        async def cancel_soon():
+            task = asyncio.ensure_future(identifier.aget_tract_from_coordinates(25.761681, -80.191788))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            await task
+
+        start = time.monotonic()
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel_soon())
+
+        assert time.monotonic() - start < 0.8
+        assert len(identifier.cache) == 0
+
+    def test_retry_budget_is_shared_across_apis(self, tmp_path, monkeypatch):
+        """Once the session's budget is spent, neither API retries."""
+        session = CensusSession(retry_budget=RetryBudget(ratio=0.0, reserve=2))
+        identifier, collector = self._clients(tmp_path, monkeypatch, session)
+        identifier.geocoding_url = collector.base_url = f"{self.base}/down"
+
+        assert identifier.get_tract_from_coordinates(40.0, -80.0)['error'] == 'HTTP 503'
+        assert collector.get_county_demographics('42', '003') is None
+
+        # 2 first attempts + the 2 retries the budget allowed (max_retries=3 would give 6)
+        assert len(self.server.hits) == 4
+
+    def test_request_timeout_caps_every_call(self):
+        """Transport calls never wait longer than the session's request_timeout."""
+        timeouts = []
+
+        def transport(url, params, timeout):
+            timeouts.append(timeout)
+            return TransportResponse(200, [])
+
+        session = CensusSession(transport=transport, request_timeout=2.0)
+        client = RateLimitedClient(requests_per_second=1000, session=session)
+
+        asyncio.run(client.aget('/acs', {}))
+        asyncio.run(client.aget('/acs', {}, timeout=30))
+        asyncio.run(client.aget('/acs', {}, timeout=0.5))
+
+        assert timeouts == [2.0, 2.0, 0.5]
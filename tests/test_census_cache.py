@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SQLite-backed geocoding/ACS result cache.
+"""
+
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.census_cache import CensusCache
+from src.feature_engineering.census_tract_identifier import CensusTractIdentifier
+
+
+def _write_entries(args):
+    """Runs in a spawned process: write 200 entries to a shared cache."""
+    path, worker = args
+    cache = CensusCache(Path(path), 'geocode')
+    for i in range(200):
+        cache[f'{worker}:{i}'] = {'geoid': f'{i:011d}', 'success': True}
+    return len(cache)
+
+
+class TestCensusCache:
+    """Test suite for CensusCache."""
+
+    def test_round_trip_and_namespaces(self, tmp_path):
+        """Values round-trip as JSON; namespaces in one file are independent."""
+        geocode = CensusCache(tmp_path / 'cache.sqlite', 'geocode')
+        acs = CensusCache(tmp_path / 'cache.sqlite', 'acs')
+
+        geocode['25.761681,-80.191788'] = {'geoid': '12086006713', 'success': True}
+
+        assert geocode['25.761681,-80.191788'] == {'geoid': '12086006713', 'success': True}
+        assert '25.761681,-80.191788' not in acs
+        assert acs.get('25.761681,-80.191788') is None
+        assert len(geocode) == 1 and len(acs) == 0
+
+    def test_ttl_and_vintage_invalidate(self, tmp_path):
+        """Expired entries and entries from another vintage are misses."""
+        path = tmp_path / 'cache.sqlite'
+        CensusCache(path, 'acs', vintage='acs5-2022')['42101000500'] = {'success': True}
+        assert '42101000500' not in CensusCache(path, 'acs', vintage='acs5-2023')
+
+        cache = CensusCache(path, 'acs', vintage='acs5-2023', ttl=0.05)
+        cache['42101000500'] = {'success': True}
+        assert '42101000500' in cache
+        time.sleep(0.1)
+        assert cache.get('42101000500') is None
+        assert len(cache) == 0
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Beyond max_entries, the entries read longest ago are dropped first."""
+        cache = CensusCache(tmp_path / 'cache.sqlite', 'geocode', max_entries=3)
+        cache.TOUCH_INTERVAL = 0
+        for key in 'abc':
+            cache[key] = key
+            time.sleep(0.01)
+        cache.get('a')
+
+        cache['d'] = 'd'
+        cache.evict()
+
+        assert sorted(k for k in 'abcd' if k in cache) == ['a', 'c', 'd']
+
+    def test_concurrent_processes_share_one_file(self, tmp_path):
+        """Writers in separate processes do not lose or corrupt entries."""
+        path = tmp_path / 'cache.sqlite'
+        CensusCache(path, 'geocode')
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=3, mp_context=context) as pool:
+            list(pool.map(_write_entries, [(str(path), w) for w in range(3)]))
+
+        cache = CensusCache(path, 'geocode')
+        assert len(cache) == 600
+        assert cache['2:199'] == {'geoid': '00000000199', 'success': True}
+
+    def test_json_cache_migrated_once(self, tmp_path):
+        """An existing geocoding_cache.json is imported and renamed."""
+        legacy = {'25.761681,-80.191788': {'geoid': '12086006713', 'success': True}}
+        (tmp_path / 'geocoding_cache.json').write_text(json.dumps(legacy))
+
+        identifier = CensusTractIdentifier(cache_dir=str(tmp_path))
+
+        assert identifier.get_tract_from_coordinates(25.761681, -80.191788)['geoid'] == '12086006713'
+        assert not (tmp_path / 'geocoding_cache.json').exists()
+        assert (tmp_path / 'geocoding_cache.json.migrated').exists()
+        assert len(CensusTractIdentifier(cache_dir=str(tmp_path)).cache) == 1
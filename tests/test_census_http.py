@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for rate-limited concurrent geocoding against a local stand-in server.
+"""
+
+import threading
+import time
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.acs_data_collector import ACSDataCollector
+from src.feature_engineering.census_http import CensusSession, RequestsTransport, TokenBucket, TransportResponse
+from src.feature_engineering.census_tract_identifier import CensusTractIdentifier
+
+
+class _Throttling:
+    """
+    Wraps a geocoder transport: the first request for every fourth tract
+    gets a 429 and for every seventh a 503.
+    """
+
+    def __init__(self, geocoder):
+        self.geocoder = geocoder
+        self.lock = threading.Lock()
+        self.requests_seen = []
+        self.refused = set()
+
+    def __call__(self, url, params, timeout):
+        tract = self.geocoder.tract_of(float(params['x']))
+        with self.lock:
+            self.requests_seen.append(tract)
+            first = tract not in self.refused
+            self.refused.add(tract)
+
+        if first and tract % 4 == 0:
+            return TransportResponse(429, retry_after=0)
+        if first and tract % 7 == 0:
+            return TransportResponse(503)
+        return self.geocoder(url, params, timeout)
+
+
+class TestConcurrentGeocoding:
+    """Test suite for the token bucket and batch_identify_tracts(max_workers=...)."""
+
+    @pytest.fixture(autouse=True)
+    def _server(self, stub_server, geocoder_transport):
+        """Serve a throttling geocoder stand-in over HTTP."""
+        self.geocoder = _Throttling(geocoder_transport())
+        self.server = stub_server(self.geocoder)
+
+    def _identifier(self, tmp_path, requests_per_second):
+        identifier = CensusTractIdentifier(cache_dir=str(tmp_path / 'cache'), requests_per_second=requests_per_second)
+        identifier.geocoding_url = f"{self.server.url}/geocoder"
+        identifier.client.backoff_base = 0.01
+        return identifier
+
+    @staticmethod
+    def _sites(n):
+        return pd.DataFrame({'latitude': [40.0] * n, 'longitude': [-(80 + i / 100) for i in range(n)]})
+
+    def test_token_bucket_caps_rate(self):
+        """Acquisitions beyond the burst are spaced 1/rate apart."""
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.19
+
+    def test_results_stay_in_row_order_through_throttling(self, tmp_path):
+        """429/503 responses are retried and every row gets its own tract."""
+        identifier = self._identifier(tmp_path, requests_per_second=200)
+        result = identifier.batch_identify_tracts(
+            self._sites(40), checkpoint_file=str(tmp_path / 'tracts.csv'), max_workers=8
+        )
+
+        assert result['census_geoid'].tolist() == [f'42003{i:06d}' for i in range(40)]
+        assert not result['census_tract_error'].any()
+        assert identifier.client.throttled == 14
+        assert len(self.geocoder.requests_seen) == 54
+        assert len(identifier.cache) == 40
+
+    def test_concurrency_overlaps_latency(self, tmp_path):
+        """With slow responses, a pool of workers beats the serial path."""
+        self.server.latency = 0.05
+        sites = self._sites(17).iloc[1:].reset_index(drop=True)
+
+        serial = self._identifier(tmp_path / 'serial', requests_per_second=1000)
+        start = time.monotonic()
+        serial.batch_identify_tracts(sites, checkpoint_file=str(tmp_path / 'serial.csv'), max_workers=1)
+        serial_seconds = time.monotonic() - start
+
+        pooled = self._identifier(tmp_path / 'pooled', requests_per_second=1000)
+        start = time.monotonic()
+        result = pooled.batch_identify_tracts(sites, checkpoint_file=str(tmp_path / 'pooled.csv'), max_workers=8)
+        pooled_seconds = time.monotonic() - start
+
+        assert result['census_geoid'].tolist() == [f'42003{i:06d}' for i in range(1, 17)]
+        assert pooled_seconds < serial_seconds / 2
+
+
+class TestRequestsTransport:
+    """Test suite for the default requests-based transport."""
+
+    def test_no_content_is_cached_as_not_found(self, tmp_path, monkeypatch, stub_server):
+        """A 204 reaches the client as an empty response; the tract is cached and not requested again."""
+        server = stub_server(lambda url, params, timeout: TransportResponse(204))
+        monkeypatch.setenv('CENSUS_API_KEY', 'test-key-1234')
+        collector = ACSDataCollector(
+            cache_dir=str(tmp_path), requests_per_second=1000, session=CensusSession(RequestsTransport())
+        )
+        collector.base_url = f"{server.url}/acs"
+
+        assert RequestsTransport()(f"{server.url}/acs", {}, 5) == TransportResponse(204)
+
+        result = collector.get_tract_demographics('42', '003', '999999')
+        assert result['error'] == 'Tract not found in ACS'
+        assert collector.get_tract_demographics('42', '003', '999999') == result
+        assert len(server.hits) == 2  # the direct transport call and the first lookup
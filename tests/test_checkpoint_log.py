@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Unit tests for append-only checkpoints of the census batch jobs.
+"""
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.census_tract_identifier import CensusTractIdentifier
+from src.feature_engineering.checkpoint_log import CheckpointLog
+
+
+class TestCheckpointLog:
+    """Test suite for CheckpointLog and resumable batch_identify_tracts()."""
+
+    def test_torn_line_dropped_and_later_records_win(self, tmp_path):
+        """A partial last line is trimmed; the latest record per key is kept."""
+        path = tmp_path / 'job.log.jsonl'
+        with CheckpointLog(path) as log:
+            log.append('a', {'v': 1})
+            log.append('b', {'v': 2})
+            log.append('a', {'v': 3})
+        with open(path, 'a') as f:
+            f.write('{"key": "c", "rec')
+
+        log = CheckpointLog(path)
+        assert dict(log.items()) == {'a': {'v': 3}, 'b': {'v': 2}}
+
+        log.append('c', {'v': 4})
+        log.close()
+        assert CheckpointLog(path).get('c') == {'v': 4}
+
+    def test_interrupted_batch_resumes_and_compacts(self, tmp_path, geocoder_transport):
+        """A rerun geocodes only the rows the crashed run did not log, then writes the CSV."""
+        sites = pd.DataFrame({'latitude': [40.0] * 30, 'longitude': [-(80 + i / 100) for i in range(30)]})
+        output = tmp_path / 'tracts_identified.csv'
+
+        crashing = geocoder_transport(fail_after=12)
+        identifier = CensusTractIdentifier(cache_dir=str(tmp_path / 'a'), transport=crashing, requests_per_second=1000)
+        with pytest.raises(KeyboardInterrupt):
+            identifier.batch_identify_tracts(sites, checkpoint_file=str(output), max_workers=1)
+
+        assert not output.exists()
+        assert len(CheckpointLog(tmp_path / 'tracts_identified.log.jsonl')) == 12
+
+        # Fresh API cache: only the log can account for the skipped rows
+        geocoder = geocoder_transport()
+        identifier = CensusTractIdentifier(cache_dir=str(tmp_path / 'b'), transport=geocoder, requests_per_second=1000)
+        result = identifier.batch_identify_tracts(sites, checkpoint_file=str(output), max_workers=4)
+
+        assert geocoder.calls == 18
+        assert result['census_geoid'].tolist() == [f'42003{i:06d}' for i in range(30)]
+        assert pd.read_csv(output, dtype={'census_geoid': str})['census_geoid'].tolist() == result['census_geoid'].tolist()
+        assert not (tmp_path / 'tracts_identified.log.jsonl').exists()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the compact census/dispensary column layout.
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.compact_dtypes import compact_frame
+from src.feature_engineering.loader_snapshot import save_snapshot, load_snapshot
+from src.feature_engineering.tract_table import TractTable
+
+
+def _census():
+    return pd.DataFrame({
+        'census_geoid': ['01001020100', '01001020200', '01001020300', '01001020400'],
+        'census_county_fips': np.array([1, 1, 1, 1], dtype=np.int64),
+        'total_population': [1200.0, 800.0, 3100.0, 950.0],
+        'median_age': [40.3, 35.1, 51.0, 29.9],
+        'latitude': [32.4771, 32.4720, 32.4757, 32.4708],
+        'longitude': [-86.4903, -86.4736, -86.4483, -86.4319],
+        'census_data_complete': [True, True, False, True],
+        'census_api_error': np.array([False, np.nan, False, False], dtype=object),
+        'state': ['AL'] * 4,
+    })
+
+
+class TestCompactDtypes:
+    """Test suite for compact_frame() and int64 GEOID keys."""
+
+    def test_column_dtypes(self):
+        """Each column gets the smallest safe dtype; coordinates stay float64."""
+        compact = compact_frame(_census())
+
+        assert compact['census_geoid'].dtype == np.int64
+        assert compact['census_geoid'][0] == 1001020100
+        assert compact['census_county_fips'].dtype == np.int32
+        assert compact['total_population'].dtype == np.float32
+        assert compact['latitude'].dtype == np.float64
+        assert compact['census_data_complete'].dtype == bool
+        assert isinstance(compact['census_api_error'].dtype, pd.CategoricalDtype)
+        assert isinstance(compact['state'].dtype, pd.CategoricalDtype)
+        np.testing.assert_allclose(compact['median_age'], _census()['median_age'], rtol=1e-6)
+
+    def test_tract_table_accepts_string_and_int_geoids(self):
+        """Lookups and appends work against int64 GEOID keys."""
+        table = TractTable(compact_frame(_census()))
+
+        assert table.get('01001020200')['total_population'] == 800
+        assert table.get(1001020200) is not None
+
+        table.append({'census_geoid': '01001020500', 'total_population': 10.0, 'state': 'AL'})
+        assert '01001020500' in table
+        table.merge()
+        assert table.frame['census_geoid'].dtype == np.int64
+        assert table.get('01001020500')['total_population'] == 10
+
+    def test_snapshot_round_trip(self, tmp_path):
+        """Compact frames survive the startup snapshot unchanged."""
+        compact = compact_frame(_census())
+        save_snapshot(tmp_path / 'snapshot.npz', 'k', {'census': compact})
+
+        pd.testing.assert_frame_equal(load_snapshot(tmp_path / 'snapshot.npz', 'k')['census'], compact)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CoordinateFeatureCalculator.calculate_all_features() execution modes.
+
+Uses the synthetic loader from conftest.py and a stand-in tract lookup (no
+network) that can fetch a "missing" tract into the database, like the real
+ACS path.
+"""
+
+import asyncio
+import time
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.coordinate_calculator import CoordinateFeatureCalculator
+from src.feature_engineering.offline_tract_resolver import OfflineTractResolver
+
+
+SITE = (28.5, -81.2)
+
+
+class _StubCalculator(CoordinateFeatureCalculator):
+    """Calculator whose tract lookup sleeps and optionally fetches a new tract."""
+
+    def __init__(self, data_loader, cache_dir, fetch_missing=False, tract_resolver=None):
+        super().__init__(
+            data_loader=data_loader,
+            tract_resolver=tract_resolver or OfflineTractResolver(cache_dir=str(cache_dir), allow_download=False),
+            cache_dir=str(cache_dir)
+        )
+        self.fetch_missing = fetch_missing
+        self.lookups = 0
+
+    def match_census_tract(self, state, latitude, longitude, verbose=True):
+        self.lookups += 1
+        self.verbose = verbose
+        time.sleep(0.05)  # Simulated geocoding + ACS latency
+        geoid = '12095999999'
+        if self.fetch_missing:
+            self.data_loader.append_tract(state, {
+                'census_geoid': geoid, 'latitude': latitude + 0.001,
+                'longitude': longitude, 'total_population': 100000
+            })
+        demographics = {name: 1.0 for name in self.DEMOGRAPHIC_FEATURES}
+        demographics['census_geoid'] = geoid
+        return demographics
+
+
+class _InsideResolver:
+    """Offline resolver stand-in: a site is inside its tract within 0.01 deg longitude."""
+
+    def contains(self, geoid, latitude, longitude, state):
+        return abs(longitude - SITE[1]) < 0.01
+
+
+@pytest.fixture
+def stub_calculator(synthetic_loader, tmp_path):
+    """Factory for stub calculators, each over its own synthetic loader."""
+    return lambda **kwargs: _StubCalculator(synthetic_loader(), tmp_path, **kwargs)
+
+
+class TestCalculateAllFeatures:
+    """Test suite for sequential, concurrent and async feature calculation."""
+
+    def test_concurrent_matches_sequential(self, stub_calculator):
+        """Overlapping the stages does not change any feature."""
+        sequential = stub_calculator().calculate_all_features('FL', *SITE, concurrent=False)
+        concurrent = stub_calculator().calculate_all_features('FL', *SITE)
+
+        assert concurrent == sequential
+        assert list(concurrent) == list(sequential)
+
+    def test_tract_lookup_progress_is_shown(self, stub_calculator):
+        """Both modes keep the tract lookup's progress output."""
+        for concurrent in (False, True):
+            calculator = stub_calculator()
+            calculator.calculate_all_features('FL', *SITE, concurrent=concurrent)
+            assert calculator.verbose is True
+
+    def test_fetched_tract_is_counted(self, stub_calculator):
+        """A tract fetched by the network stage is included in populations."""
+        baseline = stub_calculator().calculate_all_features('FL', *SITE)
+        sequential = stub_calculator(fetch_missing=True).calculate_all_features('FL', *SITE, concurrent=False)
+        concurrent = stub_calculator(fetch_missing=True).calculate_all_features('FL', *SITE)
+
+        assert concurrent == sequential
+        assert concurrent['pop_1mi'] == baseline['pop_1mi'] + 100000
+
+    def test_async_matches_sync(self, stub_calculator):
+        """calculate_all_features_async() returns the same features."""
+        expected = stub_calculator(fetch_missing=True).calculate_all_features('FL', *SITE)
+        result = asyncio.run(stub_calculator(fetch_missing=True).calculate_all_features_async('FL', *SITE))
+
+        assert result == expected
+
+
+class TestRecalculateMovedSite:
+    """Test suite for incremental what-if recalculation."""
+
+    def test_nudges_match_full_recalculation(self, stub_calculator):
+        """Chained nudges (incremental and past the rebuild threshold) equal full runs."""
+        calculator = stub_calculator()
+        reference = stub_calculator()
+        features = calculator.calculate_all_features('FL', *SITE)
+
+        rng = np.random.default_rng(3)
+        for step in list(rng.uniform(-0.004, 0.004, (8, 2))) + [(0.02, -0.01)]:
+            latitude = features['latitude'] + step[0]
+            longitude = features['longitude'] + step[1]
+            features = calculator.recalculate_moved_site(features, latitude, longitude)
+            expected = reference.calculate_all_features('FL', latitude, longitude, concurrent=False)
+            assert features == expected
+
+    def test_tract_match_reused_inside_same_tract(self, stub_calculator):
+        """The tract lookup is skipped while the site stays inside its tract."""
+        calculator = stub_calculator(tract_resolver=_InsideResolver())
+        features = calculator.calculate_all_features('FL', *SITE)
+
+        calculator.recalculate_moved_site(features, SITE[0] + 0.001, SITE[1] + 0.001)
+        assert calculator.lookups == 1
+
+        calculator.recalculate_moved_site(features, SITE[0], SITE[1] + 0.05)
+        assert calculator.lookups == 2
+
+
+class TestCalculateFeaturesBatch:
+    """Test suite for per-row error reporting in calculate_features_batch()."""
+
+    def test_row_failures_do_not_abort_batch(self, stub_calculator):
+        """Invalid sites and unexpected lookup errors land in their row's error column."""
+        calculator = stub_calculator()
+        match = calculator.match_census_tract
+
+        def flaky_match(state, latitude, longitude, verbose=True):
+            if latitude > 28.55:
+                raise KeyError('median_age')
+            return match(state, latitude, longitude, verbose)
+
+        calculator.match_census_tract = flaky_match
+        sites = pd.DataFrame({
+            'state': ['FL', 'FL', 'fl ', 'CA', 'FL'],
+            'latitude': [28.5, 28.6, 28.45, 36.0, np.nan],
+            'longitude': [-81.2, -81.2, -81.2, -119.0, -81.2]
+        })
+
+        result = calculator.calculate_features_batch(sites, refine=False)
+
+        assert result['error'].tolist()[:3] == [None, "KeyError: 'median_age'", None]
+        assert "'CA' is not supported" in result['error'][3]
+        assert result['error'][4].startswith('Invalid latitude: nan')
+        assert result['sq_ft'].tolist()[:3] == [3500, 3500, 3500]
+        assert result['pop_5mi'].isna().tolist() == [False, True, False, True, True]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorized distance kernel.
+
+Verifies that vectorized distances agree with per-point geodesic distances
+and that radius membership is exact after boundary refinement.
+"""
+
+import numpy as np
+import sys
+from pathlib import Path
+from geopy.distance import geodesic
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.distance_kernel import (
+    haversine_miles,
+    boundary_mask,
+    site_distances_miles,
+    HAVERSINE_MAX_RELATIVE_ERROR
+)
+
+
+# Insa Orlando (known location from training data)
+SITE_LAT, SITE_LON = 28.5685, -81.2163
+
+
+def _random_points(n=500, spread=0.5, seed=7):
+    rng = np.random.default_rng(seed)
+    lats = SITE_LAT + rng.uniform(-spread, spread, n)
+    lons = SITE_LON + rng.uniform(-spread, spread, n)
+    return lats, lons
+
+
+def _geodesic_miles(lats, lons):
+    return np.array([
+        geodesic((SITE_LAT, SITE_LON), (lat, lon)).miles
+        for lat, lon in zip(lats, lons)
+    ])
+
+
+class TestHaversine:
+    """Test suite for the spherical distance approximation."""
+
+    def test_within_error_bound_of_geodesic(self):
+        """Haversine distances stay inside the documented error band."""
+        lats, lons = _random_points()
+        approx = haversine_miles(SITE_LAT, SITE_LON, lats, lons)
+        exact = _geodesic_miles(lats, lons)
+
+        relative_error = np.abs(approx - exact) / exact
+        assert relative_error.max() <= HAVERSINE_MAX_RELATIVE_ERROR
+
+    def test_zero_distance_to_self(self):
+        """A point is zero miles from itself."""
+        dist = haversine_miles(SITE_LAT, SITE_LON, np.array([SITE_LAT]), np.array([SITE_LON]))
+        assert dist[0] == 0.0
+
+    def test_empty_input(self):
+        """Empty target arrays return an empty result."""
+        dist = site_distances_miles(SITE_LAT, SITE_LON, np.array([]), np.array([]), radii=[1, 3])
+        assert len(dist) == 0
+
+
+class TestBoundaryRefinement:
+    """Test suite for exact refinement near radius boundaries."""
+
+    RADII = [1, 3, 5, 10, 20]
+
+    def test_radius_membership_matches_geodesic(self):
+        """Counts within every radius equal the per-point geodesic counts."""
+        lats, lons = _random_points(n=2000, spread=0.35)
+        refined = site_distances_miles(SITE_LAT, SITE_LON, lats, lons, radii=self.RADII)
+        exact = _geodesic_miles(lats, lons)
+
+        for radius in self.RADII:
+            assert (refined <= radius).sum() == (exact <= radius).sum()
+
+    def test_only_boundary_points_refined(self):
+        """Points far from any boundary keep their haversine distance."""
+        lats, lons = _random_points()
+        approx = haversine_miles(SITE_LAT, SITE_LON, lats, lons)
+        refined = site_distances_miles(SITE_LAT, SITE_LON, lats, lons, radii=self.RADII)
+
+        untouched = ~boundary_mask(approx, self.RADII)
+        assert np.array_equal(refined[untouched], approx[untouched])
+
+    def test_refine_within_is_exact(self):
+        """refine_within returns geodesic distances for every point inside it."""
+        lats, lons = _random_points(n=200, spread=0.2)
+        refined = site_distances_miles(SITE_LAT, SITE_LON, lats, lons, refine_within=20)
+        exact = _geodesic_miles(lats, lons)
+
+        inside = exact <= 20
+        assert np.allclose(refined[inside], exact[inside], rtol=0, atol=1e-9)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared Census Gazetteer tract index.
+
+Uses a small Gazetteer-format file (tab-separated, trailing header spaces).
+"""
+
+import os
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.gazetteer_index import (
+    GazetteerIndex, get_gazetteer_index, clear_gazetteer_indexes
+)
+
+
+GAZETTEER_ROWS = [
+    ('12095016700', 4561619, 28.5502, -81.3498),
+    ('12011010100', 1250000, 26.1224, -80.1373),
+    ('12086006713', 903000, 25.7617, -80.1918),
+]
+
+
+def _write_gazetteer(project_root, rows=GAZETTEER_ROWS):
+    path = project_root / 'data' / 'census' / 'gazeteer' / '2020_Gaz_tracts_12.txt'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ['USPS\tGEOID\tALAND\tAWATER\tALAND_SQMI\tAWATER_SQMI\tINTPTLAT\tINTPTLONG                                                                                                               ']
+    for geoid, aland, lat, lon in rows:
+        lines.append(f'FL\t{geoid}\t{aland}\t0\t0\t0\t{lat}\t{lon}')
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+class TestGazetteerIndex:
+    """Test suite for Gazetteer GEOID lookups and persistence."""
+
+    def setup_method(self):
+        clear_gazetteer_indexes()
+
+    def test_lookup(self, tmp_path):
+        """Single and bulk lookups return the file's values, None/NaN when absent."""
+        index = GazetteerIndex.from_text(_write_gazetteer(tmp_path))
+
+        assert index.lookup('12011010100') == {
+            'latitude': 26.1224, 'longitude': -80.1373, 'area_sqm': 1250000.0
+        }
+        assert index.lookup('12011010199') is None
+        assert index.lookup('not-a-geoid') is None
+
+        lats, lons, areas = index.lookup_many(['12086006713', '99999999999', '12095016700'])
+        assert np.allclose(lats[[0, 2]], [25.7617, 28.5502])
+        assert np.isnan(lats[1]) and np.isnan(areas[1])
+
+    def test_shared_index_is_persisted_and_refreshed(self, tmp_path):
+        """The binary cache is reused, and rebuilt when the source file changes."""
+        source = _write_gazetteer(tmp_path)
+        index = get_gazetteer_index(tmp_path, 'FL')
+
+        assert get_gazetteer_index(tmp_path, 'fl') is index
+        cache_files = list((tmp_path / 'data' / 'census' / 'cache').glob('*.npz'))
+        assert len(cache_files) == 1
+
+        # A fresh process reads the cache, not the text file (same-size edit, same mtime)
+        clear_gazetteer_indexes()
+        stat = source.stat()
+        source.write_text(source.read_text().replace('28.5502', '99.9999'))
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert get_gazetteer_index(tmp_path, 'FL').lookup('12095016700')['latitude'] == 28.5502
+
+        # Changed source (new mtime) invalidates the cache
+        clear_gazetteer_indexes()
+        _write_gazetteer(tmp_path, GAZETTEER_ROWS[:1])
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert len(get_gazetteer_index(tmp_path, 'FL')) == 1
+
+    def test_missing_file(self, tmp_path):
+        """Missing Gazetteer files and unsupported states return None."""
+        assert get_gazetteer_index(tmp_path, 'FL') is None
+        assert get_gazetteer_index(tmp_path, 'CA') is None
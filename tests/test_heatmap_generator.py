@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for statewide heatmap generation.
+
+Runs the generator on a small synthetic state with a stand-in predictor and
+checks the grid against single-site feature calculation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.prediction.feature_validator import FeatureValidator
+from src.prediction.heatmap_generator import HeatmapGenerator, load_heatmap
+from src.feature_engineering.coordinate_calculator import CoordinateFeatureCalculator
+from src.feature_engineering.offline_tract_resolver import OfflineTractResolver
+
+
+BOUNDS = {'lat_min': 28.3, 'lat_max': 28.7, 'lon_min': -81.4, 'lon_max': -81.0}
+
+
+class _StubPredictor:
+    """Deterministic stand-in for a v3 state model."""
+
+    model_version = 'v3'
+    radii = [1, 3, 5, 10, 20]
+
+    def predict_batch(self, features_df):
+        result = features_df.copy()
+        result['predicted_visits'] = features_df['pop_5mi'] / 10 + features_df['competition_weighted_20mi']
+        return result
+
+
+class TestHeatmapGenerator:
+    """Test suite for lattice heatmap generation."""
+
+    @pytest.fixture(autouse=True)
+    def _generator(self, synthetic_loader, tmp_path):
+        """Create a generator over the synthetic state."""
+        loader = synthetic_loader(seed=5, n_tracts=300, n_dispensaries=30)
+        calculator = CoordinateFeatureCalculator(
+            loader, tract_resolver=OfflineTractResolver(cache_dir=str(tmp_path), allow_download=False),
+            cache_dir=str(tmp_path)
+        )
+        self.calculator = calculator
+        self.generator = HeatmapGenerator(
+            data_loader=loader, calculator=calculator,
+            validator=FeatureValidator(ranges_path='missing.json'),
+            predictors={'FL': _StubPredictor()}
+        )
+
+    def test_grid_matches_single_site_features(self, tmp_path):
+        """Grid cells equal predictions from per-site batch features."""
+        self.generator.generate(
+            'FL', str(tmp_path / 'fl'), spacing_miles=1.0, bounds=BOUNDS, tile_cells=7, max_workers=2
+        )
+        grid, metadata = load_heatmap(str(tmp_path / 'fl'))
+
+        assert list(grid.shape) == metadata['shape']
+        assert metadata['valid_cells'] > 0
+
+        west, lon_step, _, north, _, neg_lat_step = metadata['geotransform']
+        for row, col in [(3, 4), (12, 9), (20, 15)]:
+            if grid[row, col] == HeatmapGenerator.NODATA:
+                continue
+            site = pd.DataFrame({
+                'state': ['FL'],
+                'latitude': [north + (row + 0.5) * neg_lat_step],
+                'longitude': [west + (col + 0.5) * lon_step]
+            })
+            features = self.calculator.calculate_features_batch(
+                site, include_demographics=False, refine=False
+            )
+            expected = features['pop_5mi'][0] / 10 + features['competition_weighted_20mi'][0]
+            assert np.isclose(grid[row, col], expected, rtol=1e-6)
+
+    def test_frame_features_match_dict_features(self):
+        """prepare_features_frame() agrees with the per-site dict path."""
+        validator = self.generator.validator
+        base = {f: 0.0 for f in validator.REQUIRED_BASE_FEATURES}
+        base.update({'pop_3mi': 20000, 'pop_5mi': 50000, 'competitors_5mi': 4,
+                     'total_pop_25_plus': 1200, 'bachelors_degree': 300,
+                     'median_age': 40, 'median_household_income': 65000,
+                     'population_density': 800, 'competition_weighted_20mi': 3.5})
+
+        expected = validator._generate_all_derived_features(base, 'PA')
+        frame = validator.prepare_features_frame(pd.DataFrame([base]), 'PA')
+
+        assert list(frame.columns) == validator.ALL_FEATURES
+        for feature in validator.ALL_FEATURES:
+            assert np.isclose(frame[feature].iloc[0], expected[feature]), feature
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for hot-reloading changed source files into a running loader.
+"""
+
+import os
+import time
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.data_loader import MultiStateDataLoader
+from src.feature_engineering.gazetteer_index import gazetteer_path, get_gazetteer_index
+from tests.test_lazy_loading import _write_pa_sources
+
+
+def _training_file(root: Path) -> Path:
+    return root / 'data' / 'processed' / 'combined_with_competitive_features_corrected.csv'
+
+
+def _add_dispensary(root: Path) -> None:
+    training = pd.read_csv(_training_file(root))
+    row = training.iloc[[0]].assign(latitude=40.41, longitude=-80.01, has_placer_data=True)
+    pd.concat([training, row]).to_csv(_training_file(root), index=False)
+
+
+def _centroid_cache(root: Path) -> Path:
+    return root / 'data' / 'census' / 'cache' / 'tract_centroids.csv'
+
+
+def _write_gazetteer(root: Path, state: str, centroids: pd.DataFrame) -> Path:
+    path = gazetteer_path(root, state)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({
+        'GEOID': centroids['census_geoid'], 'ALAND': 1e6,
+        'INTPTLAT': centroids['latitude'], 'INTPTLONG': centroids['longitude']
+    }).to_csv(path, sep='\t', index=False)
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestHotReload:
+    """Test suite for check_for_updates(), reload() and the watcher thread."""
+
+    def _loader(self, root: Path) -> MultiStateDataLoader:
+        _write_pa_sources(root)
+        loader = MultiStateDataLoader(lazy=True, use_snapshot=False, project_root=root)
+        loader.get_state_data('PA')
+        return loader
+
+    def test_changed_roster_swaps_state(self, tmp_path):
+        """A new dispensary is swapped in; callers holding old frames keep them."""
+        loader = self._loader(tmp_path)
+        old_dispensaries, old_census, _, _ = loader.get_state_view('PA')
+        old_table = loader.get_tract_table('PA')
+
+        _add_dispensary(tmp_path)
+        _bump_mtime(_training_file(tmp_path))
+
+        assert loader.check_for_updates(verbose=False) == ['PA']
+        dispensaries, census, dispensary_index, tract_index = loader.get_state_view('PA')
+
+        assert len(old_dispensaries) == 15 and len(dispensaries) == 16
+        assert len(dispensary_index) == 16 and len(tract_index) == len(census)
+        assert census.equals(old_census)
+        assert loader.get_tract_table('PA').uid != old_table.uid
+        assert loader.loaded_states == ['PA']
+
+    def test_touched_file_without_changes_is_not_reloaded(self, tmp_path):
+        """Only content changes trigger a swap."""
+        loader = self._loader(tmp_path)
+        table = loader.get_tract_table('PA')
+
+        census_file = tmp_path / 'data' / 'census' / 'intermediate' / 'all_tracts_demographics.csv'
+        _bump_mtime(census_file)
+        assert loader.check_for_updates(verbose=False) == []
+
+        _bump_mtime(census_file)
+        assert loader.check_for_updates(verbose=False) == []
+        assert loader.get_tract_table('PA') is table
+
+    def test_watcher_reloads_in_background(self, tmp_path):
+        """start_watching() picks up a change without an explicit call."""
+        loader = self._loader(tmp_path)
+        loader.start_watching(interval=0.05)
+        try:
+            _add_dispensary(tmp_path)
+            _bump_mtime(_training_file(tmp_path))
+
+            deadline = time.monotonic() + 5
+            while len(loader.get_state_data('PA')[0]) != 16 and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            loader.stop_watching()
+
+        assert len(loader.pa_dispensaries) == 16
+
+    def test_changed_gazetteer_refreshes_centroids(self, tmp_path):
+        """An edited Gazetteer row reaches the tract table, the shared index and the centroid cache."""
+        _write_pa_sources(tmp_path)
+        centroids = pd.read_csv(_centroid_cache(tmp_path), dtype={'census_geoid': str})
+        _write_gazetteer(tmp_path, 'FL', centroids.iloc[:0])
+        gazetteer = _write_gazetteer(tmp_path, 'PA', centroids)
+
+        loader = MultiStateDataLoader(lazy=True, use_snapshot=False, project_root=tmp_path)
+        geoid = str(loader.get_state_data('PA')[1]['census_geoid'].iloc[0])
+        assert get_gazetteer_index(tmp_path, 'PA').lookup(geoid) is not None
+
+        moved = centroids.assign(latitude=centroids['latitude'].where(centroids['census_geoid'] != geoid, 40.05))
+        _write_gazetteer(tmp_path, 'PA', moved)
+        _bump_mtime(gazetteer)
+
+        assert loader.check_for_updates(verbose=False) == ['PA']
+        assert abs(loader.find_tract('PA', geoid)['latitude'] - 40.05) < 1e-5
+        assert get_gazetteer_index(tmp_path, 'PA').lookup(geoid)['latitude'] == 40.05
+
+        cached = pd.read_csv(_centroid_cache(tmp_path), dtype={'census_geoid': str}).set_index('census_geoid')
+        assert cached.loc[geoid, 'latitude'] == 40.05
+        assert loader.check_for_updates(verbose=False) == []
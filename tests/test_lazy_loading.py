@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for lazy per-state loading in MultiStateDataLoader.
+
+Builds a small PA-only data directory, so loading Florida would fail: every
+test here passes only if untouched states are never read.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.data_loader import MultiStateDataLoader
+
+
+def _write_pa_sources(root: Path, n_tracts: int = 600) -> None:
+    rng = np.random.default_rng(3)
+    geoids = [f'42003{i:06d}' for i in range(n_tracts)]
+
+    processed = root / 'data' / 'processed'
+    processed.mkdir(parents=True)
+    pd.DataFrame({
+        'state': 'PA',
+        'latitude': 40.4 + rng.uniform(-0.2, 0.2, 20),
+        'longitude': -80.0 + rng.uniform(-0.2, 0.2, 20),
+        'has_placer_data': [True] * 15 + [False] * 5,
+        'regulator_name': [f'Store {i}' for i in range(20)],
+        'placer_name': [f'Store {i}' for i in range(20)],
+        'visits': rng.uniform(1000, 90000, 20),
+    }).to_csv(processed / 'combined_with_competitive_features_corrected.csv', index=False)
+
+    intermediate = root / 'data' / 'census' / 'intermediate'
+    intermediate.mkdir(parents=True)
+    pd.DataFrame({
+        'census_geoid': geoids,
+        'census_state_fips': 42,
+        'total_population': rng.integers(0, 8000, n_tracts),
+        'tract_area_sqm': rng.uniform(1e6, 5e7, n_tracts),
+    }).to_csv(intermediate / 'all_tracts_demographics.csv', index=False)
+
+    cache = root / 'data' / 'census' / 'cache'
+    cache.mkdir(parents=True)
+    pd.DataFrame({
+        'census_geoid': geoids,
+        'latitude': 40.4 + rng.uniform(-0.3, 0.3, n_tracts),
+        'longitude': -80.0 + rng.uniform(-0.3, 0.3, n_tracts),
+    }).to_csv(cache / 'tract_centroids.csv', index=False)
+
+
+class TestLazyLoading:
+    """Test suite for on-demand state and training data loading."""
+
+    def _loader(self, root: Path, use_snapshot: bool = False) -> MultiStateDataLoader:
+        return MultiStateDataLoader(lazy=True, use_snapshot=use_snapshot, project_root=root)
+
+    def test_only_requested_state_is_loaded(self, tmp_path):
+        """get_state_data() loads one state; training data stays unloaded."""
+        _write_pa_sources(tmp_path)
+        loader = self._loader(tmp_path)
+        assert loader.loaded_states == []
+
+        dispensaries, census = loader.get_state_data('PA')
+
+        assert len(dispensaries) == 15
+        assert (census['total_population'] > 0).all()
+        assert census['latitude'].notna().all()
+        assert loader.loaded_states == ['PA']
+        assert loader.__dict__['_training_data'] is None
+        assert list(loader.memory_report().index) == ['pa_dispensaries', 'pa_census', 'total']
+
+        dispensary_index, tract_index = loader.get_state_indexes('PA')
+        assert len(dispensary_index) == 15 and len(tract_index) == len(census)
+
+    def test_training_data_loads_on_access(self, tmp_path):
+        """training_data is read in full on first access."""
+        _write_pa_sources(tmp_path)
+        loader = self._loader(tmp_path)
+
+        assert len(loader.training_data) == 20
+        assert 'visits' in loader.training_data.columns
+        assert loader.loaded_states == []
+
+    def test_short_coverage_only_fails_its_state(self, tmp_path):
+        """A state with too few tracts fails on use and stays unloaded."""
+        _write_pa_sources(tmp_path, n_tracts=100)
+        loader = self._loader(tmp_path)
+
+        with pytest.raises(ValueError, match='Pennsylvania census tract coverage'):
+            loader.get_state_data('PA')
+        assert loader.loaded_states == []
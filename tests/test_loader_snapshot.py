@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the loader's binary startup snapshot.
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.data_loader import MultiStateDataLoader
+from src.feature_engineering.loader_snapshot import source_digest, save_snapshot, load_snapshot
+
+
+def _frame():
+    return pd.DataFrame({
+        'census_geoid': ['12095000100', '12095000200', None],
+        'total_population': [1200.0, np.nan, 3400.0],
+        'count': np.array([1, 2, 3], dtype=np.int64),
+        'flag': [True, False, True],
+        'has_placer_data': [True, np.nan, False],
+    }, index=[4, 9, 17])
+
+
+def _tables():
+    frame = _frame()
+    return {name: frame for name in MultiStateDataLoader.SNAPSHOT_TABLES}
+
+
+class TestLoaderSnapshot:
+    """Test suite for snapshot round-trips and invalidation."""
+
+    def test_round_trip_preserves_values_dtypes_and_index(self, tmp_path):
+        """Tables read back equal the tables written."""
+        path = tmp_path / 'snapshot.npz'
+        save_snapshot(path, 'abc', {'t': _frame()})
+
+        loaded = load_snapshot(path, 'abc')['t']
+        pd.testing.assert_frame_equal(loaded, _frame())
+
+    def test_stale_digest_is_ignored(self, tmp_path):
+        """A snapshot built from other sources is not used."""
+        path = tmp_path / 'snapshot.npz'
+        save_snapshot(path, 'abc', {'t': _frame()})
+
+        assert load_snapshot(path, 'def') is None
+        assert load_snapshot(tmp_path / 'missing.npz', 'abc') is None
+
+    def test_digest_tracks_file_contents(self, tmp_path):
+        """Changing a source file's bytes changes the digest."""
+        source = tmp_path / 'tracts.csv'
+        source.write_text('a,b\n1,2\n')
+        before = source_digest([source, tmp_path / 'absent.csv'])
+
+        source.write_text('a,b\n1,3\n')
+        assert source_digest([source, tmp_path / 'absent.csv']) != before
+
+    def test_loader_rebuilds_after_source_change(self, tmp_path):
+        """The loader uses its snapshot until a source file changes."""
+        writer = MultiStateDataLoader(lazy=True, project_root=tmp_path)
+        for source in writer.snapshot_sources()[:2]:
+            source.parent.mkdir(parents=True, exist_ok=True)
+            source.write_text('x\n1\n')
+        for name, frame in _tables().items():
+            setattr(writer, name, frame)
+        writer.save_snapshot()
+
+        reader = MultiStateDataLoader(lazy=True, project_root=tmp_path)
+        assert reader.load_snapshot()
+        pd.testing.assert_frame_equal(reader.fl_dispensaries, _frame())
+        assert list(reader.pa_census['census_geoid'][:2]) == ['12095000100', '12095000200']
+
+        writer.snapshot_sources()[0].write_text('x\n2\n')
+        assert not reader.load_snapshot()
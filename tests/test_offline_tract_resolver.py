@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for offline point-in-polygon census tract identification.
+
+Uses a synthetic 3x3 grid of square "tracts" instead of TIGER downloads.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+shapely = pytest.importorskip('shapely')
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.offline_tract_resolver import OfflineTractResolver
+
+
+def _grid_tracts(west=-81.5, south=28.3, size=0.1):
+    geoids, geometries = [], []
+    for row in range(3):
+        for col in range(3):
+            geoids.append(f'12095{row}{col}0000')
+            geometries.append(shapely.box(
+                west + col * size, south + row * size,
+                west + (col + 1) * size, south + (row + 1) * size
+            ))
+    return geoids, geometries
+
+
+class TestOfflineTractResolver:
+    """Test suite for offline tract resolution."""
+
+    def setup_method(self):
+        """Create a resolver that never downloads."""
+        self.resolver = OfflineTractResolver(allow_download=False)
+
+    def test_resolves_point_in_polygon(self, tmp_path):
+        """Points resolve to the containing tract, in geocoder result format."""
+        self.resolver.cache_dir = tmp_path
+        self.resolver.add_state('FL', *_grid_tracts())
+
+        result = self.resolver.resolve(28.45, -81.25, 'FL')
+        assert result['success'] and result['source'] == 'offline'
+        assert result['geoid'] == '12095120000'
+        assert (result['state_fips'], result['county_fips'], result['tract_fips']) == ('12', '095', '120000')
+
+        outside = self.resolver.resolve(27.0, -81.25, 'FL')
+        assert not outside['success'] and outside['geoid'] is None
+
+    def test_boundary_and_bulk_resolution(self, tmp_path):
+        """Shared boundaries pick the lowest GEOID, identically in bulk."""
+        self.resolver.cache_dir = tmp_path
+        self.resolver.add_state('FL', *_grid_tracts())
+
+        lats = [28.4, 28.45, 27.0]
+        lons = [-81.4, -81.25, -81.25]
+        assert self.resolver.resolve(28.4, -81.4, 'FL')['geoid'] == '12095000000'
+        assert self.resolver.resolve_many(lats, lons, 'FL') == ['12095000000', '12095120000', None]
+
+    def test_persisted_polygons_reload(self, tmp_path):
+        """Polygons written by one resolver are loaded by a fresh one."""
+        self.resolver.cache_dir = tmp_path
+        self.resolver.add_state('FL', *_grid_tracts())
+
+        fresh = OfflineTractResolver(cache_dir=str(tmp_path), allow_download=False)
+        assert fresh.resolve(28.55, -81.35, 'FL')['geoid'] == '12095210000'
+
+    def test_unavailable_state(self, tmp_path):
+        """Without persisted polygons (and no download) resolution fails cleanly."""
+        self.resolver.cache_dir = tmp_path
+        result = self.resolver.resolve(40.0, -76.0, 'PA')
+        assert not result['success']
+        assert 'unavailable' in result['error']
+
+    def test_contains(self, tmp_path):
+        """contains() checks one known tract; None when the GEOID is unknown."""
+        self.resolver.cache_dir = tmp_path
+        self.resolver.add_state('FL', *_grid_tracts())
+
+        assert self.resolver.contains('12095120000', 28.45, -81.25, 'FL') is True
+        assert self.resolver.contains('12095000000', 28.45, -81.25, 'FL') is False
+        assert self.resolver.contains('12095999999', 28.45, -81.25, 'FL') is None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests for stage timing and counter instrumentation.
+"""
+
+import json
+import pstats
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.instrumentation import Profiler, capture_cprofile
+
+
+class TestProfiler:
+    """Test suite for the stage profiler."""
+
+    def test_disabled_records_nothing(self):
+        """Timers and counters are no-ops until enabled."""
+        profiler = Profiler()
+
+        @profiler.timed('decorated')
+        def work():
+            return 42
+
+        with profiler.timer('stage'):
+            pass
+        profiler.count('cache.hit')
+
+        assert work() == 42
+        snapshot = profiler.snapshot()
+        assert snapshot['timers'] == {} and snapshot['counters'] == {}
+
+    def test_enabled_timers_counters_and_export(self, tmp_path):
+        """Enabled profiler aggregates per stage and exports JSON."""
+        profiler = Profiler(enabled=True)
+
+        @profiler.timed('model_inference')
+        def predict(x):
+            return x * 2
+
+        for i in range(3):
+            with profiler.timer('distance_computation'):
+                predict(i)
+        profiler.count('geocode_cache.hit', 2)
+        profiler.count('geocode_cache.miss')
+
+        exported = json.loads(profiler.export_json(tmp_path / 'profile.json').read_text())
+        assert exported['timers']['distance_computation']['calls'] == 3
+        assert exported['timers']['model_inference']['calls'] == 3
+        assert exported['counters'] == {'geocode_cache.hit': 2, 'geocode_cache.miss': 1}
+
+        profiler.reset()
+        assert profiler.snapshot()['timers'] == {}
+
+    def test_cprofile_capture(self, tmp_path):
+        """capture_cprofile() writes loadable pstats output."""
+        path = tmp_path / 'run.prof'
+        with capture_cprofile(str(path)):
+            sorted(range(1000), key=lambda x: -x)
+
+        assert pstats.Stats(str(path)).total_calls > 0
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the hypothetical-competitor scenario engine.
+
+Uses synthetic stores and a stand-in predictor; graph-maintained competition
+features are checked against a full site x dispensary recomputation.
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.prediction.feature_validator import FeatureValidator
+from src.prediction.scenario_engine import CompetitionScenarioEngine
+from src.feature_engineering.distance_kernel import pairwise_site_distances_miles
+from src.feature_engineering.site_context import aggregate_distance_blocks
+
+
+RADII = [1, 3, 5, 10, 20]
+
+
+class _StubPredictor:
+    """Deterministic stand-in for a v3 state model that records batch sizes."""
+
+    model_version = 'v3'
+    radii = RADII
+
+    def __init__(self):
+        self.batches = []
+
+    def predict_batch(self, features_df):
+        self.batches.append(len(features_df))
+        result = features_df.copy()
+        result['predicted_visits'] = 50000 - 800 * features_df['competitors_5mi'] - 50 * features_df['competition_weighted_20mi']
+        return result
+
+
+def _market(seed=2):
+    rng = np.random.default_rng(seed)
+    n = 60
+    sites = pd.DataFrame({
+        'latitude': 28.5 + rng.uniform(-0.4, 0.4, n),
+        'longitude': -81.3 + rng.uniform(-0.4, 0.4, n),
+        'sq_ft': 3500.0,
+        **{f'pop_{r}mi': rng.uniform(1, 5, n) * 10000 * r for r in RADII},
+        **{col: rng.uniform(1, 5000, n) for col in [
+            'total_population', 'median_age', 'median_household_income', 'per_capita_income',
+            'total_pop_25_plus', 'bachelors_degree', 'masters_degree', 'professional_degree',
+            'doctorate_degree', 'population_density', 'tract_area_sqm'
+        ]}
+    })
+    # Our stores are dispensaries too, plus other competitors
+    others = pd.DataFrame({
+        'latitude': 28.5 + rng.uniform(-0.5, 0.5, 40),
+        'longitude': -81.3 + rng.uniform(-0.5, 0.5, 40)
+    })
+    return sites, pd.concat([sites[['latitude', 'longitude']], others], ignore_index=True)
+
+
+def _reference_features(sites, dispensaries):
+    distances = pairwise_site_distances_miles(
+        sites['latitude'].to_numpy(), sites['longitude'].to_numpy(),
+        dispensaries['latitude'].to_numpy(), dispensaries['longitude'].to_numpy(),
+        radii=RADII + [0.1], refine_within=20
+    )
+    return aggregate_distance_blocks(
+        np.zeros((len(sites), 0)), np.zeros(0), distances, RADII, 0.1, 20
+    )
+
+
+class TestCompetitionScenarioEngine:
+    """Test suite for neighbor-graph scenario updates."""
+
+    def setup_method(self):
+        """Build an engine over the synthetic market."""
+        self.sites, self.dispensaries = _market()
+        self.predictor = _StubPredictor()
+        self.engine = CompetitionScenarioEngine(
+            'FL', self.sites, self.dispensaries,
+            predictor=self.predictor, validator=FeatureValidator(ranges_path='missing.json')
+        )
+
+    def _assert_matches(self, dispensaries):
+        expected = _reference_features(self.sites, dispensaries)
+        features = self.engine.competition_features()
+        for r in RADII:
+            assert np.array_equal(features[f'competitors_{r}mi'], expected[f'competitors_{r}mi'])
+        assert np.allclose(features['competition_weighted_20mi'], expected['competition_weighted_20mi'])
+
+    def test_insert_and_remove_match_full_recomputation(self):
+        """Graph updates equal recomputing every site against every store."""
+        self._assert_matches(self.dispensaries)
+
+        new_store = self.engine.add_store(28.52, -81.28)
+        self.engine.remove_store(70)  # An existing competitor closes
+        scenario = pd.concat([self.dispensaries.drop(index=70), pd.DataFrame({'latitude': [28.52], 'longitude': [-81.28]})])
+        self._assert_matches(scenario)
+
+        self.engine.remove_store(new_store)
+        self.engine.reset()
+        self._assert_matches(self.dispensaries)
+        assert len(self.engine.rescore()) == 0
+
+    def test_only_affected_sites_rescored(self):
+        """A distant competitor re-scores only its graph neighbors, in one batch."""
+        self.predictor.batches.clear()
+        result = self.engine.evaluate_new_competitor(28.5, -80.9)
+
+        assert self.predictor.batches == [len(result)]
+        assert 0 < len(result) < len(self.sites)
+        assert (result['delta_visits'] < 0).all()
+        assert np.array_equal(self.engine.scenario_visits, self.engine.baseline_visits)
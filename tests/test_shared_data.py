@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for publishing loader tables to worker processes.
+"""
+
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.data_loader import MultiStateDataLoader
+from src.feature_engineering.coordinate_calculator import CoordinateFeatureCalculator
+from src.feature_engineering.offline_tract_resolver import OfflineTractResolver
+
+
+SITE = (40.4, -80.0)
+
+
+def _calculator(loader, cache_dir):
+    """Calculator over a loader, with its caches in cache_dir (no network at setup)."""
+    return CoordinateFeatureCalculator(
+        loader, tract_resolver=OfflineTractResolver(cache_dir=str(cache_dir), allow_download=False),
+        cache_dir=str(cache_dir)
+    )
+
+
+def _worker_features(path):
+    """Runs in a spawned process: attach and compute distance features for SITE."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        calculator = _calculator(MultiStateDataLoader.from_shared(path), cache_dir)
+        return (
+            calculator.calculate_population_multi_radius('PA', *SITE),
+            calculator.calculate_competitors_multi_radius('PA', *SITE)
+        )
+
+
+class TestSharedDataPlane:
+    """Test suite for publish_shared() / from_shared()."""
+
+    @pytest.fixture(autouse=True)
+    def _loader(self, synthetic_loader):
+        """Create the publishing loader."""
+        self.loader = synthetic_loader(seed=7, n_tracts=150, n_dispensaries=20)
+
+    def test_attached_tables_match_and_map_files(self, tmp_path):
+        """Attached frames equal the originals; numeric columns are read-only file views."""
+        with self.loader.publish_shared(tmp_path / 'plane') as plane:
+            attached = MultiStateDataLoader.from_shared(plane.path)
+
+            for name in MultiStateDataLoader.SHARED_TABLES:
+                pd.testing.assert_frame_equal(
+                    getattr(attached, name), getattr(self.loader, name).reset_index(drop=True)
+                )
+
+            latitudes = attached.pa_census['latitude'].to_numpy()
+            assert not latitudes.flags.writeable
+            assert not latitudes.flags.owndata
+            assert attached.find_tract('PA', '42003000007') is not None
+
+        assert not any((tmp_path / 'plane').glob('*.npy'))
+
+    def test_spawned_workers_compute_same_features(self, tmp_path):
+        """Workers attached in separate processes reproduce the parent's features."""
+        calculator = _calculator(self.loader, tmp_path)
+        expected = (
+            calculator.calculate_population_multi_radius('PA', *SITE),
+            calculator.calculate_competitors_multi_radius('PA', *SITE)
+        )
+
+        with self.loader.publish_shared() as plane:
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+                results = list(pool.map(_worker_features, [str(plane.path)] * 2))
+
+        assert results == [expected, expected]
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-site distance context.
+
+Compares context-derived features against a straightforward per-row geodesic
+reference implementation on synthetic tracts and dispensaries.
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+from geopy.distance import geodesic
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.distance_kernel import pairwise_site_distances_miles
+from src.feature_engineering.site_context import (
+    SiteDistanceContext, aggregate_distance_blocks, cumulative_within, cumulative_within_blocks
+)
+from src.feature_engineering.spatial_index import SphericalIndex
+
+
+SITE_LAT, SITE_LON = 28.5685, -81.2163
+RADII = [1, 3, 5, 10, 20]
+
+
+def _synthetic_state(seed=11):
+    rng = np.random.default_rng(seed)
+    census_df = pd.DataFrame({
+        'latitude': SITE_LAT + rng.uniform(-0.4, 0.4, 800),
+        'longitude': SITE_LON + rng.uniform(-0.4, 0.4, 800),
+        'total_population': rng.integers(500, 8000, 800)
+    })
+    dispensaries_df = pd.DataFrame({
+        'latitude': np.append(SITE_LAT + rng.uniform(-0.3, 0.3, 80), SITE_LAT + 0.0005),
+        'longitude': np.append(SITE_LON + rng.uniform(-0.3, 0.3, 80), SITE_LON)
+    })
+    return dispensaries_df, census_df
+
+
+def _reference_features(dispensaries_df, census_df):
+    site = (SITE_LAT, SITE_LON)
+    tract_d = np.array([geodesic(site, (r.latitude, r.longitude)).miles for r in census_df.itertuples()])
+    disp_d = np.array([geodesic(site, (r.latitude, r.longitude)).miles for r in dispensaries_df.itertuples()])
+    disp_d = disp_d[disp_d > 0.1]
+
+    expected = {}
+    for radius in RADII:
+        pop = int(census_df['total_population'][tract_d <= radius].sum())
+        count = int((disp_d <= radius).sum())
+        expected[f'pop_{radius}mi'] = pop
+        expected[f'competitors_{radius}mi'] = count
+        expected[f'competitors_per_100k_{radius}mi'] = (count / pop) * 100000 if pop > 0 else 0.0
+    within = disp_d <= 20
+    expected['competition_weighted_20mi'] = sum(1 / (d + 0.01) for d in disp_d[within])
+    return expected
+
+
+class TestSiteDistanceContext:
+    """Test suite for context-derived distance features."""
+
+    def setup_method(self):
+        """Build a context and reference features for the synthetic state."""
+        dispensaries_df, census_df = _synthetic_state()
+        self.context = SiteDistanceContext.build(
+            'FL', SITE_LAT, SITE_LON, dispensaries_df, census_df, radii=RADII
+        )
+        self.expected = _reference_features(dispensaries_df, census_df)
+
+    def test_populations_match_reference(self):
+        """Population sums match per-row geodesic aggregation."""
+        for key, value in self.context.populations().items():
+            assert value == self.expected[key], key
+
+    def test_competitors_match_reference(self):
+        """Competitor counts and per-100k values match, with self excluded."""
+        for key, value in self.context.competitors().items():
+            assert np.isclose(value, self.expected[key]), key
+
+    def test_weighted_competition_matches_reference(self):
+        """Weighted competition matches the exact geodesic score."""
+        assert np.isclose(
+            self.context.competition_weighted(20),
+            self.expected['competition_weighted_20mi'],
+            rtol=1e-12
+        )
+
+    def test_indexed_context_matches_full_scan(self):
+        """Spatially indexed contexts produce the same features as full scans."""
+        dispensaries_df, census_df = _synthetic_state()
+        indexed = SiteDistanceContext.build(
+            'FL', SITE_LAT, SITE_LON, dispensaries_df, census_df, radii=RADII,
+            tract_index=SphericalIndex(census_df['latitude'], census_df['longitude']),
+            dispensary_index=SphericalIndex(dispensaries_df['latitude'], dispensaries_df['longitude'])
+        )
+
+        assert len(indexed.tract_positions) < len(census_df)
+        assert indexed.populations() == self.context.populations()
+        assert indexed.competitors() == self.context.competitors()
+        assert indexed.competition_weighted(20) == self.context.competition_weighted(20)
+
+    def test_compact_columns_match_float64_columns(self):
+        """Contexts over float32/int32 tables equal those built from the float64 values."""
+        dispensaries_df, census_df = _synthetic_state()
+        compact_census = census_df.astype({
+            'latitude': np.float32, 'longitude': np.float32, 'total_population': np.int32
+        })
+        compact_dispensaries = dispensaries_df.astype(np.float32)
+        compact = SiteDistanceContext.build(
+            'FL', SITE_LAT, SITE_LON, compact_dispensaries, compact_census, radii=RADII,
+            tract_index=SphericalIndex(compact_census['latitude'], compact_census['longitude'])
+        )
+        reference = SiteDistanceContext.build(
+            'FL', SITE_LAT, SITE_LON, compact_dispensaries.astype(np.float64),
+            compact_census.astype(np.float64), radii=RADII,
+            tract_index=SphericalIndex(compact_census['latitude'], compact_census['longitude'])
+        )
+
+        assert compact.tract_distances.dtype == np.float64
+        assert compact.populations() == reference.populations()
+        assert compact.competition_weighted(20) == reference.competition_weighted(20)
+
+
+class TestAggregateDistanceBlocks:
+    """Test suite for multi-site block aggregation."""
+
+    def test_blocks_match_single_site_contexts(self):
+        """Each block row equals the features of a single-site context."""
+        dispensaries_df, census_df = _synthetic_state()
+        site_lats = SITE_LAT + np.array([0.0, 0.05, -0.08])
+        site_lons = SITE_LON + np.array([0.0, -0.04, 0.06])
+
+        tract_block = pairwise_site_distances_miles(
+            site_lats, site_lons, census_df['latitude'], census_df['longitude'], radii=RADII
+        )
+        disp_block = pairwise_site_distances_miles(
+            site_lats, site_lons, dispensaries_df['latitude'], dispensaries_df['longitude'],
+            radii=RADII + [0.1], refine_within=20
+        )
+        block = aggregate_distance_blocks(
+            tract_block, census_df['total_population'], disp_block, RADII
+        )
+
+        for i, (lat, lon) in enumerate(zip(site_lats, site_lons)):
+            context = SiteDistanceContext.build('FL', lat, lon, dispensaries_df, census_df, radii=RADII)
+            expected = {**context.populations(), **context.competitors()}
+            expected['competition_weighted_20mi'] = context.competition_weighted(20)
+
+            for key, value in expected.items():
+                assert np.isclose(block[key][i], value), key
+
+
+class TestCumulativeWithin:
+    """Test suite for sorted-distance cumulative radius sums."""
+
+    LADDER = [7, 0.5] + list(range(1, 31))
+
+    def test_matches_per_radius_masks(self):
+        """Counts and weighted sums equal one boolean mask per radius."""
+        rng = np.random.default_rng(3)
+        distances = np.append(rng.uniform(0, 35, 400), [5.0, 5.0, np.nan])
+        weights = np.append(rng.uniform(0, 100, 402), 50.0)
+
+        for inclusive in (True, False):
+            counts = cumulative_within(distances, self.LADDER, inclusive=inclusive)
+            sums = cumulative_within(distances, self.LADDER, weights=weights, inclusive=inclusive)
+            for i, radius in enumerate(self.LADDER):
+                within = distances <= radius if inclusive else distances < radius
+                assert counts[i] == within.sum()
+                assert np.isclose(sums[i], weights[within].sum())
+
+    def test_blocks_match_single_rows(self):
+        """Block results equal cumulative_within() applied row by row."""
+        rng = np.random.default_rng(4)
+        distances = rng.uniform(0, 35, (6, 300))
+        distances[2, :10] = 10.0
+        weights = rng.uniform(0, 100, 300)
+
+        for inclusive in (True, False):
+            block = cumulative_within_blocks(distances, self.LADDER, weights=weights, inclusive=inclusive)
+            counts = cumulative_within_blocks(distances, self.LADDER, inclusive=inclusive)
+            for row in range(len(distances)):
+                assert np.allclose(
+                    block[row], cumulative_within(distances[row], self.LADDER, weights, inclusive)
+                )
+                assert np.array_equal(
+                    counts[row], cumulative_within(distances[row], self.LADDER, inclusive=inclusive)
+                )
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for answering geocoding queries from cached tract polygons.
+
+Uses a synthetic row of square "tracts" and an in-process transport
+instead of the Census Geocoding API.
+"""
+
+import math
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+shapely = pytest.importorskip('shapely')
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.census_tract_identifier import CensusTractIdentifier
+from src.feature_engineering.offline_tract_resolver import OfflineTractResolver
+
+
+def _tract(longitude):
+    """Tract i spans longitudes -(80 + (i+1)/100) .. -(80 + i/100)."""
+    return math.floor((-longitude - 80) * 100)
+
+
+def _resolver(tmp_path):
+    resolver = OfflineTractResolver(cache_dir=str(tmp_path), allow_download=False)
+    resolver.add_state(
+        'PA', [f'42003{i:06d}' for i in range(5)],
+        [shapely.box(-(80 + (i + 1) / 100), 39.9, -(80 + i / 100), 40.1) for i in range(5)],
+        persist=False
+    )
+    return resolver
+
+
+class TestSpatialGeocodeCache:
+    """Test suite for the spatial layer of CensusTractIdentifier's cache."""
+
+    @pytest.fixture(autouse=True)
+    def _transport(self, geocoder_transport):
+        """Geocode with the shared stand-in, using this file's tract boundaries."""
+        self.geocoder_transport = geocoder_transport
+
+    def _identifier(self, tmp_path, resolver):
+        geocoder = self.geocoder_transport(tract_of=_tract)
+        identifier = CensusTractIdentifier(
+            cache_dir=str(tmp_path), transport=geocoder, requests_per_second=1000, tract_polygons=resolver
+        )
+        return identifier, geocoder
+
+    def test_grid_scan_geocodes_each_tract_once(self, tmp_path):
+        """A 20x20 grid over five tracts makes one request per tract."""
+        identifier, geocoder = self._identifier(tmp_path, _resolver(tmp_path))
+
+        for lat in np.linspace(39.95, 40.05, 20):
+            for lon in np.linspace(-80.0499, -80.0001, 20):
+                result = identifier.get_tract_from_coordinates(lat, lon)
+                assert result['geoid'] == f'42003{_tract(lon):06d}'
+
+        assert geocoder.calls == 5
+
+    def test_boundary_points_and_unknown_tracts_reach_api(self, tmp_path):
+        """Only points strictly inside a cached polygon are answered locally."""
+        identifier, geocoder = self._identifier(tmp_path, _resolver(tmp_path))
+        identifier.get_tract_from_coordinates(40.0, -80.005)
+        identifier.get_tract_from_coordinates(40.0, -80.015)
+
+        identifier.get_tract_from_coordinates(40.01, -80.01)   # shared edge of tracts 0 and 1
+        identifier.get_tract_from_coordinates(40.0, -80.065)   # tract 6: no polygon
+        identifier.get_tract_from_coordinates(40.0, -80.066)
+        assert geocoder.calls == 5
+
+    def test_seeded_from_persistent_cache(self, tmp_path):
+        """A new identifier answers nearby points from tracts resolved in an earlier run."""
+        first, _ = self._identifier(tmp_path, _resolver(tmp_path))
+        first.get_tract_from_coordinates(40.0, -80.025)
+
+        second, geocoder = self._identifier(tmp_path, _resolver(tmp_path))
+        assert second.get_tract_from_coordinates(40.00006, -80.02506)['geoid'] == '42003000002'
+        assert geocoder.calls == 0
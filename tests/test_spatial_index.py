@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the spherical spatial index.
+
+Checks radius and k-nearest queries against brute-force haversine scans.
+"""
+
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.distance_kernel import haversine_miles
+from src.feature_engineering.spatial_index import SphericalIndex
+
+
+SITE_LAT, SITE_LON = 40.2732, -76.8867  # Harrisburg, PA
+
+
+class TestSphericalIndex:
+    """Test suite for radius and nearest-neighbor queries."""
+
+    def setup_method(self):
+        """Build an index over random points, including one missing coordinate."""
+        rng = np.random.default_rng(3)
+        self.lats = SITE_LAT + rng.uniform(-1.0, 1.0, 3000)
+        self.lons = SITE_LON + rng.uniform(-1.0, 1.0, 3000)
+        self.lats[5] = np.nan
+        self.index = SphericalIndex(self.lats, self.lons)
+        self.distances = haversine_miles(SITE_LAT, SITE_LON, self.lats, self.lons)
+
+    def test_radius_query_matches_brute_force(self):
+        """Radius hits are exactly the points within the radius."""
+        for radius in [1, 5, 20, 45]:
+            hits = self.index.query_radius(SITE_LAT, SITE_LON, radius)
+            expected = np.flatnonzero(self.distances <= radius)
+            assert np.array_equal(hits, expected)
+
+    def test_missing_coordinates_excluded(self):
+        """Rows without coordinates keep their position but are never returned."""
+        assert len(self.index) == 3000
+        assert self.index.indexed_count == 2999
+        assert 5 not in self.index.query_radius(SITE_LAT, SITE_LON, 500)
+
+    def test_nearest_query(self):
+        """k-nearest results are ordered and match brute-force distances."""
+        dist, pos = self.index.query_nearest(SITE_LAT, SITE_LON, k=10)
+        expected = np.argsort(np.nan_to_num(self.distances, nan=np.inf))[:10]
+
+        assert np.array_equal(pos, expected)
+        assert np.allclose(dist, self.distances[expected], atol=1e-6)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the indexed census tract table.
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.feature_engineering.tract_table import TractTable
+from src.feature_engineering.data_loader import MultiStateDataLoader
+
+
+def _census_frame(n=5):
+    return pd.DataFrame({
+        'census_geoid': [f'12095{i:06d}' for i in range(n)],
+        'state': 'FL',
+        'total_population': np.arange(1000, 1000 + n, dtype=np.int64),
+        'median_household_income': np.linspace(40000, 80000, n),
+        'latitude': 28.5 + np.arange(n) * 0.01,
+        'longitude': -81.2 - np.arange(n) * 0.01
+    }, index=np.arange(100, 100 + n))
+
+
+def _fetched_tract(geoid):
+    # Mirrors the mixed-type Series built for on-the-fly ACS fetches
+    return pd.Series({
+        'census_geoid': geoid, 'total_population': 2500, 'median_household_income': 61000.0,
+        'latitude': 28.7, 'longitude': -81.4, 'census_data_complete': True
+    })
+
+
+class TestTractTable:
+    """Test suite for GEOID lookups and buffered appends."""
+
+    def test_lookup_by_geoid(self):
+        """Tracts are found by GEOID; unknown GEOIDs return None."""
+        table = TractTable(_census_frame())
+        assert table.get('12095000003')['total_population'] == 1003
+        assert table.get('12095999999') is None
+
+    def test_appends_are_buffered_then_merged_with_stable_dtypes(self):
+        """Appended tracts are visible at once and merged with the frame's dtypes."""
+        table = TractTable(_census_frame())
+        version = table.version
+
+        assert table.append(_fetched_tract('12095000100'))
+        assert not table.append(_fetched_tract('12095000100'))
+        assert table.pending == 1 and len(table) == 6
+        assert table.get('12095000100')['total_population'] == 2500
+        assert table.version == version
+
+        frame = table.frame
+        assert table.pending == 0 and table.version != version
+        assert len(frame) == 6 and list(frame.index) == list(range(6))
+        assert frame['total_population'].dtype == np.int64
+        assert frame['latitude'].dtype == np.float64
+        assert table.get('12095000100')['latitude'] == 28.7
+
+    def test_merge_threshold(self):
+        """The buffer merges eagerly once it reaches merge_threshold."""
+        table = TractTable(_census_frame(), merge_threshold=3)
+        for i in range(3):
+            table.append(_fetched_tract(f'12095001{i:03d}'))
+        assert table.pending == 0
+        assert len(table._frame) == 8
+
+
+class TestLoaderTractAppends:
+    """Test suite for appending fetched tracts through the data loader."""
+
+    def test_append_tract_refreshes_spatial_index(self):
+        """A fetched tract is found by GEOID and included in the rebuilt index."""
+        dispensaries = pd.DataFrame({'latitude': [28.5], 'longitude': [-81.2]})
+        loader = MultiStateDataLoader.from_tables({
+            'fl_census': _census_frame(), 'pa_census': _census_frame(0),
+            'fl_dispensaries': dispensaries, 'pa_dispensaries': dispensaries.iloc[:0]
+        })
+
+        _, before = loader.get_state_indexes('FL')
+        assert loader.append_tract('FL', _fetched_tract('12095000100'))
+        assert loader.find_tract('FL', '12095000100')['state'] == 'FL'
+
+        _, after = loader.get_state_indexes('FL')
+        assert len(before) == 5 and len(after) == 6
+        assert 5 in after.query_radius(28.7, -81.4, 0.5)